@@ -1,6 +1,8 @@
-import random
 import numpy as np
 
+from abc_core import ABCOptimizer, RandomStep, ResetExhausted
+from telemetry import Telemetry, print_every
+
 # --- Thiết lập các tham số ---
 num_employed_bees = 50      # Số lượng ong thợ (Employed Bees)
 num_onlooker_bees = 50      # Số lượng ong quan sát/ong chờ (Onlooker Bees)
@@ -12,83 +14,31 @@ problem_size = 5           # Kích thước bài toán (số chiều của biế
 def fitness_function(x):
     return np.sum(x**2)     # Bài toán tối ưu hóa hàm cầu (Sphere function)
 
-# --- Khởi tạo quần thể ban đầu ---
-food_sources = np.random.rand(num_employed_bees, problem_size) * 100
-fitness_values = np.array([fitness_function(food) for food in food_sources])
-no_improvement_counters = np.zeros(num_employed_bees) # Bộ đếm số lần không cải thiện
-
-# --- Vòng lặp chính ---
-for iteration in range(max_iterations):
-    # --- Giai đoạn Ong thợ (Employed bees) ---
-    for i in range(num_employed_bees):
-        # Chọn ngẫu nhiên một chiều (biến) để thay đổi
-        dimension = random.randint(0, problem_size - 1)
-
-        # Tạo ra một giải pháp ứng viên mới (đột biến/biến thể)
-        mutant = np.copy(food_sources[i])
-        mutant[dimension] += (random.random() - 0.5) * 2  # Sửa đổi chiều được chọn một cách ngẫu nhiên
-
-        # Đánh giá độ thích nghi của giải pháp mới
-        mutant_fitness = fitness_function(mutant)
-
-        # Lựa chọn tham lam (Greedy selection) giữa giải pháp hiện tại và giải pháp mới
-        if mutant_fitness < fitness_values[i]:
-            food_sources[i] = mutant
-            fitness_values[i] = mutant_fitness
-            no_improvement_counters[i] = 0
-        else:
-            no_improvement_counters[i] += 1
-
-    # --- Tính toán xác suất dựa trên giá trị thích nghi ---
-    total_fitness = np.sum(fitness_values)
-    if total_fitness == 0:
-        probabilities = np.ones(num_employed_bees) / num_employed_bees
-    else:
-        # Công thức tính xác suất (nghịch đảo vì đây là bài toán tìm cực tiểu)
-        probabilities = (1.0 / (1.0 + fitness_values)) / np.sum(1.0 / (1.0 + fitness_values))
-
-    # --- Giai đoạn Ong quan sát (Onlooker bees) ---
-    for j in range(num_onlooker_bees):
-        # Chọn nguồn thức ăn dựa trên vòng quay roulette (xác suất)
-        selected_food_source = np.random.choice(num_employed_bees, p=probabilities)
-
-        # Chọn ngẫu nhiên một chiều để thay đổi
-        dimension = random.randint(0, problem_size - 1)
-
-        # Tạo ra một giải pháp ứng viên mới
-        mutant = np.copy(food_sources[selected_food_source])
-        mutant[dimension] += (random.random() - 0.5) * 2  # Sửa đổi chiều được chọn một cách ngẫu nhiên
-
-        # Đánh giá độ thích nghi của giải pháp mới
-        mutant_fitness = fitness_function(mutant)
-
-        # Lựa chọn tham lam giữa giải pháp được chọn và giải pháp mới
-        if mutant_fitness < fitness_values[selected_food_source]:
-            food_sources[selected_food_source] = mutant
-            fitness_values[selected_food_source] = mutant_fitness
-            no_improvement_counters[selected_food_source] = 0
-        else:
-            no_improvement_counters[selected_food_source] += 1
-
-    # --- Giai đoạn Ong trinh sát (Scout bees) ---
-    for k in range(num_employed_bees):
-        # Nếu một nguồn thức ăn không cải thiện quá số lần giới hạn (limit)
-        if no_improvement_counters[k] > limit:
-            # Thay thế bằng một nguồn thức ăn ngẫu nhiên mới
-            food_sources[k] = np.random.rand(problem_size) * 100
-            fitness_values[k] = fitness_function(food_sources[k])
-            no_improvement_counters[k] = 0
-
-    # Hiển thị giải pháp tốt nhất trong mỗi vòng lặp
-    best_fitness = np.min(fitness_values)
-    print(f"Vòng lặp {iteration}, Độ thích nghi tốt nhất: {best_fitness}")
-
-# --- Tìm giải pháp tốt nhất tổng thể ---
-overall_best_fitness = np.min(fitness_values)
-overall_best_index = np.argmin(fitness_values)
-overall_best_solution = food_sources[overall_best_index]
-
-print("--- Kết quả tối ưu hóa ---")
-print(f"Độ thích nghi tốt nhất: {overall_best_fitness}")
-
-print(f"Giải pháp tốt nhất: {overall_best_solution}")
+def run_abc(seed=None, num_employed_bees=num_employed_bees, num_onlooker_bees=num_onlooker_bees,
+            max_iterations=max_iterations, limit=limit, problem_size=problem_size, telemetry=None,
+            batch_function=None):
+    """
+    Chạy một lần thuật toán ABC.
+    seed: hạt giống (int hoặc numpy.random.SeedSequence) để kết quả lặp lại được.
+    telemetry: đối tượng Telemetry (bộ đếm, thời gian từng pha, listener thay cho print).
+    batch_function: hàm mục tiêu theo lô (tùy chọn), đánh giá cả pha trong một lần gọi.
+    Trả về (độ thích nghi tốt nhất, giải pháp tốt nhất, đường hội tụ, số lần gọi hàm mục tiêu).
+    """
+    # Khởi tạo trong [0, 100), đột biến x_ij + U(-1, 1) không giới hạn biên,
+    # ong trinh sát thay mọi nguồn thức ăn vượt quá limit
+    optimizer = ABCOptimizer(fitness_function, problem_size, (0, 100), SN=num_employed_bees,
+                             MCN=max_iterations, limit=limit, onlookers=num_onlooker_bees,
+                             neighbour=RandomStep(), scout=ResetExhausted(), clip=False,
+                             batch_function=batch_function, seed=seed, telemetry=telemetry)
+    best_solution, best_fitness, history = optimizer.optimize()
+    return best_fitness, best_solution, history, optimizer.telemetry.evaluations
+
+if __name__ == "__main__":
+    telemetry = Telemetry(history_capacity=max_iterations)
+    telemetry.add_listener(print_every(1, "Vòng lặp {cycle}, Độ thích nghi tốt nhất: {best}"))
+    overall_best_fitness, overall_best_solution, _, _ = run_abc(telemetry=telemetry)
+
+    print("--- Kết quả tối ưu hóa ---")
+    print(f"Độ thích nghi tốt nhất: {overall_best_fitness}")
+
+    print(f"Giải pháp tốt nhất: {overall_best_solution}")
@@ -1,20 +1,35 @@
 import numpy as np
 import math
-import random
+
+from abc_core import ABCOptimizer, AlwaysSearch, PartnerStep, ShiftedFitnessRoulette
+from telemetry import print_every
 
 # ==========================================
 # Part 1: SIM-MIMO System Environment
 # ==========================================
 class SIM_MIMO_System:
-    def __init__(self, Nt, Nr, N_sim_elements, Layers=1):
+    def __init__(self, Nt, Nr, N_sim_elements, Layers=1, seed=None, dtype=np.complex128,
+                 wavelength=1.0, element_spacing=0.5, layer_spacing=5.0, SNR_dB=20):
         """
         Initializes the MIMO system with Stacked Intelligent Metasurfaces.
         
+        The decision vector holds Layers * N_sim_elements phases, layer by layer
+        starting at the transmitter side. The cascaded channel is
+        H_eff = G Phi_L W Phi_(L-1) ... W Phi_1 H, where W is the fixed
+        Rayleigh-Sommerfeld propagation matrix between two adjacent layers.
+        
         Args:
             Nt (int): Number of Transmit Antennas
             Nr (int): Number of Receive Antennas
             N_sim_elements (int): Number of elements per SIM layer
             Layers (int): Number of stacked layers (default 1 for basic implementation)
+            seed (int): Seed of the channel realization (None for a fresh one)
+            dtype (np.dtype): Storage type of the channel matrices; complex64 halves
+                their memory traffic at single-precision accuracy of the capacity
+            wavelength (float): Carrier wavelength (lengths below are in wavelengths)
+            element_spacing (float): Spacing of the square element grid of a layer
+            layer_spacing (float): Distance between adjacent layers
+            SNR_dB (float): Transmit SNR in dB
         """
         self.Nt = Nt
         self.Nr = Nr
@@ -25,55 +40,418 @@ class SIM_MIMO_System:
         # H_base: Channel from Tx to SIM (Line of Sight or Scatter)
         # G_base: Channel from SIM to Rx
         # In a real scenario, this would be the cascaded channel matrix H
-        self.H_base = (np.random.randn(N_sim_elements, Nt) + 1j * np.random.randn(N_sim_elements, Nt)) / np.sqrt(2)
-        self.G_base = (np.random.randn(Nr, N_sim_elements) + 1j * np.random.randn(Nr, N_sim_elements)) / np.sqrt(2)
+        rng = np.random.default_rng(seed)
+        self.H_base = (rng.standard_normal((N_sim_elements, Nt)) + 1j * rng.standard_normal((N_sim_elements, Nt))) / np.sqrt(2)
+        self.G_base = (rng.standard_normal((Nr, N_sim_elements)) + 1j * rng.standard_normal((Nr, N_sim_elements))) / np.sqrt(2)
+        self.dtype = np.dtype(dtype)
+        self.H_base = self.H_base.astype(self.dtype, copy=False)
+        self.G_base = self.G_base.astype(self.dtype, copy=False)
+        self.D = Layers * N_sim_elements
+        
+        # Inter-layer propagation, computed once; W[l] maps layer l to layer l + 1.
+        # All gaps are equal, so the layers share one matrix.
+        if Layers > 1:
+            W = self.rayleigh_sommerfeld(N_sim_elements, wavelength * element_spacing,
+                                         wavelength * layer_spacing, wavelength).astype(self.dtype)
+            self.W = np.broadcast_to(W, (Layers - 1, N_sim_elements, N_sim_elements))
+        else:
+            self.W = np.empty((0, N_sim_elements, N_sim_elements), dtype=self.dtype)
         
-        self.SNR_dB = 20
+        # Scratch buffers reused by calculate_spectral_efficiency (not thread-safe)
+        self._phi = np.empty(N_sim_elements, dtype=self.dtype)
+        self._G_phi = np.empty((Nr, N_sim_elements), dtype=self.dtype)
+        self._identity = np.eye(Nr)
+        
+        self.set_snr(SNR_dB)
+
+    def set_snr(self, SNR_dB):
+        """Change the operating SNR, the channel realization is kept."""
+        self.SNR_dB = SNR_dB
         self.SNR_linear = 10**(self.SNR_dB / 10)
 
+    @staticmethod
+    def rayleigh_sommerfeld(N, element_spacing, layer_spacing, wavelength):
+        """
+        Propagation coefficients between two parallel layers of N elements.
+        
+        Elements sit on a square grid (ceil(sqrt(N)) per row). The coefficient from
+        element n' to element n at distance r is
+        w = (s^2 cos(chi) / r) * (1 / (2 pi r) - j / lambda) * e^(j 2 pi r / lambda),
+        with s the element spacing and cos(chi) = layer_spacing / r.
+        
+        Returns:
+            np.array: Complex (N, N) matrix, row n = receiving element
+        """
+        per_row = math.ceil(math.sqrt(N))
+        index = np.arange(N)
+        xy = element_spacing * np.stack((index % per_row, index // per_row), axis=1)
+        planar2 = np.sum((xy[:, None, :] - xy[None, :, :])**2, axis=2)
+        r = np.sqrt(planar2 + layer_spacing**2)
+        cos_chi = layer_spacing / r
+        return (element_spacing**2 * cos_chi / r) * (1 / (2 * np.pi * r) - 1j / wavelength) \
+            * np.exp(2j * np.pi * r / wavelength)
+
     def calculate_spectral_efficiency(self, phase_shifts):
         """
         Objective Function: Calculates Capacity based on phase shifts.
         
         Args:
-            phase_shifts (np.array): Vector of phase angles [0, 2pi]
+            phase_shifts (np.array): Vector of Layers * N phase angles [0, 2pi]
         
         Returns:
             float: Spectral Efficiency (Capacity) in bits/s/Hz
         """
+        if self.Layers > 1:
+            return self._capacity(self.cascade(phase_shifts))
+        
         # Construct the SIM Phase Matrix (Phi)
-        # Phi is a diagonal matrix where elements are e^(j * theta)
-        phi_elements = np.exp(1j * phase_shifts)
-        Phi = np.diag(phi_elements)
+        # Phi is a diagonal matrix where elements are e^(j * theta) = cos + j sin,
+        # written into a preallocated buffer instead of a fresh complex array
+        phi_elements = self._phi
+        np.cos(phase_shifts, out=phi_elements.real)
+        np.sin(phase_shifts, out=phi_elements.imag)
         
         # Effective Channel H_eff = G * Phi * H
-        # This models the signal passing through the SIM layer
-        H_eff = self.G_base @ Phi @ self.H_base
-        
+        # This models the signal passing through the SIM layer.
+        # Scaling the columns of G by phi is the same as G @ diag(phi) without the N x N matrix.
+        H_eff = np.multiply(self.G_base, phi_elements, out=self._G_phi) @ self.H_base
+        return self._capacity(H_eff)
+
+    def cascade(self, phase_shifts):
+        """Effective channel G Phi_L W ... W Phi_1 H (Nr x Nt) of a multi-layer SIM."""
+        phi = np.exp(1j * np.reshape(phase_shifts, (self.Layers, self.N_elements))).astype(self.dtype)
+        signal = phi[0][:, None] * self.H_base
+        for l in range(1, self.Layers):
+            signal = phi[l][:, None] * (self.W[l - 1] @ signal)
+        return self.G_base @ signal
+
+    def _capacity(self, H_eff):
         # MIMO Capacity Formula: C = log2(det(I + SNR/Nt * H_eff * H_eff^H))
         #  (Generalized from MIMO capacity formulas)
-        Identity = np.eye(self.Nr)
+        Identity = self._identity
         H_conjugate = H_eff.conj().T
         
-        # Determinant calculation for Capacity
         matrix_inner = Identity + (self.SNR_linear / self.Nt) * (H_eff @ H_conjugate)
         
-        # Use abs(det) to handle numerical noise, though det should be real positive for Hermitian
-        try:
-            capacity = np.real(np.log2(np.linalg.det(matrix_inner)))
-        except:
-            capacity = 0 # Handle singular matrices
-            
-        return capacity
+        # matrix_inner is Hermitian positive definite, so slogdet is always defined
+        # and avoids overflow of det for large arrays
+        _, logdet = np.linalg.slogdet(matrix_inner)
+        return float(logdet) / np.log(2)
+
+    def calculate_spectral_efficiency_batch(self, phase_batch, chunk_size=1024):
+        """
+        Vectorized objective: capacity of many phase configurations at once.
+        
+        Args:
+            phase_batch (np.array): Phase angles of shape (B, Layers * N_sim_elements)
+            chunk_size (int): Configurations processed per stacked product, bounds
+                the (chunk, Nr, N_sim_elements) temporary
+        
+        Returns:
+            np.array: Capacities of shape (B,) in bits/s/Hz
+        """
+        phase_batch = np.atleast_2d(phase_batch)
+        capacities = np.empty(phase_batch.shape[0])
+        Identity = np.eye(self.Nr)
+        scale = self.SNR_linear / self.Nt
+        
+        for start in range(0, phase_batch.shape[0], chunk_size):
+            phi = np.exp(1j * phase_batch[start:start + chunk_size]).astype(self.dtype, copy=False)
+            if self.Layers > 1:
+                # (B, N, Nt) signal pushed through the stack layer by layer
+                phi = phi.reshape(-1, self.Layers, self.N_elements)
+                signal = phi[:, 0, :, None] * self.H_base
+                for l in range(1, self.Layers):
+                    signal = phi[:, l, :, None] * (self.W[l - 1] @ signal)
+                H_eff = self.G_base @ signal
+            else:
+                # (B, Nr, N) * (B, 1, N) -> G @ diag(phi) for every configuration
+                H_eff = (self.G_base[None, :, :] * phi[:, None, :]) @ self.H_base
+            gram = H_eff @ H_eff.conj().transpose(0, 2, 1)
+            _, logdet = np.linalg.slogdet(Identity + scale * gram)
+            capacities[start:start + chunk_size] = logdet / np.log(2)
+        
+        return capacities
+
+def make_sim_objective(Nt, Nr, N_sim_elements, seed, Layers=1):
+    """
+    Builds the capacity objective for a seeded channel realization.
+    
+    Used as objective_factory so each pool worker generates its channel matrices
+    once at start-up instead of receiving them with every task.
+    """
+    return SIM_MIMO_System(Nt, Nr, N_sim_elements, Layers=Layers, seed=seed).calculate_spectral_efficiency
+
+class IncrementalCapacityEvaluator:
+    def __init__(self, system, refresh_interval=200):
+        """
+        Scores single-phase moves as a low-rank update of a cached capacity.
+
+        For element n of layer l the cascade factors as H_eff = A_l Phi_l C_l, with
+        C_l = W Phi_(l-1) ... Phi_1 H the signal arriving at layer l (N x Nt) and
+        A_l = G Phi_L W ... Phi_(l+1) W the path from layer l to the receiver
+        (Nr x N). Both are cached per food source and layer. Changing one phase
+        changes H_eff by d * g h^T with g = A_l[:, n], h = C_l[n, :] and
+        d = e^(j theta_new) - e^(j theta_old). The capacity matrix
+        A = I + (SNR/Nt) H_eff H_eff^H then moves by a rank-2 Hermitian term
+        U M U^H, so det(A') follows from the matrix determinant lemma and A^-1 from
+        the Woodbury identity, both in O(Nr^2) once u = H_eff h^* is known.
+        Scoring a move only touches layer l. An accepted move adds a rank-one
+        term to the caches of the other layers, one matrix-vector product
+        per layer. The caches depend on the SNR: after system.set_snr() they
+        are rebuilt on the next evaluate_move() or accept_move().
+
+        Args:
+            system (SIM_MIMO_System): Channel model providing G_base, H_base, W, SNR
+            refresh_interval (int): Accepted moves per food source before its cache
+                is recomputed from scratch to bound numerical drift
+        """
+        self.system = system
+        self.refresh_interval = refresh_interval
+        self.scale = system.SNR_linear / system.Nt
+        self.n_full = 0
+        self.n_incremental = 0
+        self._pending = None
+
+    def _sync_snr(self):
+        """Rebuild every cache if the system SNR changed since it was built."""
+        scale = self.system.SNR_linear / self.system.Nt
+        if scale != self.scale:
+            self.scale = scale
+            self._pending = None
+            for i in range(len(self.phases)):
+                self.replace(i, self.phases[i].copy())
+
+    def _phasor(self, phase):
+        """e^(j theta) of a phase (array); DiscretePhaseEvaluator uses a lookup table."""
+        return np.exp(1j * phase)
+
+    def _full_state(self, phase_shifts):
+        """Partial products, H_eff, A^-1 and log det for one phase configuration."""
+        system = self.system
+        L, N = system.Layers, system.N_elements
+        phasors = self._phasor(np.reshape(phase_shifts, (L, N)))
+        if L == 1:
+            right = system.H_base[None]
+            left = system.G_base[None]
+        else:
+            right = np.empty((L, N, system.Nt), dtype=complex)
+            left = np.empty((L, system.Nr, N), dtype=complex)
+            right[0] = system.H_base
+            for l in range(1, L):
+                right[l] = system.W[l - 1] @ (phasors[l - 1][:, None] * right[l - 1])
+            left[L - 1] = system.G_base
+            for l in range(L - 2, -1, -1):
+                left[l] = (left[l + 1] * phasors[l + 1]) @ system.W[l]
+        H_eff = (left[0] * phasors[0]) @ right[0]
+        A = np.eye(system.Nr) + self.scale * (H_eff @ H_eff.conj().T)
+        _, logdet = np.linalg.slogdet(A)
+        self.n_full += 1
+        return phasors, left, right, H_eff, np.linalg.inv(A), logdet
+
+    def reset(self, foods):
+        """Build the cache for every food source, returns their capacities."""
+        system = self.system
+        self.scale = system.SNR_linear / system.Nt
+        SN, L, N = foods.shape[0], system.Layers, system.N_elements
+        self.phases = foods.astype(float)
+        self.phasors = np.empty((SN, L, N), dtype=complex)
+        if L == 1:
+            # Single layer: the partial products are G and H for every source
+            self.left = np.broadcast_to(system.G_base, (SN, 1, system.Nr, N))
+            self.right = np.broadcast_to(system.H_base, (SN, 1, N, system.Nt))
+        else:
+            self.left = np.empty((SN, L, system.Nr, N), dtype=complex)
+            self.right = np.empty((SN, L, N, system.Nt), dtype=complex)
+        self.H_eff = np.empty((SN, system.Nr, system.Nt), dtype=complex)
+        self.A_inv = np.empty((SN, system.Nr, system.Nr), dtype=complex)
+        self.logdet = np.empty(SN)
+        self.moves_since_refresh = np.zeros(SN, dtype=int)
+        for i in range(SN):
+            self.replace(i, foods[i])
+        return self.logdet / np.log(2)
+
+    def replace(self, i, phase_shifts):
+        """Recompute the cache of food source i (scout reset or refresh)."""
+        self.phases[i] = phase_shifts
+        phasors, left, right, self.H_eff[i], self.A_inv[i], self.logdet[i] = self._full_state(phase_shifts)
+        self.phasors[i] = phasors
+        if self.system.Layers > 1:
+            self.left[i] = left
+            self.right[i] = right
+        self.moves_since_refresh[i] = 0
+        return self.logdet[i] / np.log(2)
+
+    def evaluate_move(self, i, j, new_phase):
+        """
+        Capacity of food source i with phase j (layer j // N, element j % N) set
+        to new_phase.
+
+        The intermediate terms are kept so that accept_move() can reuse them.
+        """
+        self._sync_snr()
+        l, n = divmod(j, self.system.N_elements)
+        g = self.left[i, l, :, n]
+        h = self.right[i, l, n, :]
+        d = self._phasor(new_phase) - self.phasors[i, l, n]
+
+        u = self.H_eff[i] @ h.conj()
+        U = np.stack((g, u), axis=1)
+        M = self.scale * np.array([[abs(d)**2 * np.vdot(h, h).real, d],
+                                   [np.conj(d), 0]])
+        A_inv_U = self.A_inv[i] @ U
+        S = np.eye(2) + M @ (U.conj().T @ A_inv_U)
+
+        # 2x2 determinant, real and positive up to rounding
+        det_S = S[0, 0] * S[1, 1] - S[0, 1] * S[1, 0]
+        logdet = self.logdet[i] + np.log(abs(det_S))
+
+        self.n_incremental += 1
+        self._pending = (i, j, new_phase, d, g, h, U, M, A_inv_U, S, logdet)
+        return logdet / np.log(2)
+
+    def accept_move(self, i, j, new_phase):
+        """Commit the move last scored by evaluate_move() into the cache of source i."""
+        self._sync_snr()
+        pending = self._pending
+        if pending is None or pending[:3] != (i, j, new_phase):
+            # Not the class's evaluate_move: a memo hit leaves no pending terms
+            IncrementalCapacityEvaluator.evaluate_move(self, i, j, new_phase)
+            pending = self._pending
+        _, _, _, d, g, h, U, M, A_inv_U, S, logdet = pending
+        self._pending = None
+
+        self.phases[i, j] = new_phase
+        self.moves_since_refresh[i] += 1
+        if self.moves_since_refresh[i] >= self.refresh_interval:
+            self.replace(i, self.phases[i])
+            return
+
+        l, n = divmod(j, self.system.N_elements)
+        self._propagate(i, l, n, d)
+        self.phasors[i, l, n] = self._phasor(new_phase)
+
+        self.H_eff[i] += d * np.outer(g, h)
+        # Woodbury: (A + U M U^H)^-1 = A^-1 - A^-1 U (I + M U^H A^-1 U)^-1 M U^H A^-1
+        A_inv = self.A_inv[i] - A_inv_U @ np.linalg.solve(S, M @ (U.conj().T @ self.A_inv[i]))
+        # Keep the inverse exactly Hermitian, otherwise rounding errors compound
+        self.A_inv[i] = 0.5 * (A_inv + A_inv.conj().T)
+        self.logdet[i] = logdet
+
+    def _propagate(self, i, l, n, d):
+        """Rank-one update of the partial products of the other layers of source i."""
+        W = self.system.W
+        phasors = self.phasors[i]
+        # Layers after l: delta C_(m) = w c^T, w pushed through Phi and W
+        c = d * self.right[i, l, n, :]
+        w = W[l][:, n] if l + 1 < self.system.Layers else None
+        for m in range(l + 1, self.system.Layers):
+            self.right[i, m] += np.outer(w, c)
+            if m + 1 < self.system.Layers:
+                w = W[m] @ (phasors[m] * w)
+        # Layers before l: delta A_(m) = a v^T, v pulled back through Phi and W
+        a = d * self.left[i, l, :, n]
+        v = W[l - 1][n, :] if l > 0 else None
+        for m in range(l - 1, -1, -1):
+            self.left[i, m] += np.outer(a, v)
+            if m > 0:
+                v = (v * phasors[m]) @ W[m - 1]
+
+class DiscretePhaseEvaluator(IncrementalCapacityEvaluator):
+    def __init__(self, system, bits, refresh_interval=200):
+        """
+        Capacity of b-bit phase configurations given as integer level indices.
+        
+        Level k stands for the phase 2 pi k / 2^b. The 2^b phasors are stored in a
+        lookup table. Each element also has a table of its 2^b possible
+        contributions phasor_k * g_n h_n^T to H_eff, so a configuration is scored
+        by table lookups and sums. Moves reuse the rank-2 update of
+        IncrementalCapacityEvaluator, with d taken from the phasor table, so no
+        exp/cos/sin is evaluated in the hot path. A move already scored on the
+        unchanged food source, keyed by (element, level), is answered from a memo
+        cache that is cleared when the source changes.
+        
+        Use with ArtificialBeeColony(..., levels=2**bits, move_evaluator=evaluator).
+        The contribution tables take N * 2^b * Nr * Nt complex numbers.
+        
+        Args:
+            system (SIM_MIMO_System): Single-layer channel model
+            bits (int): Phase-shifter resolution b
+            refresh_interval (int): Accepted moves per food source between full
+                recomputations of its cache
+        """
+        if system.Layers > 1:
+            raise ValueError("discrete phase tables are defined for single-layer SIM only")
+        super().__init__(system, refresh_interval)
+        self.bits = bits
+        self.levels = 2**bits
+        self.phasor_table = np.exp(2j * np.pi * np.arange(self.levels) / self.levels)
+        # contributions[n, k] = phasor_k * g_n h_n^T
+        outer = system.G_base.T[:, :, None] * system.H_base[:, None, :]
+        self.contributions = self.phasor_table[None, :, None, None] * outer[:, None, :, :]
+        self._elements = np.arange(system.N_elements)
+        self.memo_hits = 0
+
+    def _phasor(self, level):
+        return self.phasor_table[np.asarray(level, dtype=np.intp) % self.levels]
+
+    def phase_angles(self, levels):
+        """Phase angles in [0, 2pi) of level indices."""
+        return 2 * np.pi * (np.asarray(levels) % self.levels) / self.levels
+
+    def capacity(self, levels):
+        """
+        Objective on level indices: H_eff assembled from the contribution tables.
+        
+        Args:
+            levels (np.array): N integer (or integer-valued) level indices
+        
+        Returns:
+            float: Spectral Efficiency (Capacity) in bits/s/Hz
+        """
+        index = np.asarray(levels, dtype=np.intp) % self.levels
+        H_eff = self.contributions[self._elements, index].sum(axis=0)
+        return self.system._capacity(H_eff)
+
+    def reset(self, foods):
+        self.memo = [{} for _ in range(foods.shape[0])]
+        return super().reset(foods)
+
+    def replace(self, i, phase_shifts):
+        self.memo[i].clear()
+        return super().replace(i, phase_shifts)
+
+    def evaluate_move(self, i, j, new_phase):
+        self._sync_snr()
+        key = (j, int(new_phase) % self.levels)
+        value = self.memo[i].get(key)
+        if value is not None:
+            self.memo_hits += 1
+            return value
+        value = super().evaluate_move(i, j, new_phase)
+        self.memo[i][key] = value
+        return value
+
+    def accept_move(self, i, j, new_phase):
+        super().accept_move(i, j, new_phase)
+        self.memo[i].clear()
 
 # ==========================================
 # Part 2: Artificial Bee Colony (ABC) Algorithm
 # ==========================================
-class ArtificialBeeColony:
-    def __init__(self, objective_function, D, bounds, SN=20, MCN=100, limit=50):
+class ArtificialBeeColony(ABCOptimizer):
+    def __init__(self, objective_function, D, bounds, SN=20, MCN=100, limit=50,
+                 batch_function=None, synchronous=False, move_evaluator=None,
+                 seed=None, workers=None, objective_factory=None, factory_args=(),
+                 telemetry=None, checkpoint_path=None, checkpoint_every=None, stopping=None,
+                 dtype=np.float64, initial_foods=None, surrogate=None, levels=None):
         """
         ABC Algorithm Implementation[cite: 160, 341].
         
+        The maximizing configuration of abc_core.ABCOptimizer: Karaboga's
+        neighbour v_ij = x_ij + phi * (x_ij - x_kj), every bee searches, onlookers
+        pick sources with P(i) proportional to f_i - min(f) + 1e-6.
+        
         Args:
             objective_function (func): Function to maximize
             D (int): Dimension of the problem (Number of variables)
@@ -81,133 +459,52 @@ class ArtificialBeeColony:
             SN (int): Number of Food Sources (Population Size) [cite: 167]
             MCN (int): Maximum Cycle Number (Iterations) [cite: 169]
             limit (int): Trials before abandonment [cite: 188]
+            batch_function (func): Optional batch objective, maps an (n, D) array
+                to n values. Falls back to calling objective_function per row.
+            synchronous (bool): Build and evaluate all candidates of a phase at once
+            move_evaluator (IncrementalCapacityEvaluator): Optional evaluator that
+                scores one-coordinate moves incrementally (serial phases only)
+            seed (int): Seed for the numpy Generator driving every random draw
+            workers (int): Evaluate candidate batches on a process pool of this size.
+                Implies synchronous=True; results match synchronous=True for the same seed.
+            objective_factory (func): Optional top-level function that builds the
+                objective once inside every worker, e.g. make_sim_objective
+            factory_args (tuple): Arguments for objective_factory
+            telemetry (Telemetry): Counters, phase timers and event listeners.
+                A private instance keeping MCN cycles of history is used by default.
+            checkpoint_path (str): Where optimize() writes checkpoints (see checkpoint.py)
+            checkpoint_every (int): Cycles between checkpoints (None = never)
+            stopping (StoppingCriteria): Extra stopping conditions checked after every
+                cycle; the reason is stored in stop_reason
+            dtype (np.dtype): Storage type of the food sources (float64 or float32)
+            initial_foods (np.array): Known solutions, shape (k, D) or (D,), placed in
+                the first k food sources (warm start); the rest start at random
+            surrogate (SurrogateScreen): Optional model that filters neighbour
+                candidates before the true objective. Like the AEABC r <= Pd rule,
+                a screened-out candidate is skipped: it is neither evaluated nor
+                counted as a trial (telemetry.skipped). Sources still reach limit
+                through the audited candidates (min_true_rate > 0).
+            levels (int): Discrete mode with variables in {0, ..., levels - 1} (e.g. 2^b
+                phase indices, see DiscretePhaseEvaluator). Neighbour values are
+                rounded and wrapped around; bounds is replaced by (0, levels - 1).
+        
+        Serial phases evaluate a one-coordinate move by writing it into the food
+        source, calling the objective on that row and restoring the coordinate if
+        the move is rejected, so the objective must not keep or modify its argument.
         """
-        self.func = objective_function
-        self.D = D
-        self.lb, self.ub = bounds
-        self.SN = SN
-        self.MCN = MCN
-        self.limit = limit
-        
-        # Initialization
-        self.foods = np.random.uniform(self.lb, self.ub, (SN, D))
-        self.fitness = np.zeros(SN)
-        self.trial_counters = np.zeros(SN)
-        self.best_solution = None
-        self.best_fitness = -np.inf
-        self.fitness_history = []
+        super().__init__(objective_function, D, bounds, SN=SN, MCN=MCN, limit=limit,
+                         neighbour=PartnerStep(), gate=AlwaysSearch(),
+                         selection=ShiftedFitnessRoulette(), maximize=True, levels=levels,
+                         dtype=dtype, initial_foods=initial_foods, batch_function=batch_function,
+                         synchronous=bool(synchronous or workers), workers=workers,
+                         objective_factory=objective_factory, factory_args=factory_args,
+                         move_evaluator=move_evaluator, surrogate=surrogate, seed=seed,
+                         telemetry=telemetry, stopping=stopping, checkpoint_path=checkpoint_path,
+                         checkpoint_every=checkpoint_every)
 
     def calculate_fitness(self):
         """Evaluate all food sources."""
-        for i in range(self.SN):
-            val = self.func(self.foods[i])
-            self.fitness[i] = val
-            
-            # Update Global Best
-            if val > self.best_fitness:
-                self.best_fitness = val
-                self.best_solution = self.foods[i].copy()
-
-    def employed_bees_phase(self):
-        """
-        Employed bees search neighborhood: v_ij = x_ij + phi * (x_ij - x_kj) 
-        """
-        for i in range(self.SN):
-            # Select random partner k distinct from i
-            k = list(range(self.SN))
-            k.remove(i)
-            k = random.choice(k)
-            
-            # Select random parameter j
-            j = random.randint(0, self.D - 1)
-            
-            # Generate new candidate solution
-            phi = random.uniform(-1, 1)
-            new_solution = self.foods[i].copy()
-            new_solution[j] = self.foods[i][j] + phi * (self.foods[i][j] - self.foods[k][j])
-            
-            # Boundary control
-            new_solution[j] = np.clip(new_solution[j], self.lb, self.ub)
-            
-            # Greedy Selection [cite: 192]
-            new_fitness = self.func(new_solution)
-            
-            if new_fitness > self.fitness[i]:
-                self.foods[i] = new_solution
-                self.fitness[i] = new_fitness
-                self.trial_counters[i] = 0
-            else:
-                self.trial_counters[i] += 1
-
-    def onlooker_bees_phase(self):
-        """
-        Onlooker bees select sources based on probability (Roulette Wheel)[cite: 177, 349].
-        """
-        # Avoid division by zero/negative in probability calculation (for maximization)
-        # Shift fitness to be positive if necessary
-        fit_calc = self.fitness - np.min(self.fitness) + 1e-6 
-        probabilities = fit_calc / np.sum(fit_calc)
-        
-        for i in range(self.SN):
-            # Select food source i based on probability
-            selected_index = np.random.choice(range(self.SN), p=probabilities)
-            
-            # Perform search (same equation as employed bee)
-            k = list(range(self.SN))
-            k.remove(selected_index)
-            k = random.choice(k)
-            j = random.randint(0, self.D - 1)
-            phi = random.uniform(-1, 1)
-            
-            new_solution = self.foods[selected_index].copy()
-            new_solution[j] = self.foods[selected_index][j] + phi * (self.foods[selected_index][j] - self.foods[k][j])
-            new_solution[j] = np.clip(new_solution[j], self.lb, self.ub)
-            
-            new_fitness = self.func(new_solution)
-            
-            if new_fitness > self.fitness[selected_index]:
-                self.foods[selected_index] = new_solution
-                self.fitness[selected_index] = new_fitness
-                self.trial_counters[selected_index] = 0
-            else:
-                self.trial_counters[selected_index] += 1
-
-    def scout_bees_phase(self):
-        """
-        Reset food sources that have exceeded the trial limit[cite: 185, 330].
-        """
-        for i in range(self.SN):
-            if self.trial_counters[i] > self.limit:
-                # Re-initialize randomly [cite: 190]
-                self.foods[i] = np.random.uniform(self.lb, self.ub, self.D)
-                self.fitness[i] = self.func(self.foods[i])
-                self.trial_counters[i] = 0
-
-    def optimize(self):
-        """Main Optimization Loop"""
-        # Initial evaluation
-        self.calculate_fitness()
-        
-        print(f"Starting ABC Optimization for SIM-MIMO...")
-        print(f"Initial Best Capacity: {self.best_fitness:.4f} bits/s/Hz")
-        
-        for cycle in range(self.MCN):
-            self.employed_bees_phase()
-            self.onlooker_bees_phase()
-            self.scout_bees_phase()
-            
-            # Update global best
-            current_best = np.max(self.fitness)
-            if current_best > self.best_fitness:
-                self.best_fitness = current_best
-                self.best_solution = self.foods[np.argmax(self.fitness)].copy()
-            
-            self.fitness_history.append(self.best_fitness)
-            
-            if cycle % 10 == 0:
-                print(f"Iteration {cycle}/{self.MCN} - Best Capacity: {self.best_fitness:.4f} bits/s/Hz")
-                
-        return self.best_solution, self.best_fitness, self.fitness_history
+        self.initialize()
 
 # ==========================================
 # Part 3: Running the Simulation
@@ -235,9 +532,20 @@ if __name__ == "__main__":
         limit=20            # Abandonment limit
     )
     
+    # Progress output through the telemetry listener API
+    def announce_start(event, telemetry, best=None, **data):
+        if event == "start":
+            print(f"Starting ABC Optimization for SIM-MIMO...")
+            print(f"Initial Best Capacity: {best:.4f} bits/s/Hz")
+    
+    abc.telemetry.add_listener(announce_start)
+    abc.telemetry.add_listener(print_every(10, f"Iteration {{cycle}}/{abc.MCN} - Best Capacity: {{best:.4f}} bits/s/Hz"))
+    
     # 3. Execute Optimization
     best_phases, max_capacity, history = abc.optimize()
     
     print("\noptimization Complete.")
     print(f"Optimized Capacity: {max_capacity:.5f} bits/s/Hz")
     print("Optimized Phase Shifts (First 5):", best_phases[:5])
+    print("Stopped by:", abc.stop_reason)
+    print("Telemetry:", abc.telemetry.snapshot())
@@ -0,0 +1,898 @@
+import math
+from time import perf_counter
+
+import numpy as np
+
+from checkpoint import CheckpointWriter, decode_json, encode_json, load_checkpoint
+from selection import distinct_partner, distinct_partners, roulette_wheel
+from stopping import MAX_CYCLES
+from telemetry import Telemetry, timed_phases
+
+# ==========================================
+# Strategy-based ABC core shared by every colony engine of the repository
+# ==========================================
+# A variant is a choice of strategy objects. Every strategy that draws random
+# numbers takes the optimizer's numpy.random.Generator, so the draw order (and
+# therefore a seeded run) is fixed by the strategies, not by the backend.
+# Both paths draw each quantity for a whole phase at once (partners, gate
+# decisions, dimensions, steps). The serial path then moves bee by bee from the
+# current food sources, the synchronous path builds every candidate from the
+# sources at the start of the phase.
+
+
+# --- Neighbour generation: new value of coordinate j of source i ---
+# draw() fixes the dimensions j and steps phi of a whole phase, step() turns them
+# into values from the food sources as they are when the bee moves.
+class RandomStep:
+    needs_partner = False
+
+    def __init__(self, scale=1.0):
+        """v_ij = x_ij + phi * scale, phi ~ U(-1, 1) (the step of ABC.py)."""
+        self.scale = scale
+
+    def draw(self, n, D, rng):
+        return rng.integers(0, D, n), rng.uniform(-1, 1, n)
+
+    def step(self, foods, i, k, j, phi):
+        return foods[i, j] + phi * self.scale
+
+    def propose(self, foods, i, k, rng):
+        j = int(rng.integers(foods.shape[1]))
+        return j, self.step(foods, i, k, j, rng.uniform(-1, 1))
+
+
+class PartnerStep:
+    needs_partner = True
+
+    def draw(self, n, D, rng):
+        return rng.integers(0, D, n), rng.uniform(-1, 1, n)
+
+    def step(self, foods, i, k, j, phi):
+        """v_ij = x_ij + phi * (x_ij - x_kj), phi ~ U(-1, 1) (Karaboga's move)."""
+        x = foods[i, j]
+        return x + phi * (x - foods[k, j])
+
+    def propose(self, foods, i, k, rng):
+        j = int(rng.integers(foods.shape[1]))
+        return j, self.step(foods, i, k, j, rng.uniform(-1, 1))
+
+
+# --- Search gating: does bee i search this time? ---
+# A gate is told about every change of the food sources: reset() once they are
+# evaluated, moved() after foods[i, j] changed and replaced() after whole rows
+# were overwritten (scouts, migrants).
+class AlwaysSearch:
+    needs_partner = False
+    tracks_moves = False
+
+    def allows(self, foods, i, k, rng):
+        return True
+
+    def allows_batch(self, foods, indices, k, rng):
+        return np.ones(len(indices), dtype=bool)
+
+    def reset(self, foods):
+        pass
+
+    def moved(self, foods, i, j, old):
+        pass
+
+    def replaced(self, foods, rows):
+        pass
+
+
+class DistanceGate:
+    needs_partner = True
+    tracks_moves = True
+
+    def __init__(self, refresh_interval=1000):
+        """
+        AEABC: bee i searches only if r > Pd = exp(-1/d), d = ||x_i - x_k||.
+
+        The SN x SN matrix of squared distances between food sources is built
+        once. An accepted move changes a single coordinate j of source i, so
+        only row/column i change: d2[i, k] += (v - x_kj)^2 - (x_ij - x_kj)^2.
+        Pd is then read from the matrix in O(1) per bee.
+
+        reset() also takes R independent colonies as an (R, SN, D) array (see
+        multi_colony.py) and keeps one (SN, SN) block per colony. The other
+        methods then take the same foods, or its R * SN rows flat, with flat
+        source indices r * SN + i; partners are in the same colony.
+
+        Args:
+            refresh_interval (int): Accepted moves between full recomputations of
+                the matrix, bounds the accumulated rounding error
+        """
+        self.refresh_interval = refresh_interval
+        self.dist2 = None
+        self._moves_since_refresh = 0
+
+    def _colonies(self, foods):
+        """foods and the matrix as (R, SN, ...) blocks, R = 1 for a single colony."""
+        SN = self.dist2.shape[-1]
+        return foods.reshape(-1, SN, foods.shape[-1]), self.dist2.reshape(-1, SN, SN)
+
+    def allows(self, foods, i, k, rng):
+        distance = math.sqrt(self.dist2[i, k])
+        Pd = math.exp(-1.0 / distance) if distance > 0 else 0.0
+        return rng.random() > Pd
+
+    def allows_batch(self, foods, indices, k, rng):
+        SN = self.dist2.shape[-1]
+        distance = np.sqrt(self.dist2.reshape(-1, SN)[indices, k % SN])
+        with np.errstate(divide="ignore"):
+            Pd = np.where(distance > 0, np.exp(-1.0 / distance), 0.0)
+        return rng.random(len(indices)) > Pd
+
+    def reset(self, foods):
+        """Recompute all squared pairwise distances: |x|^2 + |y|^2 - 2 x.y"""
+        foods = foods.astype(np.float64, copy=False)
+        sq = np.einsum("...ij,...ij->...i", foods, foods)
+        d2 = sq[..., :, None] + sq[..., None, :] - 2.0 * (foods @ np.swapaxes(foods, -1, -2))
+        np.maximum(d2, 0.0, out=d2)
+        diagonal = np.arange(d2.shape[-1])
+        d2[..., diagonal, diagonal] = 0.0
+        self.dist2 = d2
+        self._moves_since_refresh = 0
+
+    def moved(self, foods, i, j, old):
+        """Row/column i after foods[i, j] changed from old (distances in float64)."""
+        colonies, blocks = self._colonies(foods)
+        r, i = divmod(i, blocks.shape[-1])
+        column = colonies[r, :, j].astype(np.float64)
+        delta = (column[i] - column)**2 - (old - column)**2
+        delta[i] = 0.0
+        dist2 = blocks[r]
+        row = np.maximum(dist2[i] + delta, 0.0)
+        dist2[i, :] = row
+        dist2[:, i] = row
+
+        self._moves_since_refresh += 1
+        if self._moves_since_refresh >= self.refresh_interval:
+            self.reset(foods if self.dist2.ndim == 2 else colonies)
+
+    def replaced(self, foods, rows):
+        colonies, blocks = self._colonies(foods)
+        for i in rows:
+            r, i = divmod(i, blocks.shape[-1])
+            row = np.sum((colonies[r] - colonies[r, i])**2, axis=1, dtype=np.float64)
+            row[i] = 0.0
+            blocks[r, i, :] = row
+            blocks[r, :, i] = row
+
+    def state(self):
+        """The refresh count; the matrix itself is rebuilt from the foods by reset()."""
+        return {"moves_since_refresh": self._moves_since_refresh}
+
+    def restore(self, state):
+        """Continue from state(), after reset() on the restored foods."""
+        self._moves_since_refresh = int(state["moves_since_refresh"])
+
+
+# --- Onlooker selection ---
+# probabilities() and select() also take one row per colony, (R, SN) arrays;
+# select() then returns (R, size) indices within each colony.
+class InverseFitnessRoulette:
+    def probabilities(self, fitness, violation):
+        """P(i) proportional to 1 / (1 + f_i); uniform when every f_i is 0."""
+        uniform = np.sum(fitness, axis=-1, keepdims=True) == 0
+        if uniform.all():
+            return np.full(np.shape(fitness), 1.0 / np.shape(fitness)[-1])
+        inv_fitness = 1.0 / (1.0 + fitness)
+        p = inv_fitness / np.sum(inv_fitness, axis=-1, keepdims=True)
+        return np.where(uniform, 1.0 / np.shape(fitness)[-1], p) if uniform.any() else p
+
+    def select(self, fitness, violation, size, rng):
+        return roulette_wheel(self.probabilities(fitness, violation), size, rng)
+
+
+class ShiftedFitnessRoulette:
+    def probabilities(self, fitness, violation):
+        """
+        P(i) proportional to f_i - min(f) + 1e-6, for maximization with f of any sign.
+
+        Sources without a finite value (failed evaluations) get probability 0.
+        """
+        finite = np.isfinite(fitness)
+        usable = finite.any(axis=-1, keepdims=True)
+        if not usable.any():
+            return np.full(np.shape(fitness), 1.0 / np.shape(fitness)[-1])
+        low = np.min(np.where(finite, fitness, np.inf), axis=-1, keepdims=True)
+        with np.errstate(invalid="ignore"):
+            shifted = np.where(finite, fitness - low + 1e-6, 0.0)
+            p = shifted / np.sum(shifted, axis=-1, keepdims=True)
+        return p if usable.all() else np.where(usable, p, 1.0 / np.shape(fitness)[-1])
+
+    def select(self, fitness, violation, size, rng):
+        return roulette_wheel(self.probabilities(fitness, violation), size, rng)
+
+
+def fitness_weights(f):
+    """ABC fitness of minimized objective values: 1 / (1 + f), or 1 + |f| for f < 0."""
+    return np.where(f >= 0, 1.0 / (1.0 + np.abs(f)), 1.0 + np.abs(f))
+
+
+# --- Evaluation and acceptance of a candidate against its food source ---
+# A source is scored by (fitness, violation). Unconstrained problems always have
+# violation 0; constraints.FeasibilityRules fills it in and may stop evaluating a
+# candidate once it cannot beat its incumbent.
+class GreedyAcceptance:
+    def __init__(self, maximize=False):
+        self.maximize = maximize
+
+    def update(self, optimizer):
+        """Called at the start of every cycle (no state to update here)."""
+
+    def evaluate(self, func, x, incumbent=None):
+        """Score of x; incumbent is the (fitness, violation) it competes with, None for a full score."""
+        return func(x), 0.0
+
+    def evaluate_batch(self, func_batch, X, incumbents=None):
+        return np.asarray(func_batch(X), dtype=float), np.zeros(len(X))
+
+    def feasible(self, violation):
+        """Without constraints every source is feasible."""
+        return np.ones(np.shape(violation), dtype=bool)
+
+    def improves(self, fitness, violation, incumbent_fitness, incumbent_violation):
+        """Strictly better objective value wins (works elementwise on arrays)."""
+        if self.maximize:
+            return fitness > incumbent_fitness
+        return fitness < incumbent_fitness
+
+    def order(self, fitness, violation):
+        """Indices from best to worst (used to pick one candidate per source), row by row for 2-D arrays."""
+        return np.argsort(-fitness if self.maximize else fitness, kind="stable")
+
+
+def best_candidates(sources, order):
+    """
+    Several bees may target one source (onlookers): only its best candidate competes.
+
+    Args:
+        sources (np.array): Source index of every candidate
+        order (np.array): Candidate indices from best to worst
+
+    Returns:
+        tuple: (distinct targeted sources, index of the best candidate of each)
+    """
+    targets, first = np.unique(sources[order], return_index=True)
+    return targets, order[first]
+
+
+# --- Scouts: which exhausted sources are redrawn ---
+# trials may also hold one row per colony with limit of shape (R, 1); the
+# returned indices are then flat, r * SN + i.
+class ResetExhausted:
+    def exhausted(self, trials, limit):
+        """Every source whose trial counter exceeds limit (ABC.py, AEABC.py)."""
+        return np.flatnonzero(trials > limit)
+
+
+class ResetMostExhausted:
+    def exhausted(self, trials, limit):
+        """At most one source per cycle, the one with the most trials (welded-beam demo)."""
+        trials = np.atleast_2d(trials)
+        worst = np.argmax(trials, axis=1)
+        rows = np.flatnonzero(trials[np.arange(len(trials)), worst] > np.reshape(limit, -1))
+        return rows * trials.shape[1] + worst[rows]
+
+
+class ABCOptimizer:
+    def __init__(self, objective_function, D, bounds, SN=50, MCN=100, limit=50, onlookers=None,
+                 neighbour=None, gate=None, selection=None, acceptance=None, scout=None, clip=True,
+                 maximize=False, levels=None, dtype=np.float64, initial_foods=None,
+                 batch_function=None, synchronous=None, workers=None, objective_factory=None,
+                 factory_args=(), move_evaluator=None, surrogate=None, seed=None, telemetry=None,
+                 stopping=None, checkpoint_path=None, checkpoint_every=None):
+        """
+        One ABC loop with pluggable strategies.
+
+        ABC is RandomStep or PartnerStep with AlwaysSearch; AEABC is PartnerStep
+        with DistanceGate. Selection, acceptance and scout policy are chosen the
+        same way. Nothing runs at construction except drawing the initial food
+        sources, so importing a variant costs nothing.
+
+        Both paths draw partners, gate decisions, dimensions and steps for a
+        whole phase with array operations. The serial path then applies them
+        bee by bee: it evaluates each candidate in place (the coordinate is
+        restored afterwards) and applies greedy selection at once. The
+        synchronous path evaluates all candidates of the phase in one call (process pool, batch_function,
+        or objective_function row by row); when several onlookers hit one
+        source only its best candidate competes.
+
+        Args:
+            objective_function (func): Objective on one solution
+            D (int): Dimension of the problem
+            bounds (tuple): (lower_bound, upper_bound), scalars or arrays of length D
+            SN (int): Number of food sources (= employed bees)
+            MCN (int): Maximum Cycle Number
+            limit (int): Trials before abandonment
+            onlookers (int): Onlooker bees per cycle (None = SN)
+            neighbour: RandomStep() or PartnerStep() (default PartnerStep)
+            gate: AlwaysSearch() or DistanceGate() (default AlwaysSearch)
+            selection: Onlooker selection (default InverseFitnessRoulette, or
+                ShiftedFitnessRoulette when maximizing)
+            acceptance: Candidate evaluation and acceptance (default GreedyAcceptance,
+                constraints.FeasibilityRules for Deb / epsilon-constraint ordering)
+            scout: ResetExhausted() or ResetMostExhausted() (default ResetExhausted)
+            clip (bool): Clip candidates to the bounds (the bounds always apply to
+                initial and scout sources)
+            maximize (bool): Maximize the objective instead of minimizing it
+            levels (int): Discrete mode with variables in {0, ..., levels - 1} (e.g. 2^b
+                phase indices). Neighbour values are rounded and wrapped around;
+                bounds is replaced by (0, levels - 1).
+            dtype (np.dtype): Storage type of the food sources (float64 or float32)
+            initial_foods (np.array): Known solutions, shape (k, D) or (D,), placed in
+                the first k food sources (warm start); the rest start at random
+            batch_function (func): Optional objective on an (n, D) array
+            synchronous (bool): Use the synchronous path (None = when batch_function
+                is given)
+            workers (int): Evaluate on a process pool of this size over shared
+                memory. Implies synchronous; results match synchronous=True for the same seed.
+            objective_factory (func): Optional top-level function that builds the
+                objective once inside every worker
+            factory_args (tuple): Arguments for objective_factory
+            move_evaluator: Optional evaluator scoring one-coordinate moves
+                incrementally (reset/evaluate_move/accept_move/replace, e.g.
+                IncrementalCapacityEvaluator); serial path only
+            surrogate (SurrogateScreen): Optional model that filters candidates
+                before the true objective. Like the AEABC r <= Pd rule, a
+                screened-out candidate is skipped: it is neither evaluated nor
+                counted as a trial (telemetry.skipped).
+            seed (int): Seed for numpy.random.default_rng
+            telemetry (Telemetry): Counters, phase timers and listeners
+            stopping (StoppingCriteria): Extra stopping rules checked after every cycle
+            checkpoint_path (str): Where optimize() writes checkpoints (see checkpoint.py)
+            checkpoint_every (int): Cycles between checkpoints (None = never)
+
+        Serial phases write the move into the food source, evaluate that row and
+        restore the coordinate, so the objective must not keep or modify its argument.
+        """
+        if synchronous is None:
+            synchronous = batch_function is not None
+        if workers:
+            synchronous = True
+        acceptance = acceptance if acceptance is not None else GreedyAcceptance(maximize)
+        if synchronous and move_evaluator is not None:
+            raise ValueError("move_evaluator is only supported by the serial phases")
+        if surrogate is not None and move_evaluator is not None:
+            raise ValueError("surrogate screening is pointless with incremental move evaluation")
+        if (surrogate is not None or move_evaluator is not None) and not isinstance(acceptance, GreedyAcceptance):
+            raise ValueError("surrogate and move_evaluator score the plain objective, use GreedyAcceptance")
+
+        self.func = objective_function
+        self.func_batch = batch_function
+        self.D = D
+        self.levels = levels
+        if levels is not None:
+            bounds = (0, levels - 1)
+        self.lb = np.broadcast_to(np.asarray(bounds[0], dtype=float), (D,))
+        self.ub = np.broadcast_to(np.asarray(bounds[1], dtype=float), (D,))
+        self.SN = SN
+        self.MCN = MCN
+        self.limit = limit
+        self.onlookers = SN if onlookers is None else onlookers
+        self.maximize = maximize
+        self.neighbour = neighbour if neighbour is not None else PartnerStep()
+        self.gate = gate if gate is not None else AlwaysSearch()
+        self.selection = selection if selection is not None else (
+            ShiftedFitnessRoulette() if maximize else InverseFitnessRoulette())
+        self.acceptance = acceptance
+        self.scout = scout if scout is not None else ResetExhausted()
+        self.clip = clip
+        self.synchronous = synchronous
+        self.workers = workers
+        self.objective_factory = objective_factory
+        self.factory_args = factory_args
+        self.pool_evaluator = None
+        self.move_evaluator = move_evaluator
+        self.surrogate = surrogate
+        # The surrogate ranks "larger is better" values
+        self._sign = 1.0 if maximize else -1.0
+        self.stopping = stopping
+        self.stop_reason = None
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self._checkpoint = None
+        self._resumed = False
+        self._needs_partner = self.neighbour.needs_partner or self.gate.needs_partner
+
+        self.rng = np.random.default_rng(seed)
+        self.telemetry = telemetry if telemetry is not None else Telemetry(history_capacity=MCN)
+
+        self.dtype = np.dtype(dtype)
+        self.foods = self._random_sources(SN).astype(self.dtype, copy=False)
+        if initial_foods is not None:
+            initial = np.atleast_2d(initial_foods)[:SN]
+            self.foods[:len(initial)] = initial
+        # Candidate buffer of the synchronous phases, reused every phase
+        self._candidates = np.empty((max(SN, self.onlookers), D), dtype=self.dtype)
+        self.fitness = np.zeros(SN)
+        self.violation = np.zeros(SN)
+        self.trial_counters = np.zeros(SN)
+        self.cycle = 0
+        self.best_solution = None
+        self.best_fitness = -np.inf if maximize else np.inf
+        self.best_violation = np.inf
+
+    @property
+    def fitness_history(self):
+        """Best value after every cycle (from the telemetry ring buffer)."""
+        return self.telemetry.history.to_array()
+
+    def _random_sources(self, n):
+        """n random food sources (uniform, or uniform levels in discrete mode)."""
+        if self.levels is not None:
+            return self.rng.integers(0, self.levels, (n, self.D)).astype(float)
+        return self.lb + self.rng.random((n, self.D)) * (self.ub - self.lb)
+
+    def _redraw_source(self, i):
+        """Scout: draw food source i again in place, in the storage type."""
+        row = self.foods[i]
+        if self.levels is not None:
+            row[:] = self.rng.integers(0, self.levels, self.D)
+            return
+        self.rng.random(out=row, dtype=self.dtype)
+        row *= (self.ub - self.lb).astype(self.dtype)
+        row += self.lb.astype(self.dtype)
+
+    def _bound(self, values, j):
+        """Boundary control of coordinates j: clip, or round and wrap to a level in discrete mode."""
+        if self.levels is not None:
+            return np.mod(np.rint(values), self.levels)
+        if self.clip:
+            return np.clip(values, self.lb[j], self.ub[j])
+        return values
+
+    def _bound_value(self, value, j):
+        """Scalar _bound() in the storage type, for moves applied one at a time."""
+        if self.levels is not None:
+            value = np.mod(np.rint(value), self.levels)
+        elif self.clip:
+            value = max(self.lb[j], min(self.ub[j], value))
+        return self.dtype.type(value)
+
+    # --- Evaluation ---
+    def evaluate(self, x, incumbent=None):
+        """(fitness, violation) of x, scored against incumbent = (fitness, violation) when given."""
+        start = perf_counter()
+        result = self.acceptance.evaluate(self.func, x, incumbent)
+        self.telemetry.record_evaluations(1, perf_counter() - start)
+        if self.surrogate is not None:
+            self.surrogate.add(x, self._sign * result[0])
+        return result
+
+    def _objective_batch(self, X):
+        """Objective values of the rows of X: process pool, batch_function or row by row."""
+        pool = self.pool_evaluator
+        if pool is not None:
+            for name in ("foods", "candidates"):
+                shared = pool.arrays[name]
+                if X.ctypes.data == shared.ctypes.data and X.strides == shared.strides:
+                    # Rows already in shared memory are read in place by the workers
+                    return pool.evaluate_rows(name, len(X)).copy()
+            # Anything else (scouts, the subsets FeasibilityRules evaluates) goes through
+            # its own buffer, so the candidates the caller still holds are never overwritten
+            return pool.evaluate(X, name="scratch")
+        if self.func_batch is not None:
+            return np.asarray(self.func_batch(X), dtype=float)
+        return np.array([self.func(x) for x in X], dtype=float)
+
+    def evaluate_batch(self, X, incumbents=None):
+        """(fitness, violation) arrays of the rows of X; incumbents is a pair of arrays."""
+        start = perf_counter()
+        if self.synchronous:
+            fitness, violation = self.acceptance.evaluate_batch(self._objective_batch, X, incumbents)
+        else:
+            scores = [self.acceptance.evaluate(self.func, x, None if incumbents is None else
+                                               (incumbents[0][n], incumbents[1][n]))
+                      for n, x in enumerate(X)]
+            fitness = np.array([score[0] for score in scores], dtype=float)
+            violation = np.array([score[1] for score in scores], dtype=float)
+        self.telemetry.record_evaluations(len(X), perf_counter() - start)
+        if self.surrogate is not None:
+            self.surrogate.add(X, self._sign * fitness)
+        return fitness, violation
+
+    def _start_pool(self):
+        """Move the population into shared memory and start the worker pool."""
+        from parallel_evaluation import SharedMemoryPoolEvaluator
+        self.pool_evaluator = SharedMemoryPoolEvaluator(
+            self.func, {"foods": (self.SN, self.D), "candidates": self._candidates.shape,
+                        "scratch": self._candidates.shape},
+            workers=self.workers, objective_factory=self.objective_factory,
+            factory_args=self.factory_args, dtype=self.dtype)
+        shared_foods = self.pool_evaluator.arrays["foods"]
+        shared_foods[:] = self.foods
+        self.foods = shared_foods
+        # Candidates are built directly in shared memory
+        self._candidates = self.pool_evaluator.arrays["candidates"]
+
+    def _stop_pool(self):
+        self.foods = self.foods.copy()
+        self._candidates = self._candidates.copy()
+        self.pool_evaluator.close()
+        self.pool_evaluator = None
+
+    # --- Changes of the food sources ---
+    def _mark_changed(self, rows):
+        """Tell the checkpoint writer which food sources changed since the last write."""
+        if self._checkpoint is not None:
+            self._checkpoint.mark(rows)
+
+    def _set_coordinate(self, i, j, value):
+        """Commit an accepted move foods[i, j] = value and keep every cache in sync."""
+        old = self.foods[i, j]
+        if self.move_evaluator is not None:
+            self.move_evaluator.accept_move(i, j, value)
+        self.foods[i, j] = value
+        self.gate.moved(self.foods, i, j, old)
+        self._mark_changed(i)
+
+    def replace_source(self, i, x, value, violation=0.0):
+        """Overwrite food source i with an already evaluated solution (e.g. a migrant)."""
+        self.foods[i] = x
+        self.fitness[i] = value
+        self.violation[i] = violation
+        self.trial_counters[i] = 0
+        self.gate.replaced(self.foods, [i])
+        self._mark_changed(i)
+        if self.move_evaluator is not None:
+            self.move_evaluator.replace(i, self.foods[i])
+        if self.best_solution is None or self.acceptance.improves(value, violation, self.best_fitness,
+                                                                  self.best_violation):
+            self.best_fitness = value
+            self.best_violation = violation
+            self.best_solution = np.array(x, copy=True)
+
+    # --- Moves ---
+    def _draw_moves(self, indices):
+        """
+        Partners, gate decisions, dimensions and steps for every bee of a phase.
+
+        Returns:
+            tuple: (searching bees, their partners or None, dimensions j, steps phi)
+        """
+        k = distinct_partners(indices, self.SN, self.rng) if self._needs_partner else None
+        search = self.gate.allows_batch(self.foods, indices, k, self.rng)
+        searching = int(np.count_nonzero(search))
+        if searching < len(indices):
+            self.telemetry.skipped += len(indices) - searching
+            indices = indices[search]
+            k = k[search] if k is not None else None
+        j, phi = self.neighbour.draw(searching, self.D, self.rng)
+        return indices, k, j, phi
+
+    def _draw_move(self, i):
+        """Draws for a single bee i (steady-state drivers); None when the gate says skip."""
+        k = distinct_partner(i, self.SN, self.rng) if self._needs_partner else None
+        if not self.gate.allows(self.foods, i, k, self.rng):
+            self.telemetry.skipped += 1
+            return None
+        j, value = self.neighbour.propose(self.foods, i, k, self.rng)
+        return j, self._bound_value(value, j)
+
+    # --- Serial path ---
+    def _evaluate_move(self, i, j, value):
+        """(fitness, violation) of source i with coordinate j set to value; None when screened out."""
+        if self.move_evaluator is not None:
+            start = perf_counter()
+            score = self.move_evaluator.evaluate_move(i, j, value)
+            self.telemetry.record_evaluations(1, perf_counter() - start)
+            return score, 0.0
+        # Evaluate the move in place and restore the coordinate afterwards
+        row = self.foods[i]
+        x = row[j]
+        incumbent = row.copy() if self.surrogate is not None else None
+        row[j] = value
+        try:
+            if incumbent is None:
+                return self.evaluate(row, (self.fitness[i], self.violation[i]))
+            if not self.surrogate.screen(row[None], incumbent[None])[0]:
+                self.telemetry.skipped += 1
+                return None
+            score, violation = self.evaluate(row, (self.fitness[i], self.violation[i]))
+            self.surrogate.report([self._sign * score], [self._sign * self.fitness[i]])
+            return score, violation
+        finally:
+            row[j] = x
+
+    def _accept(self, i, j, value, score, violation):
+        if self.acceptance.improves(score, violation, self.fitness[i], self.violation[i]):
+            self._set_coordinate(i, j, value)
+            self.fitness[i] = score
+            self.violation[i] = violation
+            self.trial_counters[i] = 0
+            self.telemetry.accepted += 1
+        else:
+            self.trial_counters[i] += 1
+
+    def _search(self, indices):
+        """One employed/onlooker pass over the bees in indices."""
+        i, k, j, phi = self._draw_moves(np.asarray(indices))
+        if self.synchronous:
+            self._search_batch(i, k, j, phi)
+            return
+        partners = k.tolist() if k is not None else [None] * len(i)
+        for src, partner, dim, step in zip(i.tolist(), partners, j.tolist(), phi.tolist()):
+            # Earlier bees of this pass may have moved x_ij or x_kj
+            value = self._bound_value(self.neighbour.step(self.foods, src, partner, dim, step), dim)
+            result = self._evaluate_move(src, dim, value)
+            if result is None:
+                # Screened out by the surrogate: no evaluation, no trial
+                continue
+            self._accept(src, dim, value, *result)
+
+    # --- Synchronous path ---
+    def _evaluate_candidates(self, i, candidates):
+        """
+        Scores of the candidates; with a surrogate only the promising ones are evaluated.
+
+        Returns:
+            tuple: (fitness, violation, mask of evaluated candidates or None)
+        """
+        incumbents = (self.fitness[i], self.violation[i])
+        if self.surrogate is None:
+            return (*self.evaluate_batch(candidates, incumbents), None)
+        evaluate = self.surrogate.screen(candidates, self.foods[i])
+        fitness = np.full(len(candidates), -self._sign * np.inf)
+        violation = np.full(len(candidates), np.inf)
+        m = int(np.count_nonzero(evaluate))
+        self.telemetry.skipped += len(candidates) - m
+        if m:
+            # Move the survivors to the front of the buffer (workers read the shared
+            # buffer in place), then put back the rows greedy selection still needs
+            survivors = candidates[evaluate]
+            front = candidates[:m].copy()
+            candidates[:m] = survivors
+            fitness[evaluate], violation[evaluate] = self.evaluate_batch(
+                candidates[:m], (incumbents[0][evaluate], incumbents[1][evaluate]))
+            candidates[:m] = front
+            self.surrogate.report(self._sign * fitness[evaluate], self._sign * incumbents[0][evaluate])
+        return fitness, violation, evaluate
+
+    def _search_batch(self, i, k, j, phi):
+        values = self._bound(self.neighbour.step(self.foods, i, k, j, phi), j)
+        n = len(i)
+        if n == 0:
+            return
+        rows = np.arange(n)
+        candidates = self._candidates[:n]
+        np.take(self.foods, i, axis=0, out=candidates)
+        candidates[rows, j] = values
+        # Values in the storage type, so the food sources get exactly what was evaluated
+        values = candidates[rows, j].copy()
+        scores, violations, evaluated = self._evaluate_candidates(i, candidates)
+
+        targets, best = best_candidates(i, self.acceptance.order(scores, violations))
+        improved = self.acceptance.improves(scores[best], violations[best],
+                                            self.fitness[targets], self.violation[targets])
+        # Every losing candidate counts as a trial, screened-out ones do not
+        np.add.at(self.trial_counters, i if evaluated is None else i[evaluated], 1)
+        winners = best[improved]
+        targets = targets[improved]
+        if self.gate.tracks_moves:
+            for b in winners:
+                self._set_coordinate(i[b], j[b], values[b])
+        else:
+            self.foods[targets, j[winners]] = values[winners]
+            self._mark_changed(targets)
+        self.fitness[targets] = scores[winners]
+        self.violation[targets] = violations[winners]
+        self.trial_counters[targets] = 0
+        self.telemetry.accepted += len(winners)
+
+    # --- Phases ---
+    def employed_bees_phase(self):
+        self._search(np.arange(self.SN))
+
+    def onlooker_bees_phase(self):
+        self._search(self.selection.select(self.fitness, self.violation, self.onlookers, self.rng))
+
+    def scout_bees_phase(self):
+        exhausted = self.scout.exhausted(self.trial_counters, self.limit)
+        if len(exhausted) == 0:
+            return
+        if self.synchronous:
+            self.foods[exhausted] = self._random_sources(len(exhausted))
+            self.fitness[exhausted], self.violation[exhausted] = self.evaluate_batch(self.foods[exhausted])
+        else:
+            for i in exhausted:
+                self._redraw_source(i)
+                if self.move_evaluator is not None:
+                    start = perf_counter()
+                    self.fitness[i] = self.move_evaluator.replace(i, self.foods[i])
+                    self.telemetry.record_evaluations(1, perf_counter() - start)
+                else:
+                    self.fitness[i], self.violation[i] = self.evaluate(self.foods[i])
+        self.gate.replaced(self.foods, exhausted)
+        self.trial_counters[exhausted] = 0
+        self._mark_changed(exhausted)
+        self.telemetry.scout_resets += len(exhausted)
+
+    def _update_best(self):
+        current_best = int(self.acceptance.order(self.fitness, self.violation)[0])
+        if self.best_solution is None or self.acceptance.improves(
+                self.fitness[current_best], self.violation[current_best], self.best_fitness, self.best_violation):
+            self.best_fitness = self.fitness[current_best]
+            self.best_violation = self.violation[current_best]
+            self.best_solution = self.foods[current_best].copy()
+
+    def initialize(self):
+        """Evaluate the initial food sources."""
+        if self.move_evaluator is not None:
+            start = perf_counter()
+            self.fitness[:] = self.move_evaluator.reset(self.foods)
+            self.telemetry.record_evaluations(self.SN, perf_counter() - start)
+        elif self.synchronous:
+            self.fitness[:], self.violation[:] = self.evaluate_batch(self.foods)
+        else:
+            for i in range(self.SN):
+                self.fitness[i], self.violation[i] = self.evaluate(self.foods[i])
+        self.gate.reset(self.foods)
+        self._update_best()
+
+    def run_cycle(self):
+        """One employed -> onlooker -> scout cycle followed by the global best update."""
+        self.acceptance.update(self)
+        timed_phases(self.telemetry, (("employed", self.employed_bees_phase),
+                                      ("onlooker", self.onlooker_bees_phase),
+                                      ("scout", self.scout_bees_phase)))
+        self._update_best()
+        self.cycle += 1
+        self.telemetry.end_cycle(self.best_fitness)
+
+    # --- Checkpoints ---
+    def save_checkpoint(self, path=None):
+        """
+        Write an atomic checkpoint of the full optimizer state.
+
+        Only food sources changed since the target slot was last written are copied,
+        so the cost is bounded by the number of accepted moves and scout resets.
+        The surrogate archive is kept in slots the same way (new points, and the
+        fitted model after a refit) and the best-value history is appended to a
+        log, so neither is rewritten in full. The stopping windows, the elapsed
+        time counted against the deadline and the counters of stateful strategies
+        are saved as well; the DistanceGate matrix is rebuilt from the foods on
+        load. A resumed run follows the uninterrupted one (up to the rounding
+        of the rebuilt distance matrix).
+
+        Returns:
+            int: Number of food source rows written
+        """
+        path = path or self.checkpoint_path
+        if self._checkpoint is None or self._checkpoint.path != path:
+            self._checkpoint = CheckpointWriter(path, self._checkpoint_shapes())
+            self._surrogate_saved = (0, 0)
+
+        best_solution = self.best_solution if self.best_solution is not None else np.empty(0)
+        extra = {}
+        if self.stopping is not None:
+            extra["stopping"] = encode_json(self.stopping.state())
+        arrays = {"foods": self.foods}
+        if self.surrogate is not None:
+            extra.update({f"surrogate_{key}": value for key, value in self.surrogate.state().items()})
+            for name, rows in self.surrogate.changed_rows(*self._surrogate_saved).items():
+                self._checkpoint.mark(rows, f"surrogate_{name}")
+            arrays.update({f"surrogate_{name}": values
+                           for name, values in self.surrogate.checkpoint_arrays().items()})
+            self._surrogate_saved = (self.surrogate.count, self.surrogate.refits)
+        if hasattr(self.gate, "state"):
+            extra.update({f"gate_{key}": value for key, value in self.gate.state().items()})
+        history = self.telemetry.history
+        return self._checkpoint.write(
+            arrays,
+            logs={"history": (history.to_array(), history.count)},
+            fitness=self.fitness,
+            violation=self.violation,
+            trial_counters=self.trial_counters,
+            best_solution=best_solution,
+            best_fitness=self.best_fitness,
+            best_violation=self.best_violation,
+            cycle=self.cycle,
+            telemetry=encode_json(self.telemetry.snapshot()),
+            rng_state=encode_json(self.rng.bit_generator.state),
+            **extra,
+        )
+
+    def _checkpoint_shapes(self):
+        """Row arrays kept in checkpoint slots."""
+        shapes = {"foods": self.foods.shape}
+        if self.surrogate is not None:
+            shapes.update({f"surrogate_{name}": values.shape
+                           for name, values in self.surrogate.checkpoint_arrays().items()})
+        return shapes
+
+    def load_checkpoint(self, path):
+        """Restore the state saved by save_checkpoint(); optimize() then continues from it."""
+        state, arrays, slot, logged = load_checkpoint(path)
+        if (self.surrogate is not None) != ("surrogate_count" in state):
+            raise ValueError("checkpoint and optimizer differ in whether a surrogate screen is used")
+        self.foods[:] = arrays["foods"]
+        self.fitness[:] = state["fitness"]
+        self.violation[:] = state["violation"] if "violation" in state else 0.0
+        self.trial_counters[:] = state["trial_counters"]
+        self.best_solution = state["best_solution"] if state["best_solution"].size else None
+        self.best_fitness = float(state["best_fitness"])
+        self.best_violation = float(state["best_violation"]) if "best_violation" in state else 0.0
+        self.cycle = int(state["cycle"])
+        self.rng.bit_generator.state = decode_json(state["rng_state"])
+
+        counters = decode_json(state["telemetry"])
+        for name in ("evaluations", "accepted", "skipped", "scout_resets", "cycles"):
+            setattr(self.telemetry, name, counters[name])
+        self.telemetry.phase_time.update(counters["phase_time"])
+        history = self.telemetry.history
+        series = arrays["history"]
+        kept = np.arange(max(len(series) - len(history.data), 0), len(series))
+        history.data[kept % len(history.data)] = series[kept]
+        history.count = len(series)
+
+        def prefixed(prefix):
+            return {key[len(prefix):]: value for source in (state, arrays)
+                    for key, value in source.items() if key.startswith(prefix)}
+
+        if self.stopping is not None:
+            # A checkpoint written without stopping criteria starts them afresh
+            if "stopping" in state:
+                self.stopping.restore(decode_json(state["stopping"]))
+            else:
+                self.stopping.start()
+        if self.surrogate is not None:
+            self.surrogate.restore(prefixed("surrogate_"))
+        self.gate.reset(self.foods)
+        gate_state = prefixed("gate_")
+        if gate_state and hasattr(self.gate, "restore"):
+            self.gate.restore(gate_state)
+        if self.move_evaluator is not None:
+            # Caches are rebuilt from scratch, equal to the originals up to rounding
+            self.move_evaluator.reset(self.foods)
+        self.checkpoint_path = path
+        self._checkpoint = CheckpointWriter(path, self._checkpoint_shapes(), resume_slot=slot, logged=logged)
+        self._surrogate_saved = (self.surrogate.count, self.surrogate.refits) if self.surrogate is not None else None
+        self._resumed = True
+
+    def resume(self, path):
+        """Load a checkpoint and run the remaining cycles, returns like optimize()."""
+        self.load_checkpoint(path)
+        return self.optimize()
+
+    # --- Main loop ---
+    def optimize(self):
+        """
+        Run until MCN cycles or a stopping criterion, continuing a loaded checkpoint.
+
+        Returns:
+            tuple: (best_solution, best_fitness, fitness_history)
+        """
+        if self.workers:
+            self._start_pool()
+        try:
+            return self._optimize()
+        finally:
+            if self.pool_evaluator is not None:
+                self._stop_pool()
+
+    def _optimize(self):
+        # Initial evaluation (skipped when continuing from a checkpoint)
+        if not self._resumed:
+            self.initialize()
+        if self.telemetry.listeners:
+            self.telemetry.emit("start", best=self.best_fitness)
+        if self.stopping is not None and not self._resumed:
+            self.stopping.start()
+
+        self.stop_reason = MAX_CYCLES
+        while self.cycle < self.MCN:
+            self.run_cycle()
+            if self.checkpoint_every and self.cycle % self.checkpoint_every == 0:
+                self.save_checkpoint()
+            if self.stopping is not None:
+                reason = self.stopping.check(self)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+        if self.telemetry.listeners:
+            self.telemetry.emit("end", best=self.best_fitness, reason=self.stop_reason)
+        return self.best_solution, self.best_fitness, self.fitness_history
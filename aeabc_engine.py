@@ -0,0 +1,74 @@
+import numpy as np
+
+from abc_core import ABCOptimizer, DistanceGate, InverseFitnessRoulette, PartnerStep
+
+# ==========================================
+# AEABC engine with an incrementally maintained distance matrix
+# ==========================================
+class AEABCEngine(ABCOptimizer):
+    def __init__(self, objective_function, D, bounds, SN=50, MCN=100, limit=50,
+                 batch_function=None, refresh_interval=1000, seed=None, telemetry=None,
+                 stopping=None, dtype=np.float64):
+        """
+        Adaptive Exploration ABC (minimization) with O(SN) distance bookkeeping.
+
+        The AEABC configuration of abc_core.ABCOptimizer: PartnerStep moves gated
+        by DistanceGate, which keeps the SN x SN matrix of squared distances up
+        to date after every accepted move and reads Pd = exp(-1/d) from it.
+        Partners, Pd and the search/skip decisions (r > Pd) of a whole phase are
+        drawn with array operations; with batch_function its candidates are
+        also evaluated in one call.
+
+        Args:
+            objective_function (func): Function to minimize, f(x) >= 0
+            D (int): Dimension of the problem
+            bounds (tuple): (lower_bound, upper_bound), scalars or arrays of length D
+            SN (int): Number of food sources
+            MCN (int): Maximum Cycle Number
+            limit (int): Trials before abandonment
+            batch_function (func): Optional batch objective on an (n, D) array. When
+                given, the candidates of a phase are evaluated in one call.
+            refresh_interval (int): Accepted moves between full recomputations of
+                the distance matrix, bounds the accumulated rounding error
+            seed (int): Seed for numpy.random.default_rng
+            telemetry (Telemetry): Counters (evaluations, accepted moves, r <= Pd
+                skips, scout resets), phase timers and listeners
+            stopping (StoppingCriteria): Extra stopping conditions checked after every
+                cycle; the reason is stored in stop_reason
+            dtype (np.dtype): Storage type of the food sources (float64 or float32).
+                Distances are always accumulated in float64.
+
+        Serial searches write the move into the food source, evaluate that row and
+        restore the coordinate, so the objective must not keep or modify its argument.
+        """
+        super().__init__(objective_function, D, bounds, SN=SN, MCN=MCN, limit=limit,
+                         neighbour=PartnerStep(), gate=DistanceGate(refresh_interval),
+                         selection=InverseFitnessRoulette(), dtype=dtype,
+                         batch_function=batch_function, seed=seed, telemetry=telemetry,
+                         stopping=stopping)
+        self.refresh_interval = refresh_interval
+
+    @property
+    def skipped(self):
+        """Searches skipped by the AEABC rule (r <= Pd)."""
+        return self.telemetry.skipped
+
+    @property
+    def dist2(self):
+        """Squared pairwise distances between the food sources."""
+        return self.gate.dist2
+
+    def refresh_distances(self):
+        """Recompute all squared pairwise distances from the food sources."""
+        self.gate.reset(self.foods)
+
+if __name__ == "__main__":
+    # Sphere function, same setup as AEABC.py
+    def fitness_function(x):
+        return np.sum(x**2)
+
+    engine = AEABCEngine(fitness_function, D=5, bounds=(0, 100), SN=50, MCN=100, limit=50)
+    best_solution, best_fitness, history = engine.optimize()
+    print(f"Tối ưu toàn cục: {best_fitness}")
+    print(f"Số lần bỏ qua tìm kiếm (r <= Pd): {engine.skipped}")
+    print(f"Thống kê: {engine.telemetry.snapshot()}")
@@ -0,0 +1,241 @@
+import asyncio
+import math
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+
+from abc_core import ABCOptimizer, AlwaysSearch, PartnerStep, ShiftedFitnessRoulette
+from stopping import MAX_CYCLES
+
+# ==========================================
+# Asynchronous steady-state ABC for slow (out-of-process) objectives
+# ==========================================
+EMPLOYED, ONLOOKER, SCOUT = "employed", "onlooker", "scout"
+
+
+class AsyncArtificialBeeColony(ABCOptimizer):
+    def __init__(self, objective, D, bounds, SN=20, MCN=100, limit=50, max_in_flight=8,
+                 timeout=None, seed=None, telemetry=None, stopping=None):
+        """
+        ABC driver for an objective written as `async def objective(x)`.
+
+        Up to max_in_flight evaluations run concurrently. Candidates are built
+        in the usual employed -> onlooker order: 2*SN neighbour moves make one
+        cycle. Each result goes through greedy selection as soon as it
+        arrives; it does not wait for the rest of its phase (steady-state ABC).
+        A result is compared with the source's current fitness, which may
+        already have improved since the candidate was dispatched. Onlookers of
+        a cycle are drawn from the fitness values current when the onlooker
+        half starts. A source whose trial counter exceeds limit gets a scout
+        evaluation at the front of the queue.
+
+        Moves, onlooker selection, acceptance and source replacement are those
+        of the ArtificialBeeColony configuration of abc_core.ABCOptimizer; only
+        the scheduling differs.
+
+        An evaluation that raises or exceeds timeout counts as a rejected
+        candidate (trial + 1). A failed scout leaves the old source in place.
+
+        Args:
+            objective (coroutine function): Objective to maximize, awaited as objective(x)
+            D (int): Dimension of the problem
+            bounds (tuple): (lower_bound, upper_bound)
+            SN (int): Number of food sources
+            MCN (int): Maximum cycle number
+            limit (int): Trials before abandonment
+            max_in_flight (int): Maximum number of concurrent evaluations
+            timeout (float): Seconds allowed per evaluation (None = no limit)
+            seed (int): Seed for the numpy Generator driving every random draw
+            telemetry (Telemetry): Counters and events; the evaluation timer sums
+                the latency of concurrent evaluations, so it can exceed wall time
+            stopping (StoppingCriteria): Extra stopping conditions checked after every cycle
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        super().__init__(None, D, bounds, SN=SN, MCN=MCN, limit=limit, neighbour=PartnerStep(),
+                         gate=AlwaysSearch(), selection=ShiftedFitnessRoulette(), maximize=True,
+                         seed=seed, telemetry=telemetry, stopping=stopping)
+        self.objective = objective
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+
+        self.fitness[:] = -np.inf
+        self.scouting = np.zeros(SN, dtype=bool)
+        self.failures = 0
+        self.timeouts = 0
+        self._completed_moves = 0
+        self._scouts = deque()
+
+    async def _evaluate(self, x):
+        """Await the objective; returns None when it fails or times out."""
+        start = perf_counter()
+        try:
+            if self.timeout is None:
+                value = await self.objective(x)
+            else:
+                value = await asyncio.wait_for(self.objective(x), self.timeout)
+            value = float(value)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            value = None
+        except Exception:
+            self.failures += 1
+            value = None
+        self.telemetry.record_evaluations(1, perf_counter() - start)
+        return value
+
+    def _neighbour(self, i):
+        """Candidate of bee i from the current food sources."""
+        j, value = self._draw_move(i)
+        candidate = self.foods[i].copy()
+        candidate[j] = value
+        return candidate
+
+    def _moves(self):
+        """Endless stream of (kind, source, candidate), one cycle = SN employed + SN onlooker."""
+        while True:
+            for i in range(self.SN):
+                yield EMPLOYED, i, self._neighbour(i)
+            for i in self.selection.select(self.fitness, self.violation, self.SN, self.rng):
+                yield ONLOOKER, int(i), self._neighbour(int(i))
+
+    def _apply(self, kind, i, candidate, value):
+        """Greedy selection of one result; returns True when it completes a cycle."""
+        if kind == SCOUT:
+            self.scouting[i] = False
+            self.trial_counters[i] = 0
+            if value is not None:
+                self.replace_source(i, candidate, value)
+                self.telemetry.scout_resets += 1
+            return False
+
+        # The candidate is a whole row: the source may have moved since it was built
+        if value is not None and self.acceptance.improves(value, 0.0, self.fitness[i], self.violation[i]):
+            self.replace_source(i, candidate, value)
+            self.telemetry.accepted += 1
+        else:
+            self.trial_counters[i] += 1
+            if self.trial_counters[i] > self.limit and not self.scouting[i]:
+                self.scouting[i] = True
+                self._scouts.append(i)
+
+        self._completed_moves += 1
+        if self._completed_moves % (2 * self.SN) != 0:
+            return False
+        self.telemetry.end_cycle(self.best_fitness)
+        self.cycle += 1
+        return True
+
+    def _should_stop(self):
+        """Checked when a move completes a cycle."""
+        if self.cycle >= self.MCN:
+            return MAX_CYCLES
+        if self.stopping is not None:
+            return self.stopping.check(self)
+        return None
+
+    async def initialize(self):
+        """Evaluate all food sources, at most max_in_flight at a time."""
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def bounded(x):
+            async with semaphore:
+                return await self._evaluate(x)
+
+        values = await asyncio.gather(*(bounded(x) for x in self.foods))
+        for i, value in enumerate(values):
+            # A failed initial evaluation leaves -inf, any later candidate replaces it
+            if value is not None:
+                self.replace_source(i, self.foods[i], value)
+
+    async def optimize(self):
+        """
+        Run until MCN cycles or a stopping criterion; evaluations still in flight
+        at that point are cancelled.
+
+        Returns:
+            tuple: (best_solution, best_fitness, fitness_history)
+        """
+        await self.initialize()
+        if self.telemetry.listeners:
+            self.telemetry.emit("start", best=self.best_fitness)
+        if self.stopping is not None:
+            self.stopping.start()
+
+        moves = self._moves()
+        pending = {}
+        dispatched_moves = 0
+        max_moves = 2 * self.SN * self.MCN
+        self.stop_reason = None
+        try:
+            while self.stop_reason is None:
+                while len(pending) < self.max_in_flight:
+                    if self._scouts:
+                        i = self._scouts.popleft()
+                        job = (SCOUT, i, self._random_sources(1)[0])
+                    elif dispatched_moves < max_moves:
+                        job = next(moves)
+                        dispatched_moves += 1
+                    else:
+                        break
+                    pending[asyncio.ensure_future(self._evaluate(job[2]))] = job
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Dispatch order, not set order, so a seeded run is reproducible
+                for task in [task for task in pending if task in done]:
+                    kind, i, candidate = pending.pop(task)
+                    if self._apply(kind, i, candidate, task.result()):
+                        self.stop_reason = self._should_stop()
+                        if self.stop_reason is not None:
+                            break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self.telemetry.listeners:
+            self.telemetry.emit("end", best=self.best_fitness, reason=self.stop_reason)
+        return self.best_solution, self.best_fitness, self.fitness_history
+
+
+# ==========================================
+# Demo: stand-in simulator with artificial latency
+# ==========================================
+
+if __name__ == "__main__":
+    import time
+
+    from sim_mimo import ArtificialBeeColony, SIM_MIMO_System
+
+    Nt, Nr, N_elements = 4, 4, 32
+    latency = 0.005     # seconds per simulator call
+    SN, MCN = 10, 10
+    sim_env = SIM_MIMO_System(Nt, Nr, N_elements, seed=0)
+
+    def blocking_simulator(x):
+        time.sleep(latency)
+        return sim_env.calculate_spectral_efficiency(x)
+
+    async def remote_simulator(x):
+        await asyncio.sleep(latency)
+        return sim_env.calculate_spectral_efficiency(x)
+
+    start = time.perf_counter()
+    serial = ArtificialBeeColony(blocking_simulator, N_elements, (0, 2 * math.pi), SN=SN, MCN=MCN, seed=1)
+    _, serial_best, _ = serial.optimize()
+    serial_time = time.perf_counter() - start
+    serial_rate = serial.telemetry.evaluations / serial_time
+    print(f"Serial optimize: {serial.telemetry.evaluations} evaluations in {serial_time:.2f}s "
+          f"({serial_rate:.0f}/s), capacity {serial_best:.4f}")
+
+    for max_in_flight in (4, 16):
+        start = time.perf_counter()
+        colony = AsyncArtificialBeeColony(remote_simulator, N_elements, (0, 2 * math.pi), SN=SN, MCN=MCN,
+                                          max_in_flight=max_in_flight, timeout=10 * latency, seed=1)
+        _, best, _ = asyncio.run(colony.optimize())
+        elapsed = time.perf_counter() - start
+        rate = colony.telemetry.evaluations / elapsed
+        print(f"Async, {max_in_flight:>2} in flight: {colony.telemetry.evaluations} evaluations in "
+              f"{elapsed:.2f}s ({rate:.0f}/s, x{rate / serial_rate:.1f}), capacity {best:.4f}")
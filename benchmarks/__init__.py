@@ -0,0 +1,12 @@
+from benchmarks.functions import (
+    FUNCTIONS,
+    Problem,
+    ackley,
+    griewank,
+    make_problem,
+    make_sim_problem,
+    rastrigin,
+    rosenbrock,
+    schwefel,
+    sphere,
+)
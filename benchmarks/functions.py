@@ -0,0 +1,126 @@
+import numpy as np
+
+# ==========================================
+# Classic benchmark functions (minimization)
+# ==========================================
+# Every function works on the last axis, so it accepts a single vector (D,) or a
+# whole population (n, D) and returns a scalar or an (n,) array.
+
+
+def sphere(x):
+    return np.sum(x**2, axis=-1)
+
+
+def rosenbrock(x):
+    return np.sum(100.0 * (x[..., 1:] - x[..., :-1]**2)**2 + (1.0 - x[..., :-1])**2, axis=-1)
+
+
+def rastrigin(x):
+    return 10.0 * x.shape[-1] + np.sum(x**2 - 10.0 * np.cos(2 * np.pi * x), axis=-1)
+
+
+def ackley(x):
+    D = x.shape[-1]
+    return (-20.0 * np.exp(-0.2 * np.sqrt(np.sum(x**2, axis=-1) / D))
+            - np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1) / D) + 20.0 + np.e)
+
+
+def griewank(x):
+    i = np.arange(1, x.shape[-1] + 1)
+    return 1.0 + np.sum(x**2, axis=-1) / 4000.0 - np.prod(np.cos(x / np.sqrt(i)), axis=-1)
+
+
+def schwefel(x):
+    # Schwefel 2.26, shifted so that the minimum value is 0. Outside [-500, 500]
+    # (reachable after a CEC shift/rotation) the CEC 2014 form is used: the sine
+    # term is mirrored back into the domain and a quadratic penalty is added, so
+    # the function stays bounded below by 0 instead of diverging to -inf.
+    D = x.shape[-1]
+    folded = 500.0 - np.mod(np.abs(x), 500.0)
+    outside = np.abs(x) > 500.0
+    term = np.where(outside, np.sign(x) * folded * np.sin(np.sqrt(folded)), x * np.sin(np.sqrt(np.abs(x))))
+    penalty = np.where(outside, ((np.abs(x) - 500.0) / 100.0)**2 / D, 0.0)
+    return 418.9828872724339 * D - np.sum(term - penalty, axis=-1)
+
+
+# name -> (function, (lower, upper), coordinate of the optimum)
+FUNCTIONS = {
+    "sphere": (sphere, (-100.0, 100.0), 0.0),
+    "rosenbrock": (rosenbrock, (-30.0, 30.0), 1.0),
+    "rastrigin": (rastrigin, (-5.12, 5.12), 0.0),
+    "ackley": (ackley, (-32.768, 32.768), 0.0),
+    "griewank": (griewank, (-600.0, 600.0), 0.0),
+    "schwefel": (schwefel, (-500.0, 500.0), 420.9687463),
+}
+
+
+class Problem:
+    def __init__(self, name, D, function, bounds, optimum=0.0):
+        """
+        A minimization problem with scalar and batch entry points.
+
+        Args:
+            name (str): Label used in benchmark reports
+            D (int): Dimension
+            function (func): Vectorized objective over the last axis
+            bounds (tuple): (lower_bound, upper_bound), same for every coordinate
+            optimum (float): Known minimum value, None when unknown
+        """
+        self.name = name
+        self.D = D
+        self.function = function
+        self.lb, self.ub = bounds
+        self.optimum = optimum
+
+    def __call__(self, x):
+        return float(self.function(np.asarray(x)))
+
+    def batch(self, X):
+        return self.function(np.asarray(X))
+
+
+def random_rotation(D, rng):
+    """Random orthogonal matrix (QR of a Gaussian matrix with sign correction)."""
+    Q, R = np.linalg.qr(rng.standard_normal((D, D)))
+    return Q * np.sign(np.diag(R))
+
+
+def make_problem(name, D, shifted=False, rotated=False, seed=0):
+    """
+    Build a benchmark problem, optionally CEC-style shifted and/or rotated.
+
+    The CEC form is F(x) = f(M (x - o) + x*) where o is a random shift inside 80%
+    of the bounds, M a random rotation and x* the optimum of the base function,
+    so the minimum value stays 0 and moves to x = o.
+    """
+    function, bounds, x_star = FUNCTIONS[name]
+    if not (shifted or rotated):
+        return Problem(name, D, function, bounds)
+
+    rng = np.random.default_rng(seed)
+    lb, ub = bounds
+    o = rng.uniform(0.8 * lb, 0.8 * ub, D) if shifted else np.full(D, x_star)
+    M = random_rotation(D, rng) if rotated else None
+
+    def transformed(x):
+        z = x - o
+        if M is not None:
+            z = z @ M.T
+        return function(z + x_star)
+
+    label = name + ("_shifted" if shifted else "") + ("_rotated" if rotated else "")
+    return Problem(label, D, transformed, bounds)
+
+
+def make_sim_problem(D, Nt=4, Nr=4, seed=0):
+    """SIM-MIMO capacity as a minimization problem (-capacity), optimum unknown."""
+    from sim_mimo import SIM_MIMO_System
+
+    system = SIM_MIMO_System(Nt, Nr, D, seed=seed)
+
+    def negative_capacity(X):
+        if X.ndim == 1:
+            return -system.calculate_spectral_efficiency(X)
+        return -system.calculate_spectral_efficiency_batch(X)
+
+    return Problem("sim_capacity", D, negative_capacity, (0.0, 2 * np.pi), optimum=None)
@@ -0,0 +1,196 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from aeabc_engine import AEABCEngine
+from benchmarks.functions import FUNCTIONS, make_problem, make_sim_problem
+from sim_mimo import ArtificialBeeColony
+
+# ==========================================
+# Benchmark harness: throughput, time to target and peak memory
+# ==========================================
+
+
+class EvaluationRecorder:
+    def __init__(self, problem, target_error):
+        """
+        Wraps a problem to count evaluations and detect when the target is reached.
+
+        The recorder sits between the optimizer and the objective, so the time and
+        evaluation count to reach `optimum + target_error` are measured the same way
+        for every variant, independent of how it reports progress.
+        """
+        self.problem = problem
+        self.target_error = target_error
+        self.evaluations = 0
+        self.best = np.inf
+        self.target_time = None
+        self.target_evaluations = None
+        self.start = time.perf_counter()
+
+    def _record(self, values):
+        self.evaluations += np.size(values)
+        best = np.min(values)
+        if best < self.best:
+            self.best = best
+            if (self.target_time is None and self.problem.optimum is not None
+                    and best - self.problem.optimum <= self.target_error):
+                self.target_time = time.perf_counter() - self.start
+                self.target_evaluations = self.evaluations
+
+    def __call__(self, x):
+        value = self.problem(x)
+        self._record(value)
+        return value
+
+    def batch(self, X):
+        values = self.problem.batch(X)
+        self._record(values)
+        return values
+
+
+# Variants: name -> builder(problem, recorder, SN, limit, seed) -> (initialize, run_cycle)
+# ArtificialBeeColony maximizes, so it receives the negated objective.
+def _abc(problem, recorder, SN, limit, seed, synchronous=False):
+    colony = ArtificialBeeColony(
+        lambda x: -recorder(x), problem.D, (problem.lb, problem.ub), SN=SN, limit=limit,
+        seed=seed, batch_function=lambda X: -recorder.batch(X), synchronous=synchronous)
+    return colony.calculate_fitness, colony.run_cycle
+
+
+def _aeabc(problem, recorder, SN, limit, seed, batched=False):
+    engine = AEABCEngine(recorder, problem.D, (problem.lb, problem.ub), SN=SN, limit=limit,
+                         batch_function=recorder.batch if batched else None, seed=seed)
+    return engine.initialize, engine.run_cycle
+
+
+VARIANTS = {
+    "ABC": _abc,
+    "ABC-sync": lambda *args: _abc(*args, synchronous=True),
+    "AEABC": _aeabc,
+    "AEABC-batch": lambda *args: _aeabc(*args, batched=True),
+}
+
+
+def run_case(variant, problem, MCN, SN=30, limit=50, seed=0, target_error=1e-3,
+             memory_cycles=5):
+    """
+    Benchmark one variant on one problem.
+
+    The timed run has no tracing. Peak memory is measured by a second, short run
+    (memory_cycles cycles) under tracemalloc, because tracing every allocation
+    would distort the throughput figures. The population and all buffers are
+    allocated in the first cycle, so a short run is enough for the peak.
+    """
+    recorder = EvaluationRecorder(problem, target_error)
+    initialize, run_cycle = VARIANTS[variant](problem, recorder, SN, limit, seed)
+    initialize()
+    for _ in range(MCN):
+        run_cycle()
+    elapsed = time.perf_counter() - recorder.start
+
+    tracemalloc.start()
+    probe = EvaluationRecorder(problem, target_error)
+    initialize, run_cycle = VARIANTS[variant](problem, probe, SN, limit, seed)
+    initialize()
+    for _ in range(min(memory_cycles, MCN)):
+        run_cycle()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    error = None if problem.optimum is None else float(recorder.best - problem.optimum)
+    return {
+        "variant": variant,
+        "problem": problem.name,
+        "D": problem.D,
+        "SN": SN,
+        "MCN": MCN,
+        "seed": seed,
+        "evaluations": int(recorder.evaluations),
+        "time": elapsed,
+        "evals_per_sec": recorder.evaluations / elapsed,
+        "best_value": float(recorder.best),
+        "best_error": error,
+        "target_error": target_error,
+        "time_to_target": recorder.target_time,
+        "evaluations_to_target": recorder.target_evaluations,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _git_commit():
+    """Commit of the checkout holding this file, wherever the suite is run from."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(functions=tuple(FUNCTIONS), dims=(2, 10, 30), variants=tuple(VARIANTS),
+              MCN=100, SN=30, limit=50, seed=0, target_error=1e-3, transforms=("plain",),
+              include_sim=True, verbose=True):
+    """
+    Run every variant on every (function, dimension, transform) combination.
+
+    transforms selects the CEC-style versions: "plain", "shifted", "rotated"
+    and/or "shifted_rotated". The SIM capacity objective is added for each
+    dimension when include_sim is True.
+
+    Returns:
+        dict: Machine-readable report with environment info and one entry per case
+    """
+    problems = []
+    for D in dims:
+        for name in functions:
+            for transform in transforms:
+                problems.append(make_problem(name, D, shifted="shifted" in transform,
+                                             rotated="rotated" in transform, seed=seed))
+        if include_sim:
+            problems.append(make_sim_problem(D, seed=seed))
+
+    results = []
+    for problem in problems:
+        for variant in variants:
+            result = run_case(variant, problem, MCN, SN=SN, limit=limit, seed=seed,
+                              target_error=target_error)
+            results.append(result)
+            if verbose:
+                print(f"{variant:<12} {problem.name:<28} D={problem.D:<5} "
+                      f"{result['evals_per_sec']:>10.0f} evals/s  best={result['best_value']:.4g}")
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ABC/AEABC benchmark suite")
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS))
+    parser.add_argument("--dims", nargs="+", type=int, default=[2, 10, 30])
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS))
+    parser.add_argument("--transforms", nargs="+", default=["plain"],
+                        choices=["plain", "shifted", "rotated", "shifted_rotated"])
+    parser.add_argument("--MCN", type=int, default=100)
+    parser.add_argument("--SN", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target-error", type=float, default=1e-3)
+    parser.add_argument("--no-sim", action="store_true")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    report = run_suite(args.functions, args.dims, args.variants, MCN=args.MCN, SN=args.SN,
+                       seed=args.seed, target_error=args.target_error,
+                       transforms=args.transforms, include_sim=not args.no_sim)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
@@ -0,0 +1,136 @@
+import argparse
+import json
+import math
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from sim_mimo import ArtificialBeeColony, SIM_MIMO_System
+from stopping import StoppingCriteria
+
+# ==========================================
+# Monte Carlo ergodic-capacity sweep over channel realizations and SNR
+# ==========================================
+
+
+def _run_realization(task):
+    """Optimize every SNR point of one channel realization, warm-starting along the grid."""
+    realization, seed_sequence, snr_grid, params = task
+    # The children spawn(2) gives on a fresh sequence, without consuming seed_sequence
+    channel_seed, optimizer_seed = (
+        np.random.SeedSequence(seed_sequence.entropy, spawn_key=seed_sequence.spawn_key + (i,)) for i in range(2))
+    system = SIM_MIMO_System(params["Nt"], params["Nr"], params["N"], Layers=params["Layers"],
+                             seed=channel_seed)
+    optimizer_rng = np.random.default_rng(optimizer_seed)
+
+    points = []
+    previous_best = None
+    for snr_db in snr_grid:
+        system.set_snr(snr_db)
+        start = time.perf_counter()
+        colony = ArtificialBeeColony(
+            system.calculate_spectral_efficiency, system.D, (0, 2 * math.pi),
+            SN=params["SN"], MCN=params["MCN"], limit=params["limit"],
+            seed=optimizer_rng.integers(2**63),
+            initial_foods=previous_best if params["warm_start"] else None,
+            stopping=StoppingCriteria(stagnation_cycles=params["stagnation_cycles"],
+                                      stagnation_tolerance=params["stagnation_tolerance"]))
+        best_phases, capacity, _ = colony.optimize()
+        previous_best = best_phases
+        points.append({
+            "realization": realization, "snr_db": float(snr_db), "capacity": float(capacity),
+            "evaluations": colony.telemetry.evaluations, "cycles": colony.cycle,
+            "stop_reason": colony.stop_reason, "time": time.perf_counter() - start,
+        })
+    return points
+
+
+def run_sweep(snr_grid=tuple(range(0, 31, 5)), realizations=50, Nt=4, Nr=4, N=64, Layers=1,
+              SN=20, MCN=300, limit=50, stagnation_cycles=30, stagnation_tolerance=1e-4,
+              warm_start=True, seed=0, workers=None, output="capacity_sweep.jsonl"):
+    """
+    Ergodic capacity versus SNR, averaged over independent channel realizations.
+
+    Realization r draws its channels and optimizer stream from child r of
+    SeedSequence(seed), so any point of the curve can be reproduced alone.
+    Realizations run in parallel, one pool task each. Within a task the SNR grid is
+    swept in order and, with warm_start, every point starts from the best phases
+    found at the previous SNR point. A run stops when its best capacity has not
+    improved by stagnation_tolerance for stagnation_cycles cycles, so a good start
+    converges in far fewer evaluations than a random one. Every finished
+    realization is appended to output as JSON lines, one per SNR point.
+
+    Args:
+        snr_grid (tuple): SNR points in dB, swept in this order
+        realizations (int): Number of channel realizations
+        Nt, Nr, N, Layers (int): SIM-MIMO dimensions
+        SN, MCN, limit (int): ABC parameters of every run
+        stagnation_cycles (int): Stagnation window of the stopping rule
+        stagnation_tolerance (float): Improvement in bits/s/Hz that resets the window
+        warm_start (bool): Seed each SNR point with the previous point's best phases
+        seed (int): Root seed of the sweep
+        workers (int): Pool size (None = os.cpu_count())
+        output (str): Path of the JSON-lines file receiving per-point results
+
+    Returns:
+        dict: ergodic capacity, its standard error and mean evaluations per SNR point,
+            plus total evaluations and wall time
+    """
+    snr_grid = np.asarray(snr_grid, dtype=float)
+    params = {
+        "Nt": Nt, "Nr": Nr, "N": N, "Layers": Layers, "SN": SN, "MCN": MCN, "limit": limit,
+        "stagnation_cycles": stagnation_cycles, "stagnation_tolerance": stagnation_tolerance,
+        "warm_start": warm_start,
+    }
+    children = np.random.SeedSequence(seed).spawn(realizations)
+    tasks = [(r, children[r], snr_grid, params) for r in range(realizations)]
+    capacities = np.full((realizations, len(snr_grid)), np.nan)
+    evaluations = np.zeros((realizations, len(snr_grid)), dtype=np.int64)
+
+    start = time.perf_counter()
+    with mp.get_context().Pool(workers) as pool, open(output, "w") as out:
+        for points in pool.imap_unordered(_run_realization, tasks):
+            for p, point in enumerate(points):
+                out.write(json.dumps(point) + "\n")
+                capacities[point["realization"], p] = point["capacity"]
+                evaluations[point["realization"], p] = point["evaluations"]
+            out.flush()
+
+    return {
+        "snr_db": snr_grid.tolist(),
+        "ergodic_capacity": capacities.mean(axis=0).tolist(),
+        "standard_error": (capacities.std(axis=0) / np.sqrt(realizations)).tolist(),
+        "mean_evaluations": evaluations.mean(axis=0).tolist(),
+        "total_evaluations": int(evaluations.sum()),
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+def print_summary(summary):
+    print(f"{'SNR (dB)':>8} {'C (bits/s/Hz)':>14} {'± s.e.':>8} {'Evals':>8}")
+    for snr, capacity, error, evals in zip(summary["snr_db"], summary["ergodic_capacity"],
+                                           summary["standard_error"], summary["mean_evaluations"]):
+        print(f"{snr:>8.1f} {capacity:>14.4f} {error:>8.4f} {evals:>8.0f}")
+    print(f"Total evaluations: {summary['total_evaluations']}, wall time: {summary['wall_time']:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dung lượng ergodic theo SNR qua nhiều kênh ngẫu nhiên")
+    parser.add_argument("--realizations", type=int, default=50)
+    parser.add_argument("--snr", type=float, nargs="+", default=list(range(0, 31, 5)))
+    parser.add_argument("--elements", type=int, default=64)
+    parser.add_argument("--layers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cold", action="store_true", help="Khởi tạo ngẫu nhiên ở mọi điểm SNR")
+    parser.add_argument("--output", default="capacity_sweep.jsonl")
+    parser.add_argument("--summary", default="capacity_sweep_summary.json")
+    args = parser.parse_args()
+
+    summary = run_sweep(snr_grid=args.snr, realizations=args.realizations, N=args.elements,
+                        Layers=args.layers, warm_start=not args.cold, seed=args.seed,
+                        workers=args.workers, output=args.output)
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+    print_summary(summary)
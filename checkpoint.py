@@ -0,0 +1,148 @@
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+# ==========================================
+# Atomic, incremental checkpoints of a colony
+# ==========================================
+# Layout for path "run.ckpt":
+#   run.ckpt                  small .npz manifest (fitness, counters, RNG state,
+#                             index of the valid slot, log lengths), replaced atomically
+#   run.ckpt.slot0.npy        memory-mapped copies of the food sources, written
+#   run.ckpt.slot1.npy        alternately (double buffering)
+#   run.ckpt.<name>.slot0.npy other row arrays (e.g. the surrogate archive), same scheme
+#   run.ckpt.<name>.log       append-only float64 series (e.g. the best-value history)
+#
+# A checkpoint writes only the rows that changed since that slot was last
+# written and appends only the new values of every log, flushes them, then
+# swaps in a new manifest with os.replace. The manifest always names a slot
+# that is not being written and the log lengths it was written with, so a
+# crash at any point leaves the previous checkpoint intact.
+
+
+def _slot_path(path, slot, name="foods"):
+    if name == "foods":
+        return f"{path}.slot{slot}.npy"
+    return f"{path}.{name}.slot{slot}.npy"
+
+
+def _log_path(path, name):
+    return f"{path}.{name}.log"
+
+
+def _atomic_savez(path, **arrays):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class CheckpointWriter:
+    def __init__(self, path, shapes, resume_slot=None, logged=None):
+        """
+        Args:
+            path (str): Manifest path, slot and log files are created next to it
+            shapes (dict): Name -> shape of every row array kept in slots, e.g.
+                {"foods": (SN, D)}
+            resume_slot (int): Slot named by an existing manifest when resuming,
+                None to start fresh
+            logged (dict): Name -> length of every log in that manifest when resuming
+        """
+        self.path = path
+        if resume_slot is None:
+            self.slots = {name: [open_memmap(_slot_path(path, s, name), mode="w+", dtype=np.float64, shape=shape)
+                                 for s in (0, 1)]
+                          for name, shape in shapes.items()}
+            self.next_slot = 0
+            # Bit s set = row differs from what slot s holds
+            self.dirty = {name: np.full(shape[0], 3, dtype=np.uint8) for name, shape in shapes.items()}
+        else:
+            self.slots = {name: [open_memmap(_slot_path(path, s, name), mode="r+") for s in (0, 1)]
+                          for name in shapes}
+            self.next_slot = 1 - resume_slot
+            self.dirty = {name: np.full(shape[0], 1 << self.next_slot, dtype=np.uint8)
+                          for name, shape in shapes.items()}
+        self.logged = dict(logged or {})
+
+    def mark(self, rows, name="foods"):
+        """Record that rows of array `name` changed (both slots are now stale)."""
+        self.dirty[name][rows] = 3
+
+    def _append(self, name, values, length):
+        """Write the values of a series of `length` values (values are its tail) past what is logged."""
+        logged = self.logged.get(name, 0)
+        start = length - len(values)
+        tail = np.empty(length - logged)
+        # Values that fell out of the caller's buffer before they were logged are lost
+        tail[:max(start - logged, 0)] = np.nan
+        tail[max(start - logged, 0):] = values[max(logged - start, 0):]
+        mode = "r+b" if os.path.exists(_log_path(self.path, name)) else "wb"
+        with open(_log_path(self.path, name), mode) as f:
+            f.seek(logged * tail.itemsize)
+            f.write(tail.tobytes())
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+        self.logged[name] = length
+
+    def write(self, arrays, logs=None, **state):
+        """
+        Write a checkpoint.
+
+        Args:
+            arrays (dict): Name -> current row array, for every name of `shapes`
+            logs (dict): Name -> (tail of a series, its total length); only values
+                not logged yet are written
+            state: Small arrays stored in the manifest
+
+        Returns:
+            int: Number of food source rows copied
+        """
+        slot = self.next_slot
+        bit = np.uint8(1 << slot)
+        copied = {}
+        for name, values in arrays.items():
+            rows = np.flatnonzero(self.dirty[name] & bit)
+            self.slots[name][slot][rows] = values[rows]
+            self.slots[name][slot].flush()
+            self.dirty[name][rows] &= ~bit
+            copied[name] = len(rows)
+        for name, (values, length) in (logs or {}).items():
+            self._append(name, values, length)
+
+        _atomic_savez(self.path, slot=slot, arrays=encode_json(list(self.slots)),
+                      logged=encode_json(self.logged), **state)
+        self.next_slot = 1 - slot
+        return copied["foods"]
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint.
+
+    Returns:
+        tuple: (state dict of manifest arrays, name -> slot array (foods, ...) and
+            name -> log series, slot index, name -> log length)
+    """
+    with np.load(path) as manifest:
+        state = {key: manifest[key] for key in manifest.files}
+    slot = int(state.pop("slot"))
+    logged = decode_json(state.pop("logged"))
+    arrays = {name: np.array(np.load(_slot_path(path, slot, name), mmap_mode="r"))
+              for name in decode_json(state.pop("arrays"))}
+    for name, length in logged.items():
+        arrays[name] = np.fromfile(_log_path(path, name), count=length)
+    return state, arrays, slot, logged
+
+
+def encode_json(obj):
+    """Store a JSON-serializable object (e.g. bit_generator.state) in an npz entry."""
+    return np.array(json.dumps(obj))
+
+
+def decode_json(array):
+    return json.loads(str(array))
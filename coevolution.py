@@ -0,0 +1,276 @@
+import math
+import multiprocessing as mp
+from time import perf_counter
+
+import numpy as np
+
+from sim_mimo import ArtificialBeeColony, IncrementalCapacityEvaluator
+from telemetry import Telemetry
+
+# ==========================================
+# Cooperative coevolution: sub-colonies on groups of variables
+# ==========================================
+GROUPINGS = ("random", "correlation")
+
+
+def random_groups(D, group_size, rng):
+    """Random partition of range(D) into groups of about group_size variables."""
+    n_groups = max(1, math.ceil(D / group_size))
+    return np.array_split(rng.permutation(D), n_groups)
+
+
+def correlation_groups(system, group_size):
+    """
+    Partition the SIM elements so that strongly coupled elements share a group.
+
+    Element n adds the rank-one term g_n h_n^T to H_eff. Two elements interact
+    through |g_n^H g_m| |h_n^H h_m| (normalized). Groups are grown greedily
+    around the unassigned element with the largest total coupling.
+    """
+    if system.Layers > 1:
+        raise ValueError("correlation grouping is defined for single-layer SIM only")
+    g = system.G_base / np.linalg.norm(system.G_base, axis=0)
+    h = system.H_base / np.linalg.norm(system.H_base, axis=1)[:, None]
+    coupling = np.abs(g.conj().T @ g) * np.abs(h.conj() @ h.T)
+    np.fill_diagonal(coupling, 0.0)
+
+    unassigned = np.ones(system.N_elements, dtype=bool)
+    groups = []
+    while unassigned.any():
+        free = np.flatnonzero(unassigned)
+        seed = free[np.argmax(coupling[np.ix_(free, free)].sum(axis=1))]
+        others = free[free != seed]
+        members = others[np.argsort(-coupling[seed, others])[:group_size - 1]]
+        group = np.concatenate(([seed], members))
+        unassigned[group] = False
+        groups.append(np.sort(group))
+    return groups
+
+
+class _GroupMoveEvaluator:
+    """Presents IncrementalCapacityEvaluator to a sub-colony that only sees one group."""
+
+    def __init__(self, evaluator, context, group):
+        self.evaluator = evaluator
+        self.context = context
+        self.group = group
+
+    def _full(self, sub_foods):
+        full = np.repeat(self.context[None, :], len(sub_foods), axis=0)
+        full[:, self.group] = sub_foods
+        return full
+
+    def reset(self, foods):
+        return self.evaluator.reset(self._full(foods))
+
+    def replace(self, i, phase_shifts):
+        return self.evaluator.replace(i, self._full(phase_shifts[None])[0])
+
+    def evaluate_move(self, i, j, new_phase):
+        return self.evaluator.evaluate_move(i, self.group[j], new_phase)
+
+    def accept_move(self, i, j, new_phase):
+        self.evaluator.accept_move(i, self.group[j], new_phase)
+
+
+def _optimize_group(objective, system, group, context, bounds, seed, params):
+    """Run one sub-colony on the variables in group, the others fixed to context."""
+    if system is not None and params["incremental"]:
+        move_evaluator = _GroupMoveEvaluator(IncrementalCapacityEvaluator(system), context, group)
+        group_objective = None
+    else:
+        move_evaluator = None
+        full = context.copy()
+
+        def group_objective(y):
+            full[group] = y
+            return objective(full)
+
+    colony = ArtificialBeeColony(group_objective, len(group), bounds, SN=params["SN"],
+                                 MCN=params["group_cycles"], limit=params["limit"], seed=seed,
+                                 move_evaluator=move_evaluator, initial_foods=context[group])
+    best, value, _ = colony.optimize()
+    return group, best, value, colony.telemetry.evaluations
+
+
+_worker_state = {}
+
+
+def _init_worker(objective, system):
+    _worker_state["objective"] = objective
+    _worker_state["system"] = system
+
+
+def _optimize_group_task(task):
+    return _optimize_group(_worker_state["objective"], _worker_state["system"], *task)
+
+
+class CooperativeCoevolution:
+    maximize = True
+
+    def __init__(self, objective_function, D, bounds, group_size=64, grouping="random",
+                 rounds=20, SN=10, group_cycles=10, limit=20, system=None, incremental=False,
+                 workers=None, seed=None, telemetry=None):
+        """
+        Large-scale ABC (maximization) by cooperative coevolution.
+
+        The decision vector is split into groups. Each round optimizes every group
+        with its own small ArtificialBeeColony, whose food sources are the
+        group's variables. The other variables stay fixed to a shared context
+        vector (the best full solution so far). Each sub-colony starts from the
+        context, so a round never makes it worse. A sub-colony move covers 1 of
+        group_size variables instead of 1 of D.
+
+        Serially the context is updated after each group. With workers, all
+        groups of a round run in parallel against the same context. Their
+        improvements are merged, and the merge is kept if it is at least as good
+        as the best single group (which is kept otherwise).
+
+        Args:
+            objective_function (func): Function to maximize on the full vector
+            D (int): Dimension of the problem
+            bounds (tuple): (lower_bound, upper_bound), scalars
+            group_size (int): Variables per group
+            grouping (str or list): "random" (redrawn every round), "correlation"
+                (SIM channel coupling, needs system) or an explicit list of index arrays
+            rounds (int): Passes over all groups
+            SN (int): Food sources per sub-colony
+            group_cycles (int): ABC cycles per group and round
+            limit (int): Trials before abandonment in the sub-colonies
+            system (SIM_MIMO_System): Channel model, for correlation grouping and
+                incremental evaluation
+            incremental (bool): Score sub-colony moves with IncrementalCapacityEvaluator
+            workers (int): Process pool size for parallel groups (None = serial)
+            seed (int): Root seed for the grouping and the sub-colonies
+            telemetry (Telemetry): Evaluations of all sub-colonies, history per round
+        """
+        if isinstance(grouping, str) and grouping not in GROUPINGS:
+            raise ValueError(f"grouping must be one of {GROUPINGS} or a list of index arrays, got {grouping!r}")
+        if (grouping == "correlation" or incremental) and system is None:
+            raise ValueError("correlation grouping and incremental evaluation need the SIM system")
+
+        self.func = objective_function
+        self.D = D
+        self.bounds = bounds
+        self.lb, self.ub = bounds
+        self.group_size = group_size
+        self.grouping = grouping
+        self.rounds = rounds
+        self.system = system
+        self.workers = workers
+        self.params = {"SN": SN, "group_cycles": group_cycles, "limit": limit, "incremental": incremental}
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        self.telemetry = telemetry if telemetry is not None else Telemetry(history_capacity=rounds)
+
+        if grouping == "correlation":
+            self._fixed_groups = correlation_groups(system, group_size)
+        elif isinstance(grouping, str):
+            self._fixed_groups = None
+        else:
+            self._fixed_groups = [np.asarray(group) for group in grouping]
+
+        self.best_solution = self.rng.uniform(self.lb, self.ub, D)
+        self.best_fitness = -np.inf
+
+    @property
+    def fitness_history(self):
+        return self.telemetry.history.to_array()
+
+    def _groups(self):
+        if self._fixed_groups is not None:
+            return self._fixed_groups
+        return random_groups(self.D, self.group_size, self.rng)
+
+    def _evaluate(self, x):
+        start = perf_counter()
+        value = self.func(x)
+        self.telemetry.record_evaluations(1, perf_counter() - start)
+        return value
+
+    def _serial_round(self, groups, seeds):
+        for group, seed in zip(groups, seeds):
+            _, best, value, evaluations = _optimize_group(
+                self.func, self.system, group, self.best_solution, self.bounds, seed, self.params)
+            self.telemetry.evaluations += evaluations
+            if value > self.best_fitness:
+                self.best_solution[group] = best
+                self.best_fitness = value
+                self.telemetry.accepted += 1
+
+    def _parallel_round(self, pool, groups, seeds):
+        tasks = [(group, self.best_solution, self.bounds, seed, self.params)
+                 for group, seed in zip(groups, seeds)]
+        merged = self.best_solution.copy()
+        best_single = (self.best_fitness, None, None)
+        improved = 0
+        for group, best, value, evaluations in pool.imap_unordered(_optimize_group_task, tasks):
+            self.telemetry.evaluations += evaluations
+            if value > self.best_fitness:
+                merged[group] = best
+                improved += 1
+                if value > best_single[0]:
+                    best_single = (value, group, best)
+        if improved == 0:
+            return
+
+        merged_value = self._evaluate(merged) if improved > 1 else best_single[0]
+        if merged_value >= best_single[0]:
+            self.best_solution, self.best_fitness = merged, merged_value
+            self.telemetry.accepted += improved
+        else:
+            value, group, best = best_single
+            self.best_solution[group] = best
+            self.best_fitness = value
+            self.telemetry.accepted += 1
+
+    def optimize(self):
+        """
+        Returns:
+            tuple: (best_solution, best_fitness, fitness_history per round)
+        """
+        self.best_fitness = self._evaluate(self.best_solution)
+        pool = None
+        if self.workers:
+            pool = mp.get_context().Pool(self.workers, initializer=_init_worker,
+                                         initargs=(self.func, self.system))
+        try:
+            for _ in range(self.rounds):
+                groups = self._groups()
+                seeds = self.seed_sequence.spawn(len(groups))
+                if pool is None:
+                    self._serial_round(groups, seeds)
+                else:
+                    self._parallel_round(pool, groups, seeds)
+                self.telemetry.end_cycle(self.best_fitness)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return self.best_solution, self.best_fitness, self.fitness_history
+
+if __name__ == "__main__":
+    import time
+
+    from sim_mimo import SIM_MIMO_System
+
+    Nt, Nr, N_elements = 4, 4, 1024
+    sim_env = SIM_MIMO_System(Nt, Nr, N_elements, seed=0)
+    bounds = (0, 2 * math.pi)
+
+    # Global ABC with about the same number of evaluations as the CC runs below
+    start = time.perf_counter()
+    abc = ArtificialBeeColony(sim_env.calculate_spectral_efficiency, N_elements, bounds, SN=20, MCN=1450,
+                              move_evaluator=IncrementalCapacityEvaluator(sim_env), seed=1)
+    _, capacity, _ = abc.optimize()
+    print(f"ABC toàn cục: {capacity:.4f} bits/s/Hz, {abc.telemetry.evaluations} đánh giá, "
+          f"{time.perf_counter() - start:.1f}s")
+
+    for grouping, workers in (("random", None), ("correlation", None), ("random", 4)):
+        start = time.perf_counter()
+        cc = CooperativeCoevolution(sim_env.calculate_spectral_efficiency, N_elements, bounds,
+                                    group_size=64, grouping=grouping, rounds=6, SN=10, group_cycles=30,
+                                    system=sim_env, incremental=True, workers=workers, seed=1)
+        _, capacity, _ = cc.optimize()
+        print(f"CC ({grouping}, workers={workers}): {capacity:.4f} bits/s/Hz, "
+              f"{cc.telemetry.evaluations} đánh giá, {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,113 @@
+import argparse
+import json
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from ABC import run_abc
+from AEABC import run_aeabc
+
+# ==========================================
+# Multi-seed ABC vs AEABC experiment runner
+# ==========================================
+RUNNERS = {
+    "ABC": run_abc,
+    "AEABC": run_aeabc,
+}
+
+
+def _run_one(task):
+    variant, run, seed_sequence, params = task
+    start = time.perf_counter()
+    best, _, curve, evaluations = RUNNERS[variant](seed=seed_sequence, **params)
+    return variant, run, float(best), evaluations, time.perf_counter() - start, curve
+
+
+def run_experiment(runs=30, variants=("ABC", "AEABC"), seed=0, workers=None,
+                   output="comparison_curves.jsonl", **params):
+    """
+    Runs R independent trials of every variant on a process pool.
+
+    Run r of every variant uses the same child of SeedSequence(seed).spawn(runs),
+    so the variants are compared on common random numbers and any run can be
+    reproduced on its own. Each finished run is appended to output as one JSON
+    line (with its convergence curve) as soon as it arrives; only the final
+    values and a running sum of the curves are kept in memory.
+
+    Args:
+        runs (int): Independent runs per variant
+        variants (tuple): Keys of RUNNERS to compare
+        seed (int): Root seed of the experiment
+        workers (int): Pool size (None = os.cpu_count())
+        output (str): Path of the JSON-lines file receiving per-run results
+        **params: Forwarded to every run function (e.g. max_iterations=200)
+
+    Returns:
+        dict: variant -> mean/median/best/worst/std of the final value, mean
+            evaluations, mean and total run time and the mean convergence curve
+    """
+    children = np.random.SeedSequence(seed).spawn(runs)
+    tasks = [(variant, r, children[r], params) for r in range(runs) for variant in variants]
+    finals = {variant: np.full(runs, np.nan) for variant in variants}
+    evaluations = {variant: np.zeros(runs, dtype=np.int64) for variant in variants}
+    times = {variant: np.zeros(runs) for variant in variants}
+    curve_sums = {}
+
+    start = time.perf_counter()
+    with mp.get_context().Pool(workers) as pool, open(output, "w") as out:
+        chunksize = max(1, len(tasks) // (4 * (workers or mp.cpu_count())))
+        for variant, run, best, evals, elapsed, curve in pool.imap_unordered(_run_one, tasks, chunksize):
+            out.write(json.dumps({
+                "variant": variant, "run": run, "seed": seed, "best": best,
+                "evaluations": evals, "time": elapsed, "curve": curve.tolist(),
+            }) + "\n")
+            finals[variant][run] = best
+            evaluations[variant][run] = evals
+            times[variant][run] = elapsed
+            curve_sums[variant] = curve_sums.get(variant, 0) + curve
+    wall_time = time.perf_counter() - start
+
+    summary = {}
+    for variant in variants:
+        summary[variant] = {
+            "runs": runs,
+            "mean": float(np.mean(finals[variant])),
+            "median": float(np.median(finals[variant])),
+            "best": float(np.min(finals[variant])),
+            "worst": float(np.max(finals[variant])),
+            "std": float(np.std(finals[variant])),
+            "mean_evaluations": float(np.mean(evaluations[variant])),
+            "mean_time": float(np.mean(times[variant])),
+            "total_time": float(np.sum(times[variant])),
+            "mean_curve": (curve_sums[variant] / runs).tolist(),
+        }
+    summary["wall_time"] = wall_time
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'Variant':<8} {'Mean':>12} {'Median':>12} {'Best':>12} {'Evals':>10} {'Time/run':>10}")
+    for variant, s in summary.items():
+        if variant == "wall_time":
+            continue
+        print(f"{variant:<8} {s['mean']:>12.4g} {s['median']:>12.4g} {s['best']:>12.4g} "
+              f"{s['mean_evaluations']:>10.0f} {s['mean_time']:>9.3f}s")
+    print(f"Wall time: {summary['wall_time']:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="So sánh ABC và AEABC qua nhiều lần chạy độc lập")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--output", default="comparison_curves.jsonl")
+    parser.add_argument("--summary", default="comparison_summary.json")
+    args = parser.parse_args()
+
+    summary = run_experiment(runs=args.runs, seed=args.seed, workers=args.workers,
+                             output=args.output, max_iterations=args.iterations)
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+    print_summary(summary)
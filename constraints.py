@@ -0,0 +1,276 @@
+import math
+
+import numpy as np
+
+from abc_core import fitness_weights
+from selection import roulette_wheel
+
+# ==========================================
+# Constraint handling: Deb's feasibility rules / epsilon-constraint ordering
+# ==========================================
+# A solution is scored by (f, phi): objective value f and total violation
+# phi = sum_c max(0, g_c(x)) of the constraints g_c(x) <= 0. It counts as feasible
+# when phi <= epsilon (epsilon = 0 gives Deb's rules). Comparison:
+#   feasible vs feasible      -> smaller f wins
+#   feasible vs infeasible    -> the feasible one wins
+#   infeasible vs infeasible  -> smaller phi wins
+
+
+class Constraint:
+    def __init__(self, name, function, batch_function=None, cost=1.0):
+        """
+        One inequality constraint g(x) <= 0.
+
+        Args:
+            name (str): Label used in reports
+            function (func): g on one solution (float)
+            batch_function (func): Optional g on an (n, D) array
+            cost (float): Relative cost of one evaluation, constraints are
+                evaluated cheapest first
+        """
+        self.name = name
+        self.function = function
+        self.batch_function = batch_function
+        self.cost = cost
+
+
+def _violation(g):
+    """max(0, g), with nan (undefined stress, division by zero) counted as an infinite violation."""
+    return np.where(np.isnan(g), np.inf, np.maximum(g, 0.0))
+
+
+def _batch_violation(constraint, X):
+    if constraint.batch_function is not None:
+        g = constraint.batch_function(X)
+    else:
+        g = np.array([constraint.function(x) for x in X], dtype=float)
+    return _violation(g)
+
+
+def _scalar_violation(g):
+    if g > 0:
+        return g
+    return math.inf if g != g else 0.0
+
+
+class FeasibilityRules:
+    def __init__(self, constraints, epsilon=0.0, epsilon_cycles=0, cp=5.0, theta=0.2, objective_cost=1.0):
+        """
+        Acceptance strategy for abc_core.ABCOptimizer on constrained problems.
+
+        The optimizer's objective_function (and batch_function) must return the
+        plain objective f, without penalty. Candidates are scored against their
+        incumbent with the terms evaluated lazily, and a candidate stops being
+        evaluated as soon as it cannot win:
+          - incumbent feasible: f first. If f is not smaller, the candidate is
+            rejected without touching the constraints. Otherwise the
+            constraints are evaluated cheapest first until phi exceeds epsilon.
+          - incumbent infeasible: the constraints come first, cheapest first,
+            until phi is infeasible and no smaller than the incumbent's. f is
+            only computed for a winner.
+        A rejected-early candidate is reported as (inf, inf). Initial and scout
+        sources are always evaluated in full.
+
+        Epsilon-constraint ordering (Takahama and Sakai) relaxes feasibility at
+        the start: epsilon(t) = epsilon0 * (1 - t / epsilon_cycles)^cp for
+        t < epsilon_cycles and 0 afterwards. epsilon0 = epsilon, or with
+        epsilon=None the violation of the theta-quantile initial source.
+
+        Args:
+            constraints (list): Constraint objects
+            epsilon (float): Violation tolerated as feasible (None = from the initial population)
+            epsilon_cycles (int): Cycles over which epsilon decays to 0 (0 = constant)
+            cp (float): Decay exponent
+            theta (float): Quantile of the initial violations used when epsilon is None
+            objective_cost (float): Relative cost of one objective evaluation, for
+                the work counters
+        """
+        self.constraints = sorted(constraints, key=lambda c: c.cost)
+        self.epsilon0 = epsilon
+        self.epsilon = 0.0 if epsilon is None else epsilon
+        self.epsilon_cycles = epsilon_cycles
+        self.cp = cp
+        self.theta = theta
+        self.objective_cost = objective_cost
+
+        # Instrumentation, in terms (objective or one constraint) and in relative cost
+        self.candidates = 0
+        self.short_circuits = 0
+        self.terms_evaluated = 0
+        self.terms_skipped = 0
+        self.work_evaluated = 0.0
+        self.work_skipped = 0.0
+
+    def update(self, optimizer):
+        """Set epsilon for the coming cycle."""
+        if self.epsilon0 is None:
+            finite = optimizer.violation[np.isfinite(optimizer.violation)]
+            self.epsilon0 = float(np.quantile(finite, self.theta)) if len(finite) else 0.0
+        if self.epsilon_cycles <= 0:
+            self.epsilon = self.epsilon0
+        elif optimizer.cycle < self.epsilon_cycles:
+            self.epsilon = self.epsilon0 * (1.0 - optimizer.cycle / self.epsilon_cycles) ** self.cp
+        else:
+            self.epsilon = 0.0
+
+    def _count(self, objective_done, constraints_done):
+        """Book one candidate that computed the objective (bool) and the first constraints_done constraints."""
+        skipped = self.constraints[constraints_done:]
+        self.candidates += 1
+        self.terms_evaluated += objective_done + constraints_done
+        self.terms_skipped += (not objective_done) + len(skipped)
+        self.work_evaluated += objective_done * self.objective_cost + sum(c.cost for c in self.constraints[:constraints_done])
+        self.work_skipped += (not objective_done) * self.objective_cost + sum(c.cost for c in skipped)
+        if objective_done + constraints_done < 1 + len(self.constraints):
+            self.short_circuits += 1
+
+    def evaluate(self, func, x, incumbent=None):
+        """(f, phi) of x against incumbent = (f, phi), or in full when incumbent is None."""
+        epsilon = self.epsilon
+        if incumbent is None:
+            f = func(x)
+            phi = 0.0
+            for constraint in self.constraints:
+                phi += _scalar_violation(constraint.function(x))
+            self._count(True, len(self.constraints))
+            return f, phi
+
+        incumbent_f, incumbent_phi = incumbent
+        incumbent_feasible = incumbent_phi <= epsilon
+        f = None
+        if incumbent_feasible:
+            f = func(x)
+            if not f < incumbent_f:
+                self._count(True, 0)
+                return np.inf, np.inf
+
+        phi = 0.0
+        for c, constraint in enumerate(self.constraints):
+            phi += _scalar_violation(constraint.function(x))
+            if phi > epsilon and (incumbent_feasible or phi >= incumbent_phi):
+                self._count(f is not None, c + 1)
+                return np.inf, np.inf
+
+        if f is None:
+            f = func(x)
+        self._count(True, len(self.constraints))
+        return f, phi
+
+    def evaluate_batch(self, func_batch, X, incumbents=None):
+        """Batched evaluate: each term is computed on the rows still able to win, in one call."""
+        n = len(X)
+        m = len(self.constraints)
+        if incumbents is None:
+            f = np.asarray(func_batch(X), dtype=float)
+            phi = sum((_batch_violation(constraint, X) for constraint in self.constraints), np.zeros(n))
+            self.candidates += n
+            self.terms_evaluated += n * (1 + m)
+            self.work_evaluated += n * (self.objective_cost + sum(c.cost for c in self.constraints))
+            return f, phi
+
+        epsilon = self.epsilon
+        f = np.full(n, np.inf)
+        phi = np.zeros(n)
+        done = np.zeros(n, dtype=int)
+        incumbent_f, incumbent_phi = incumbents
+        incumbent_feasible = incumbent_phi <= epsilon
+        alive = np.ones(n, dtype=bool)
+
+        # Objective first where the incumbent is feasible
+        has_f = incumbent_feasible.copy()
+        rows = np.flatnonzero(has_f)
+        if len(rows):
+            f[rows] = func_batch(X[rows])
+            alive[rows[~(f[rows] < incumbent_f[rows])]] = False
+
+        for constraint in self.constraints:
+            rows = np.flatnonzero(alive)
+            if len(rows) == 0:
+                break
+            phi[rows] += _batch_violation(constraint, X[rows])
+            done[rows] += 1
+            lost = (phi[rows] > epsilon) & (incumbent_feasible[rows] | (phi[rows] >= incumbent_phi[rows]))
+            alive[rows[lost]] = False
+
+        # Deferred objective of the winners against infeasible incumbents
+        rows = np.flatnonzero(alive & ~has_f)
+        if len(rows):
+            f[rows] = func_batch(X[rows])
+            has_f[rows] = True
+
+        costs = np.cumsum([0.0] + [c.cost for c in self.constraints])
+        evaluated = int(np.count_nonzero(has_f)) + int(done.sum())
+        total = n * (1 + m)
+        self.candidates += n
+        self.terms_evaluated += evaluated
+        self.terms_skipped += total - evaluated
+        work = float(np.count_nonzero(has_f) * self.objective_cost + costs[done].sum())
+        self.work_evaluated += work
+        self.work_skipped += n * (self.objective_cost + costs[-1]) - work
+        self.short_circuits += int(np.count_nonzero(has_f + done < 1 + m))
+
+        f[~alive] = np.inf
+        phi[~alive] = np.inf
+        return f, phi
+
+    def feasible(self, violation):
+        return violation <= self.epsilon
+
+    def improves(self, fitness, violation, incumbent_fitness, incumbent_violation):
+        """Deb's rules with feasibility phi <= epsilon (works elementwise on arrays)."""
+        feasible = violation <= self.epsilon
+        incumbent_feasible = incumbent_violation <= self.epsilon
+        return np.where(feasible & incumbent_feasible, fitness < incumbent_fitness,
+                        np.where(feasible | incumbent_feasible, feasible, violation < incumbent_violation))
+
+    def order(self, fitness, violation):
+        """Indices from best to worst: feasible by f, then infeasible by phi (row by row for 2-D arrays)."""
+        feasible = violation <= self.epsilon
+        return np.lexsort((np.where(feasible, fitness, violation), ~feasible))
+
+    def snapshot(self):
+        """Counters as a plain dict."""
+        total_terms = self.terms_evaluated + self.terms_skipped
+        total_work = self.work_evaluated + self.work_skipped
+        return {
+            "candidates": self.candidates,
+            "short_circuits": self.short_circuits,
+            "terms_evaluated": self.terms_evaluated,
+            "terms_skipped": self.terms_skipped,
+            "skipped_term_fraction": self.terms_skipped / total_terms if total_terms else 0.0,
+            "skipped_work_fraction": self.work_skipped / total_work if total_work else 0.0,
+            "epsilon": self.epsilon,
+        }
+
+
+class FeasibilityRoulette:
+    def __init__(self, rules):
+        """
+        Onlooker probabilities of the constrained ABC (Karaboga and Akay, 2011).
+
+        Feasible sources get 0.5 + 0.5 * fit_i / sum(fit) with fit = 1 / (1 + f)
+        (1 + |f| for f < 0), infeasible ones 0.5 * (1 - phi_i / sum(phi)), so any
+        feasible source outweighs every infeasible one. Feasibility follows the
+        current epsilon of rules.
+        """
+        self.rules = rules
+
+    def probabilities(self, fitness, violation):
+        if np.ndim(fitness) == 2:
+            # One row per colony
+            return np.array([self.probabilities(f, v) for f, v in zip(fitness, violation)])
+        feasible = self.rules.feasible(violation)
+        weights = np.zeros(len(fitness))
+        if feasible.any():
+            fit = fitness_weights(fitness[feasible])
+            weights[feasible] = 0.5 + 0.5 * fit / fit.sum()
+        finite = ~feasible & np.isfinite(violation)
+        if finite.any():
+            total = violation[finite].sum()
+            weights[finite] = 0.5 * (1.0 - violation[finite] / total) if total > 0 else 0.5
+        if weights.sum() == 0:
+            return np.full(len(fitness), 1.0 / len(fitness))
+        return weights / weights.sum()
+
+    def select(self, fitness, violation, size, rng):
+        return roulette_wheel(self.probabilities(fitness, violation), size, rng)
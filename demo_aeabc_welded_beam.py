@@ -1,7 +1,10 @@
 import numpy as np
-import random
 import math
 
+from abc_core import ABCOptimizer, DistanceGate, PartnerStep, ResetMostExhausted
+from constraints import Constraint, FeasibilityRoulette, FeasibilityRules
+from telemetry import Telemetry, print_every
+
 # --- CẤU HÌNH BÀI TOÁN DẦM HÀN (WELDED BEAM DESIGN) ---
 # Biến số: x1(h), x2(l), x3(t), x4(b)
 # Phạm vi biến:
@@ -24,31 +27,53 @@ def welded_beam_cost(x):
     cost = 1.10471 * (h**2) * l + 0.04811 * t * b * (14.0 + l)
     return cost
 
-def check_constraints(x):
+# --- Từng ràng buộc g(x) <= 0 ---
+def g_tau(x):
+    # Ứng suất cắt của mối hàn (đắt nhất: nhiều phép căn)
     h, l, t, b = x[0], x[1], x[2], x[3]
-    
-    # Tính toán các thông số chịu lực
     tau_prime = P / (math.sqrt(2) * h * l)
     M = P * (L + l / 2)
     R = math.sqrt((l**2) / 4 + ((h + t) / 2)**2)
     J = 2 * (math.sqrt(2) * h * l * ((l**2) / 4 + ((h + t) / 2)**2))
     tau_double_prime = (M * R) / J
     tau = math.sqrt(tau_prime**2 + 2 * tau_prime * tau_double_prime * (l / (2 * R)) + tau_double_prime**2)
+    return tau - TauMax
+
+def g_sigma(x):
+    # Ứng suất uốn của dầm
+    t, b = x[2], x[3]
     sigma = (6 * P * L) / (b * (t**2))
+    return sigma - SigmaMax
+
+def g_h_b(x):
+    return x[0] - x[3]
+
+def g_delta(x):
+    # Độ võng đầu dầm
+    t, b = x[2], x[3]
     delta = (4 * P * (L**3)) / (E * (t**3) * b)
+    return delta - DeltaMax
+
+def g_buckling(x):
+    # Tải trọng tới hạn mất ổn định Pc
+    t, b = x[2], x[3]
     Pc = (4.013 * E * math.sqrt((t**2 * b**6) / 36) / (L**2)) * (1 - (t / (2 * L)) * math.sqrt(E / (4 * G)))
+    return P - Pc
+
+def g_h_min(x):
+    return 0.125 - x[0]
 
-    # Các ràng buộc (g(x) <= 0)
-    g1 = tau - TauMax
-    g2 = sigma - SigmaMax
-    g3 = h - b
-    g4 = delta - DeltaMax
-    g5 = P - Pc
-    g6 = 0.125 - h
-    g7 = 1.10471 * h**2 * l + 0.04811 * t * b * (14.0 + l) - 5.0 # Ràng buộc chi phí biên (ví dụ)
+def g_cost(x):
+    # Ràng buộc chi phí biên (ví dụ)
+    h, l, t, b = x[0], x[1], x[2], x[3]
+    return 1.10471 * h**2 * l + 0.04811 * t * b * (14.0 + l) - 5.0
+
+# Thứ tự g1..g7 như trong báo cáo
+CONSTRAINT_FUNCTIONS = [g_tau, g_sigma, g_h_b, g_delta, g_buckling, g_h_min, g_cost]
 
+def check_constraints(x):
     # Tính tổng mức độ vi phạm (Penalty)
-    violations = [max(0, g) for g in [g1, g2, g3, g4, g5, g6, g7]]
+    violations = [max(0, g(x)) for g in CONSTRAINT_FUNCTIONS]
     return sum(violations)
 
 def fitness_function(x):
@@ -57,116 +82,140 @@ def fitness_function(x):
     # Nếu vi phạm ràng buộc, cộng thêm một giá trị phạt cực lớn
     return cost + 100000 * penalty
 
+# --- PHIÊN BẢN VECTOR HÓA (đánh giá cả quần thể trong một lần gọi NumPy) ---
+def _safe_divide(num, den):
+    # Chia an toàn: mẫu bằng 0 (h, l, t hoặc b = 0) cho kết quả +inf thay vì lỗi/cảnh báo
+    out = np.full(np.broadcast(num, den).shape, np.inf)
+    np.divide(num, den, out=out, where=(den != 0))
+    return out
+
+def welded_beam_cost_batch(X):
+    X = np.atleast_2d(X)
+    h, l, t, b = X[:, 0], X[:, 1], X[:, 2], X[:, 3]
+    return 1.10471 * (h**2) * l + 0.04811 * t * b * (14.0 + l)
+
+def g_tau_batch(X):
+    h, l, t = X[:, 0], X[:, 1], X[:, 2]
+    tau_prime = _safe_divide(P, np.sqrt(2) * h * l)
+    M = P * (L + l / 2)
+    R = np.sqrt((l**2) / 4 + ((h + t) / 2)**2)
+    J = 2 * (np.sqrt(2) * h * l * ((l**2) / 4 + ((h + t) / 2)**2))
+    tau_double_prime = _safe_divide(M * R, J)
+    with np.errstate(invalid="ignore"):
+        # inf * 0 khi R = 0 cho nan, coi như vi phạm vô hạn
+        tau = np.sqrt(tau_prime**2 + 2 * tau_prime * tau_double_prime * _safe_divide(l, 2 * R) + tau_double_prime**2)
+    return tau - TauMax
+
+def g_sigma_batch(X):
+    t, b = X[:, 2], X[:, 3]
+    return _safe_divide(6 * P * L, b * (t**2)) - SigmaMax
+
+def g_h_b_batch(X):
+    return X[:, 0] - X[:, 3]
+
+def g_delta_batch(X):
+    t, b = X[:, 2], X[:, 3]
+    return _safe_divide(4 * P * (L**3), E * (t**3) * b) - DeltaMax
+
+def g_buckling_batch(X):
+    t, b = X[:, 2], X[:, 3]
+    Pc = (4.013 * E * np.sqrt((t**2 * b**6) / 36) / (L**2)) * (1 - (t / (2 * L)) * math.sqrt(E / (4 * G)))
+    return P - Pc
+
+def g_h_min_batch(X):
+    return 0.125 - X[:, 0]
+
+def g_cost_batch(X):
+    return welded_beam_cost_batch(X) - 5.0
+
+CONSTRAINT_FUNCTIONS_BATCH = [g_tau_batch, g_sigma_batch, g_h_b_batch, g_delta_batch,
+                              g_buckling_batch, g_h_min_batch, g_cost_batch]
+
+def constraint_violations_batch(X):
+    """
+    Tính ma trận vi phạm ràng buộc cho quần thể X có kích thước (n, 4).
+    Trả về mảng (n, 7): cột c là max(0, g_c) của từng cá thể.
+    """
+    X = np.atleast_2d(X)
+    g = np.stack([g_batch(X) for g_batch in CONSTRAINT_FUNCTIONS_BATCH], axis=1)
+    g[np.isnan(g)] = np.inf
+    return np.maximum(g, 0.0)
+
+# Ràng buộc cho xử lý theo quy tắc khả thi (constraints.py), cost = chi phí tương đối
+# ước lượng theo số phép toán; được đánh giá từ rẻ đến đắt
+WELDED_BEAM_CONSTRAINTS = [
+    Constraint("h - b", g_h_b, g_h_b_batch, cost=1),
+    Constraint("h >= 0.125", g_h_min, g_h_min_batch, cost=1),
+    Constraint("sigma", g_sigma, g_sigma_batch, cost=2),
+    Constraint("delta", g_delta, g_delta_batch, cost=2),
+    Constraint("cost <= 5", g_cost, g_cost_batch, cost=3),
+    Constraint("Pc", g_buckling, g_buckling_batch, cost=4),
+    Constraint("tau", g_tau, g_tau_batch, cost=10),
+]
+
+def evaluate_population(X):
+    """
+    Đánh giá cả quần thể (n, 4) trong một lần: trả về (chi phí, ma trận vi phạm, fitness có phạt).
+    Cho kết quả giống welded_beam_cost, check_constraints và fitness_function trên từng hàng.
+    """
+    costs = welded_beam_cost_batch(X)
+    violations = constraint_violations_batch(X)
+    fitness = costs + 100000 * violations.sum(axis=1)
+    return costs, violations, fitness
+
+def fitness_function_batch(X):
+    return evaluate_population(X)[2]
+
 # --- THUẬT TOÁN AEABC ---
-def run_aeabc():
-    # Tham số thuật toán
-    NP = 50           # Số lượng ong (Population Size)
-    MAX_ITER = 200    # Số vòng lặp
-    LIMIT = 100       # Giới hạn bỏ nguồn thức ăn
-    
-    # Khởi tạo quần thể
-    foods = np.zeros((NP, PROBLEM_SIZE))
-    for i in range(NP):
-        for j in range(PROBLEM_SIZE):
-            foods[i][j] = LB[j] + random.random() * (UB[j] - LB[j])
-            
-    f = np.array([fitness_function(ind) for ind in foods])
-    trial = np.zeros(NP)
-    
-    best_ind = np.copy(foods[0])
-    best_val = f[0]
-
-    for it in range(MAX_ITER):
-        
-        # --- Giai đoạn Ong Thợ (Employed Bees) ---
-        for i in range(NP):
-            # AEABC Logic: Chọn k và tính khoảng cách
-            k = i
-            while k == i: k = random.randint(0, NP-1)
-            
-            dist = np.linalg.norm(foods[i] - foods[k])
-            Pd = math.exp(-1.0/dist) if dist > 0 else 0
-            
-            # Chỉ tìm kiếm nếu thỏa mãn điều kiện AEABC
-            if random.random() > Pd:
-                j = random.randint(0, PROBLEM_SIZE-1)
-                phi = random.uniform(-1, 1)
-                
-                # Tạo giải pháp mới
-                v = np.copy(foods[i])
-                v[j] = foods[i][j] + phi * (foods[i][j] - foods[k][j])
-                
-                # Giới hạn biên
-                v[j] = max(LB[j], min(UB[j], v[j]))
-                
-                score = fitness_function(v)
-                
-                if score < f[i]:
-                    foods[i] = v
-                    f[i] = score
-                    trial[i] = 0
-                else:
-                    trial[i] += 1
-            else:
-                pass # Bỏ qua tìm kiếm (Exploration state)
-
-        # --- Tính xác suất ---
-        mean_f = np.mean(f)
-        if mean_f == 0: mean_f = 0.0001
-        fitness_ratio = 1.0 / (1.0 + f)
-        prob = fitness_ratio / np.sum(fitness_ratio)
-        
-        # --- Giai đoạn Ong Quan Sát (Onlooker Bees) ---
-        t = 0
-        m = 0
-        while m < NP:
-            if random.random() < prob[t]:
-                m += 1
-                i = t # Ong quan sát chọn nguồn thức ăn t
-                
-                # AEABC Logic lặp lại
-                k = i
-                while k == i: k = random.randint(0, NP-1)
-                dist = np.linalg.norm(foods[i] - foods[k])
-                Pd = math.exp(-1.0/dist) if dist > 0 else 0
-                
-                if random.random() > Pd:
-                    j = random.randint(0, PROBLEM_SIZE-1)
-                    phi = random.uniform(-1, 1)
-                    v = np.copy(foods[i])
-                    v[j] = foods[i][j] + phi * (foods[i][j] - foods[k][j])
-                    v[j] = max(LB[j], min(UB[j], v[j]))
-                    
-                    score = fitness_function(v)
-                    if score < f[i]:
-                        foods[i] = v
-                        f[i] = score
-                        trial[i] = 0
-                    else:
-                        trial[i] += 1
-            t += 1
-            if t >= NP: t = 0
-
-        # --- Giai đoạn Ong Trinh Sát (Scout Bees) ---
-        max_trial_idx = np.argmax(trial)
-        if trial[max_trial_idx] > LIMIT:
-            for j in range(PROBLEM_SIZE):
-                foods[max_trial_idx][j] = LB[j] + random.random() * (UB[j] - LB[j])
-            f[max_trial_idx] = fitness_function(foods[max_trial_idx])
-            trial[max_trial_idx] = 0
-
-        # Cập nhật kết quả tốt nhất
-        min_f = np.min(f)
-        if min_f < best_val:
-            best_val = min_f
-            best_ind = foods[np.argmin(f)]
-            
-        print(f"Iter {it+1}: Cost = {best_val:.4f}")
-
-    print("\n--- KẾT QUẢ TỐI ƯU (DẦM HÀN) ---")
-    print(f"Chi phí thấp nhất: {best_val:.4f}")
-    print(f"Thông số tối ưu [h, l, t, b]: {best_ind}")
-    print(f"Kiểm tra vi phạm ràng buộc: {check_constraints(best_ind)}")
+CONSTRAINT_HANDLING = ("penalty", "feasibility", "epsilon")
+
+def run_aeabc(seed=None, telemetry=None, NP=50, MAX_ITER=200, LIMIT=100, verbose=True, batch=False,
+              constraint_handling="penalty"):
+    """
+    Tham số thuật toán:
+    NP: số lượng ong (Population Size), MAX_ITER: số vòng lặp,
+    LIMIT: giới hạn bỏ nguồn thức ăn.
+    verbose: in kết quả cuối (tắt khi chạy nhiều lần, ví dụ trong racing_tuner.py).
+    batch: đánh giá cả pha bằng hàm theo lô trong một lần gọi.
+    constraint_handling: "penalty" (chi phí + 100000 * vi phạm), "feasibility" (quy tắc
+    khả thi của Deb) hoặc "epsilon" (epsilon-constraint, epsilon giảm dần về 0 ở nửa
+    đầu số vòng lặp). Hai chế độ sau tính ràng buộc từ rẻ đến đắt và dừng sớm khi
+    ứng viên không thể thắng nguồn thức ăn hiện tại.
+    """
+    if constraint_handling not in CONSTRAINT_HANDLING:
+        raise ValueError(f"constraint_handling must be one of {CONSTRAINT_HANDLING}, got {constraint_handling!r}")
+    # Bộ đếm/thời gian/lịch sử; in tiến trình qua listener thay vì print mỗi vòng
+    if telemetry is None:
+        telemetry = Telemetry(history_capacity=MAX_ITER)
+        telemetry.add_listener(print_every(1, "Iter {cycle}: Cost = {best:.4f}"))
+
+    # AEABC: đối tác k, chỉ tìm kiếm nếu r > Pd, giới hạn biên khi đột biến,
+    # ong trinh sát chỉ thay nguồn có bộ đếm thử lớn nhất mỗi vòng
+    if constraint_handling == "penalty":
+        objective, objective_batch, rules, selection = fitness_function, fitness_function_batch, None, None
+    else:
+        if constraint_handling == "feasibility":
+            rules = FeasibilityRules(WELDED_BEAM_CONSTRAINTS, objective_cost=2)
+        else:
+            rules = FeasibilityRules(WELDED_BEAM_CONSTRAINTS, epsilon=None, epsilon_cycles=MAX_ITER // 2,
+                                     objective_cost=2)
+        objective, objective_batch, selection = welded_beam_cost, welded_beam_cost_batch, FeasibilityRoulette(rules)
+    optimizer = ABCOptimizer(objective, PROBLEM_SIZE, (LB, UB), SN=NP, MCN=MAX_ITER, limit=LIMIT,
+                             neighbour=PartnerStep(), gate=DistanceGate(), selection=selection,
+                             acceptance=rules, scout=ResetMostExhausted(),
+                             batch_function=objective_batch if batch else None,
+                             seed=seed, telemetry=telemetry)
+    best_ind, best_val, history = optimizer.optimize()
+
+    if verbose:
+        print("\n--- KẾT QUẢ TỐI ƯU (DẦM HÀN) ---")
+        print(f"Chi phí thấp nhất: {best_val:.4f}")
+        print(f"Thông số tối ưu [h, l, t, b]: {best_ind}")
+        print(f"Kiểm tra vi phạm ràng buộc: {check_constraints(best_ind)}")
+        print(f"Thống kê: {telemetry.snapshot()}")
+        if rules is not None:
+            print(f"Xử lý ràng buộc: {rules.snapshot()}")
+    return best_ind, best_val, history
 
 if __name__ == "__main__":
     run_aeabc()
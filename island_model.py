@@ -0,0 +1,186 @@
+import functools
+import math
+import multiprocessing as mp
+import queue
+from time import perf_counter
+
+import numpy as np
+
+from sim_mimo import ArtificialBeeColony, make_sim_objective
+
+# ==========================================
+# Island-model ABC: several colonies with periodic migration
+# ==========================================
+TOPOLOGIES = ("ring", "full")
+
+
+def _neighbours(index, n_islands, topology):
+    if n_islands == 1:
+        return []
+    if topology == "ring":
+        return [(index + 1) % n_islands]
+    return [k for k in range(n_islands) if k != index]
+
+
+def _receive_migrant(colony, x, value):
+    """Replace the worst food source of colony with a migrant that beats it."""
+    worst = np.argmin(colony.fitness)
+    if value <= colony.fitness[worst]:
+        return False
+    colony.replace_source(worst, x, value)
+    return True
+
+
+def _migration(index, inboxes, neighbours, migration_interval, migrants):
+    """Telemetry listener exchanging food sources every migration_interval cycles."""
+    def listener(event, telemetry, colony=None, cycle=None, **data):
+        if event != "cycle" or (cycle + 1) % migration_interval != 0 or not neighbours:
+            return
+        emigrants = np.argsort(colony.fitness)[-migrants:]
+        message = (colony.foods[emigrants].copy(), colony.fitness[emigrants].copy())
+        for k in neighbours:
+            inboxes[k].put_nowait(message)
+        # Take whatever has arrived so far, never wait for slower islands
+        while True:
+            try:
+                X, values = inboxes[index].get_nowait()
+            except queue.Empty:
+                break
+            for x, value in zip(X, values):
+                listener.accepted += _receive_migrant(colony, x, value)
+    listener.accepted = 0
+    return listener
+
+
+def _run_island(index, n_islands, inboxes, results, objective_factory, factory_args, D, bounds,
+                MCN, migration_interval, topology, migrants, seed, colony_kwargs):
+    # Migrants are best effort: never block process exit on undelivered messages
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+    colony = ArtificialBeeColony(objective_factory(*factory_args), D, bounds, MCN=MCN,
+                                 seed=seed, **colony_kwargs)
+    migration = _migration(index, inboxes, _neighbours(index, n_islands, topology),
+                           migration_interval, migrants)
+    # Migration runs after every cycle, before the stopping criteria are checked
+    colony.telemetry.add_listener(functools.partial(migration, colony=colony))
+    colony.optimize()
+
+    results.put((index, colony.best_solution, colony.best_fitness,
+                 np.asarray(colony.fitness_history), migration.accepted, colony.stop_reason))
+
+
+def _collect(results, processes, timeout):
+    """
+    Results of every island, in island order.
+
+    Waits at most `timeout` seconds in total and fails as soon as an island
+    process has exited without reporting (e.g. the objective raised).
+    """
+    deadline = None if timeout is None else perf_counter() + timeout
+    island_results = [None] * len(processes)
+
+    def store(result):
+        island_results[result[0]] = result[1:]
+
+    while any(r is None for r in island_results):
+        wait = 1.0 if deadline is None else min(1.0, deadline - perf_counter())
+        try:
+            store(results.get(timeout=max(wait, 0.0)))
+            continue
+        except queue.Empty:
+            pass
+        # A finished island has flushed its result before exiting: drain, then check
+        while True:
+            try:
+                store(results.get_nowait())
+            except queue.Empty:
+                break
+        dead = [i for i, p in enumerate(processes) if island_results[i] is None and not p.is_alive()]
+        if dead:
+            raise RuntimeError(f"island {dead[0]} exited with code {processes[dead[0]].exitcode} "
+                               f"before reporting its result")
+        if deadline is not None and perf_counter() >= deadline:
+            raise TimeoutError(f"islands still running after {timeout} s")
+    return island_results
+
+
+def run_island_model(objective_factory, factory_args, D, bounds, islands=4, MCN=100,
+                     migration_interval=10, topology="ring", migrants=1, seed=None,
+                     timeout=None, **colony_kwargs):
+    """
+    Runs one ArtificialBeeColony per process and exchanges best food sources.
+
+    Every migration_interval cycles each island sends its `migrants` best sources to
+    its neighbours (next island for "ring", all others for "full") through a queue
+    and absorbs whatever has already arrived in its own inbox, replacing its worst
+    sources. Sending and receiving never block, so islands run at their own pace.
+
+    Each island runs ArtificialBeeColony.optimize(), migration being a telemetry
+    listener on the "cycle" event, so stopping criteria and the start/end events
+    apply per island (e.g. stopping=StoppingCriteria(...) in colony_kwargs).
+
+    Args:
+        objective_factory (func): Top-level function building the objective inside
+            each island, called as objective_factory(*factory_args)
+        factory_args (tuple): Arguments for objective_factory
+        D (int): Dimension of the problem
+        bounds (tuple): (lower_bound, upper_bound)
+        islands (int): Number of colonies / processes
+        MCN (int): Cycles per island
+        migration_interval (int): Cycles between migrations (M)
+        topology (str): "ring" or "full"
+        migrants (int): Food sources sent per migration
+        seed (int): Root seed, islands use SeedSequence(seed).spawn(islands)
+        timeout (float): Seconds to wait for all islands (None = no limit); the
+            islands are terminated and TimeoutError raised when it runs out
+        **colony_kwargs: Forwarded to ArtificialBeeColony (SN, limit, stopping, ...)
+
+    Returns:
+        tuple: (best_solution, best_fitness, per-island list of
+            (best_fitness, fitness_history, accepted_migrants, stop_reason))
+
+    Raises:
+        RuntimeError: An island process exited without reporting its result
+        TimeoutError: The islands did not finish within timeout
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"topology must be one of {TOPOLOGIES}, got {topology!r}")
+
+    ctx = mp.get_context()
+    inboxes = [ctx.Queue() for _ in range(islands)]
+    results = ctx.Queue()
+    seeds = np.random.SeedSequence(seed).spawn(islands)
+    processes = [
+        ctx.Process(target=_run_island, args=(
+            i, islands, inboxes, results, objective_factory, factory_args, D, bounds,
+            MCN, migration_interval, topology, migrants, seeds[i], colony_kwargs))
+        for i in range(islands)
+    ]
+    for p in processes:
+        p.start()
+
+    try:
+        island_results = _collect(results, processes, timeout)
+    except BaseException:
+        for p in processes:
+            p.terminate()
+        raise
+    finally:
+        for p in processes:
+            p.join()
+
+    best = max(range(islands), key=lambda i: island_results[i][1])
+    summary = [r[1:] for r in island_results]
+    return island_results[best][0], island_results[best][1], summary
+
+
+if __name__ == "__main__":
+    Nt, Nr, N_elements = 4, 4, 64
+    best_phases, max_capacity, islands = run_island_model(
+        make_sim_objective, (Nt, Nr, N_elements, 0), D=N_elements, bounds=(0, 2 * math.pi),
+        islands=4, MCN=100, migration_interval=10, topology="ring", SN=15, limit=20, seed=1)
+
+    for i, (capacity, _, accepted, _) in enumerate(islands):
+        print(f"Island {i}: {capacity:.4f} bits/s/Hz ({accepted} migrants accepted)")
+    print(f"Optimized Capacity: {max_capacity:.5f} bits/s/Hz")
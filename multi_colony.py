@@ -0,0 +1,230 @@
+import math
+
+import numpy as np
+
+from abc_core import ABCOptimizer
+from selection import distinct_partners
+from telemetry import timed_phases
+
+# ==========================================
+# R independent ABC colonies stepped as one (R, SN, D) tensor
+# ==========================================
+class ColonyStreams:
+    def __init__(self, seed_sequences, block=256):
+        """
+        Stands in for the numpy.random.Generator of the strategies, one stream per colony.
+
+        Every request covers all colonies equally: its size (or first axis) is
+        split into R consecutive parts, part r taken from colony r's stream.
+        Uniforms are drawn `block` at a time per colony and handed out in order,
+        so colony r sees the same numbers whatever R is, for one generator call
+        per colony every `block` draws instead of every request.
+
+        Args:
+            seed_sequences (list): One numpy.random.SeedSequence per colony
+            block (int): Uniforms drawn per colony at a time
+        """
+        self.generators = [np.random.default_rng(s) for s in seed_sequences]
+        self._buffer = np.empty((len(self.generators), block))
+        self._position = block
+
+    def _uniforms(self, n):
+        """The next n uniforms of every colony, shape (R, n)."""
+        out = np.empty((len(self.generators), n))
+        filled = 0
+        while filled < n:
+            if self._position == self._buffer.shape[1]:
+                for generator, row in zip(self.generators, self._buffer):
+                    generator.random(out=row)
+                self._position = 0
+            m = min(n - filled, self._buffer.shape[1] - self._position)
+            out[:, filled:filled + m] = self._buffer[:, self._position:self._position + m]
+            self._position += m
+            filled += m
+        return out
+
+    def random(self, size):
+        return self._uniforms(math.prod(np.atleast_1d(size)) // len(self.generators)).reshape(size)
+
+    def uniform(self, low, high, size):
+        return low + (high - low) * self.random(size)
+
+    def integers(self, low, high, size):
+        return low + (self.random(size) * (high - low)).astype(np.intp)
+
+
+class MultiColonyEngine(ABCOptimizer):
+    def __init__(self, batch_function, D, bounds, R, SN=20, MCN=100, limit=50, neighbour=None, gate=None,
+                 selection=None, acceptance=None, scout=None, clip=True, maximize=False, seed=None,
+                 telemetry=None):
+        """
+        Runs R independent ABC colonies with array operations.
+
+        The tensor backend of abc_core.ABCOptimizer: foods holds the R * SN
+        food sources of all colonies, colony r owning rows r * SN to
+        (r + 1) * SN - 1 (colony_foods is the (R, SN, D) view), and so do
+        fitness, violation and trial_counters. Every phase builds the
+        candidates of all colonies and evaluates them with a single
+        batch_function call; candidate evaluation and greedy selection are
+        the synchronous ABCOptimizer path.
+
+        The variant is chosen with the same strategy objects as ABCOptimizer,
+        each called once per phase for all colonies: partners and gate
+        decisions stay within a colony, and selection and scouts work row by
+        row on (R, SN) arrays. Each colony has its own limit and its own random
+        streams, one for the moves (ColonyStreams) and one for scouts. With the
+        default strategies colony r follows the same trajectory whatever R is;
+        FeasibilityRules and DistanceGate keep one epsilon schedule and one
+        refresh count for all colonies. Neighbour dimensions and steps are drawn
+        for every bee, before the gate.
+
+        Args:
+            batch_function (func): Objective on an (n, D) array returning n values
+            D (int): Dimension of the problem
+            bounds (tuple): (lower_bound, upper_bound), scalars or arrays of length D
+            R (int): Number of colonies
+            SN (int): Number of food sources per colony (at least 2)
+            MCN (int): Maximum Cycle Number
+            limit (int or array): Trials before abandonment, scalar or one per colony
+            neighbour, gate, selection, acceptance, scout: Strategies as in ABCOptimizer
+                (defaults: the ABC configuration, minimizing)
+            clip (bool): Clip candidates to the bounds
+            maximize (bool): Maximize the objective instead of minimizing it
+            seed (int): Root seed, colonies use SeedSequence(seed).spawn(R)
+            telemetry (Telemetry): Counters and phase timers summed over all colonies
+        """
+        if SN < 2:
+            raise ValueError(f"SN must be at least 2, got {SN}")
+        super().__init__(None, D, bounds, SN=R * SN, MCN=MCN, neighbour=neighbour, gate=gate,
+                         selection=selection, acceptance=acceptance, scout=scout, clip=clip,
+                         maximize=maximize, batch_function=batch_function, synchronous=True,
+                         telemetry=telemetry)
+        self.R = R
+        self.SN = SN
+        self.limit = np.broadcast_to(np.asarray(limit, dtype=float), (R,))
+        # Every colony gets a stream for its moves and one for its scouts
+        streams = [colony.spawn(2) for colony in np.random.SeedSequence(seed).spawn(R)]
+        self.rng = ColonyStreams([moves for moves, _ in streams])
+        self.scout_rngs = [np.random.default_rng(scouts) for _, scouts in streams]
+
+        self.foods[:] = self.rng.random((R * SN, D)) * (self.ub - self.lb) + self.lb
+        self.colony_foods = self.foods.reshape(R, SN, D)
+        self.best_solution = np.empty((R, D))
+        self.best_fitness = np.full(R, -np.inf if maximize else np.inf)
+        self.best_violation = np.full(R, np.inf)
+        self.history = np.empty((MCN, R))
+
+        self._offsets = np.arange(R)[:, None] * SN
+
+    def _draw_moves(self, indices):
+        """Partners within each colony, gate decisions, dimensions and steps for every bee of a phase."""
+        local = indices % self.SN
+        k = distinct_partners(local, self.SN, self.rng) + (indices - local) if self._needs_partner else None
+        search = self.gate.allows_batch(self.colony_foods, indices, k, self.rng)
+        j, phi = self.neighbour.draw(len(indices), self.D, self.rng)
+        searching = int(np.count_nonzero(search))
+        if searching < len(indices):
+            self.telemetry.skipped += len(indices) - searching
+            indices, j, phi = indices[search], j[search], phi[search]
+            k = k[search] if k is not None else None
+        return indices, k, j, phi
+
+    def employed_bees_phase(self):
+        self._search(np.arange(self.R * self.SN))
+
+    def onlooker_bees_phase(self):
+        picks = self.selection.select(self.fitness.reshape(self.R, self.SN),
+                                      self.violation.reshape(self.R, self.SN), self.SN, self.rng)
+        self._search((picks + self._offsets).ravel())
+
+    def scout_bees_phase(self):
+        exhausted = self.scout.exhausted(self.trial_counters.reshape(self.R, self.SN), self.limit[:, None])
+        if len(exhausted) == 0:
+            return
+        # Each colony redraws its own sources from its own stream
+        for r, rows in zip(*np.unique(exhausted // self.SN, return_counts=True)):
+            fresh = self.scout_rngs[r].random((rows, self.D))
+            self.foods[exhausted[exhausted // self.SN == r]] = fresh * (self.ub - self.lb) + self.lb
+        self.fitness[exhausted], self.violation[exhausted] = self.evaluate_batch(self.foods[exhausted])
+        self.gate.replaced(self.colony_foods, exhausted)
+        self.trial_counters[exhausted] = 0
+        self.telemetry.scout_resets += len(exhausted)
+
+    def _update_best(self):
+        """Best source of every colony against that colony's best so far."""
+        order = self.acceptance.order(self.fitness.reshape(self.R, self.SN),
+                                      self.violation.reshape(self.R, self.SN))
+        best = order[:, 0] + self._offsets[:, 0]
+        improved = self.acceptance.improves(self.fitness[best], self.violation[best],
+                                            self.best_fitness, self.best_violation)
+        self.best_fitness[improved] = self.fitness[best[improved]]
+        self.best_violation[improved] = self.violation[best[improved]]
+        self.best_solution[improved] = self.foods[best[improved]]
+
+    def initialize(self):
+        """Evaluate the initial food sources of every colony in one call."""
+        self.fitness[:], self.violation[:] = self.evaluate_batch(self.foods)
+        self.gate.reset(self.colony_foods)
+        self._update_best()
+
+    def run_cycle(self):
+        """One employed -> onlooker -> scout cycle for all colonies."""
+        self.acceptance.update(self)
+        timed_phases(self.telemetry, (("employed", self.employed_bees_phase),
+                                      ("onlooker", self.onlooker_bees_phase),
+                                      ("scout", self.scout_bees_phase)))
+        self._update_best()
+        if self.cycle < len(self.history):
+            self.history[self.cycle] = self.best_fitness
+        self.cycle += 1
+        leader = self.acceptance.order(self.best_fitness, self.best_violation)[0]
+        self.telemetry.end_cycle(self.best_fitness[leader])
+
+    def optimize(self):
+        """
+        Returns:
+            tuple: (best_solution (R, D), best_fitness (R,), history (MCN, R))
+        """
+        self.initialize()
+        while self.cycle < self.MCN:
+            self.run_cycle()
+        return self.best_solution, self.best_fitness, self.history
+
+if __name__ == "__main__":
+    import time
+
+    from demo_aeabc_welded_beam import LB, UB, fitness_function_batch
+    from sim_mimo import ArtificialBeeColony
+
+    # 1. Sphere: R colonies in one engine vs a loop of ArtificialBeeColony.optimize
+    R, SN, MCN, D = 200, 10, 100, 5
+
+    def sphere_batch(X):
+        return np.sum(X**2, axis=1)
+
+    start = time.perf_counter()
+    engine = MultiColonyEngine(sphere_batch, D, (-5, 5), R=R, SN=SN, MCN=MCN, limit=20, seed=0)
+    _, best, _ = engine.optimize()
+    tensor_time = time.perf_counter() - start
+    tensor_rate = engine.telemetry.evaluations / tensor_time
+
+    looped = 10
+    start = time.perf_counter()
+    evaluations = 0
+    for r in range(looped):
+        colony = ArtificialBeeColony(lambda x: -np.sum(x**2), D, (-5, 5), SN=SN, MCN=MCN, limit=20, seed=r)
+        colony.optimize()
+        evaluations += colony.telemetry.evaluations
+    loop_rate = evaluations / (time.perf_counter() - start)
+
+    print(f"Sphere, {R} bầy: trung vị tốt nhất {np.median(best):.3e}, {tensor_rate:,.0f} đánh giá/s "
+          f"(vòng lặp ArtificialBeeColony: {loop_rate:,.0f}/s, x{tensor_rate / loop_rate:.0f})")
+
+    # 2. Welded beam: sensitivity of the result to limit
+    limits = np.repeat([5, 20, 50, 100], 25)
+    engine = MultiColonyEngine(fitness_function_batch, 4, (LB, UB), R=len(limits), SN=20, MCN=500,
+                               limit=limits, seed=1)
+    _, best, _ = engine.optimize()
+    for limit in np.unique(limits):
+        values = best[limits == limit]
+        print(f"Dầm hàn, limit={limit:>3}: trung bình {values.mean():.5f}, tốt nhất {values.min():.5f}")
@@ -0,0 +1,122 @@
+import multiprocessing as mp
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# ==========================================
+# Process-pool objective evaluation over shared-memory populations
+# ==========================================
+# Per-worker state, filled once by _init_worker when the pool starts
+_worker_objective = None
+_worker_arrays = {}
+_worker_segments = []
+
+# SharedMemory(track=False) keeps attaching workers out of the resource tracker (3.13+)
+_SUPPORTS_TRACK = sys.version_info >= (3, 13)
+
+
+def _attach(specs):
+    arrays = {}
+    segments = []
+    for name, (shm_name, shape, dtype) in specs.items():
+        # The parent owns (and unlinks) every segment, workers only attach
+        segment = shared_memory.SharedMemory(name=shm_name, track=False) \
+            if _SUPPORTS_TRACK else shared_memory.SharedMemory(name=shm_name)
+        segments.append(segment)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+    return arrays, segments
+
+
+def _init_worker(objective, objective_factory, factory_args, specs):
+    global _worker_objective, _worker_arrays, _worker_segments
+    if objective_factory is not None:
+        # Heavy objective state (e.g. channel matrices) is built once per worker
+        objective = objective_factory(*factory_args)
+    _worker_objective = objective
+    _worker_arrays, _worker_segments = _attach(specs)
+
+
+def _evaluate_slice(task):
+    name, start, stop = task
+    rows = _worker_arrays[name]
+    values = _worker_arrays[name + "_values"]
+    for r in range(start, stop):
+        values[r] = _worker_objective(rows[r])
+
+
+class SharedMemoryPoolEvaluator:
+    def __init__(self, objective_function, buffers, workers=2, objective_factory=None,
+                 factory_args=(), chunks_per_worker=4, dtype=np.float64):
+        """
+        Evaluates rows of shared-memory arrays on a process pool.
+
+        Every buffer (e.g. "foods", "candidates") lives in a SharedMemory segment
+        together with a "<name>_values" result vector. Workers receive only
+        (name, start, stop) tasks and read rows through zero-copy views, so no
+        population array is pickled after start-up.
+
+        Args:
+            objective_function (func): Objective applied to one row. Pickled once
+                per worker at start-up (ignored when objective_factory is given)
+            buffers (dict): name -> (rows, D) capacity of every shared array
+            workers (int): Number of worker processes
+            objective_factory (func): Optional top-level function building the
+                objective inside each worker, called as objective_factory(*factory_args)
+            factory_args (tuple): Arguments for objective_factory
+            chunks_per_worker (int): Tasks per worker for one evaluation call
+            dtype (np.dtype): Storage type of the row buffers (float64 or float32);
+                result vectors are always float64
+        """
+        self.workers = workers
+        self.chunks_per_worker = chunks_per_worker
+        self._segments = []
+        self.arrays = {}
+        specs = {}
+        for name, (rows, D) in buffers.items():
+            for key, shape, key_dtype in ((name, (rows, D), np.dtype(dtype)),
+                                          (name + "_values", (rows,), np.dtype(np.float64))):
+                nbytes = max(int(np.prod(shape)) * key_dtype.itemsize, 1)
+                segment = shared_memory.SharedMemory(create=True, size=nbytes)
+                self._segments.append(segment)
+                self.arrays[key] = np.ndarray(shape, dtype=key_dtype, buffer=segment.buf)
+                specs[key] = (segment.name, shape, key_dtype)
+
+        self.pool = mp.get_context().Pool(
+            workers, initializer=_init_worker,
+            initargs=(objective_function if objective_factory is None else None,
+                      objective_factory, factory_args, specs))
+
+    def evaluate_rows(self, name, n):
+        """
+        Evaluate the first n rows of shared buffer name.
+
+        Returns:
+            np.array: View on the shared result vector, valid until the next call
+        """
+        n_chunks = min(n, self.workers * self.chunks_per_worker)
+        bounds = np.linspace(0, n, n_chunks + 1).astype(int)
+        tasks = [(name, bounds[c], bounds[c + 1]) for c in range(n_chunks)]
+        self.pool.map(_evaluate_slice, tasks)
+        return self.arrays[name + "_values"][:n]
+
+    def evaluate(self, X, name="candidates"):
+        """Copy X into shared buffer name and evaluate it."""
+        n = X.shape[0]
+        self.arrays[name][:n] = X
+        return self.evaluate_rows(name, n).copy()
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.arrays = {}
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
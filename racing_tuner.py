@@ -0,0 +1,293 @@
+import argparse
+import itertools
+import json
+import math
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from ABC import run_abc
+from AEABC import run_aeabc
+from demo_aeabc_welded_beam import run_aeabc as run_welded_beam
+from sim_mimo import ArtificialBeeColony, SIM_MIMO_System
+from telemetry import Telemetry
+
+# ==========================================
+# Successive-halving race over SN and limit, MCN read from the convergence curves
+# ==========================================
+# A run function takes a config with SN, limit and the cycle budget `cycles`
+# and returns (best-so-far value after every cycle, evaluations used).
+
+
+def _tune_abc(config, seed_sequence):
+    _, _, history, evaluations = run_abc(seed=seed_sequence, num_employed_bees=config["SN"],
+                                         num_onlooker_bees=config["SN"], max_iterations=config["cycles"],
+                                         limit=config["limit"])
+    return history, evaluations
+
+
+def _tune_aeabc(config, seed_sequence):
+    _, _, history, evaluations = run_aeabc(seed=seed_sequence, num_employed_bees=config["SN"],
+                                           num_onlooker_bees=config["SN"], max_iterations=config["cycles"],
+                                           limit=config["limit"])
+    return history, evaluations
+
+
+def _tune_welded_beam(config, seed_sequence):
+    telemetry = Telemetry(history_capacity=config["cycles"])
+    _, _, history = run_welded_beam(seed=seed_sequence, telemetry=telemetry, NP=config["SN"],
+                                    MAX_ITER=config["cycles"], LIMIT=config["limit"], verbose=False)
+    return history, telemetry.evaluations
+
+
+def _tune_sim(config, seed_sequence):
+    # Every instance is its own channel realization
+    channel_seed, optimizer_seed = seed_sequence.spawn(2)
+    system = SIM_MIMO_System(4, 4, 16, seed=channel_seed)
+    colony = ArtificialBeeColony(system.calculate_spectral_efficiency, system.D, (0, 2 * math.pi),
+                                 SN=config["SN"], MCN=config["cycles"], limit=config["limit"],
+                                 seed=optimizer_seed)
+    _, _, history = colony.optimize()
+    return history, colony.telemetry.evaluations
+
+
+# problem -> (run function, maximize, default search space)
+PROBLEMS = {
+    "abc": (_tune_abc, False, {"SN": (10, 25, 50, 100), "limit": (10, 25, 50, 100), "MCN": (50, 100, 200)}),
+    "aeabc": (_tune_aeabc, False, {"SN": (10, 25, 50, 100), "limit": (10, 25, 50, 100), "MCN": (50, 100, 200)}),
+    "welded_beam": (_tune_welded_beam, False, {"SN": (10, 25, 50), "limit": (20, 50, 100), "MCN": (100, 200, 400)}),
+    "sim": (_tune_sim, True, {"SN": (10, 20, 30, 50), "limit": (10, 20, 50), "MCN": (50, 100, 200)}),
+}
+
+
+def _run_one(task):
+    problem, index, budget, instance, seed_sequence = task
+    start = time.perf_counter()
+    history, evaluations = PROBLEMS[problem][0](budget, seed_sequence)
+    return index, instance, np.asarray(history, dtype=float), int(evaluations), time.perf_counter() - start
+
+
+def mean_ranks(values, maximize=False):
+    """
+    Mean rank of every configuration over the instances (1 = best, ties averaged).
+
+    Args:
+        values (np.array): (configs, instances) final values
+        maximize (bool): Larger values are better
+
+    Returns:
+        np.array: (configs,) mean ranks
+    """
+    scores = -values if maximize else values
+    ranks = np.empty_like(scores, dtype=float)
+    for column in range(scores.shape[1]):
+        order = np.argsort(scores[:, column], kind="stable")
+        sorted_scores = scores[order, column]
+        position = 0
+        while position < len(order):
+            tie = position + 1
+            while tie < len(order) and sorted_scores[tie] == sorted_scores[position]:
+                tie += 1
+            ranks[order[position:tie], column] = (position + tie + 1) / 2
+            position = tie
+    return ranks.mean(axis=1)
+
+
+def sign_test(values, other, maximize=False):
+    """
+    One-sided paired sign test that `values` is worse than `other` on common instances.
+
+    Returns:
+        float: p-value (ties are dropped)
+    """
+    worse = values < other if maximize else values > other
+    better = values > other if maximize else values < other
+    n, k = int(np.count_nonzero(worse | better)), int(np.count_nonzero(worse))
+    if n == 0:
+        return 1.0
+    return sum(math.comb(n, i) for i in range(k, n + 1)) / 2**n
+
+
+def successive_halving(problem="abc", space=None, instances=5, eta=3, min_fraction=1 / 9, alpha=0.05,
+                       seed=0, workers=None, output="tuning_runs.jsonl"):
+    """
+    Race the (SN, limit) configurations of a grid, then pick MCN from their
+    convergence curves.
+
+    MCN is not raced: with the same seed, runs that differ only in MCN follow
+    the same trajectory, so one run of max(MCN) cycles answers every MCN at
+    once with history[MCN - 1]. All configurations of a rung run for the same
+    number of cycles, max(MCN) * fraction, on the same `instances` seeds
+    (children of SeedSequence(seed), common random numbers across
+    configurations). The first rung uses min_fraction (rounded up to a power
+    of 1/eta). After a rung the configurations are ranked on every instance by
+    their final value, and only the best 1/eta by mean rank go on. Of those, any
+    configuration that loses to the rung leader on a one-sided sign test at level
+    alpha is dropped as well. The fraction grows by eta per rung up to 1, so
+    only the last survivors run max(MCN) cycles. The runs restart from scratch
+    at every rung (the run functions cannot resume), and all runs of a rung
+    share one process pool.
+
+    The last rung turns every survivor into one candidate per MCN, valued at
+    history[MCN - 1]. A larger MCN always helps a little, so the tuner returns
+    the cheapest candidate (smallest SN * MCN, then best mean rank) that the
+    sign test cannot tell apart from the best one.
+
+    Args:
+        problem (str): Key of PROBLEMS
+        space (dict): SN, limit and MCN -> candidate values (None = the problem's default)
+        instances (int): Seeds every configuration is run on
+        eta (int): Keep 1/eta configurations per rung, grow the budget by eta
+        min_fraction (float): Fraction of max(MCN) cycles run by the first rung
+        alpha (float): Level of the sign test against the rung leader; it needs
+            0.5**instances < alpha (at least 5 instances at alpha=0.05)
+        seed (int): Root seed of the instances
+        workers (int): Pool size (None = os.cpu_count())
+        output (str): Path of the JSON-lines file receiving every run
+
+    Returns:
+        dict: chosen configuration and its mean value, the rungs, and the evaluations
+            used against the (estimated) evaluations of the full grid, every
+            (SN, limit, MCN) run separately
+    """
+    if problem not in PROBLEMS:
+        raise ValueError(f"problem must be one of {tuple(PROBLEMS)}, got {problem!r}")
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    if not 0.0 < min_fraction <= 1.0:
+        raise ValueError(f"min_fraction must be in (0, 1], got {min_fraction}")
+    if not 0.0 < alpha < 1.0:
+        raise ValueError(f"alpha must be in (0, 1), got {alpha}")
+    # The smallest p-value of the sign test is 0.5**instances (every instance worse)
+    if 0.5**instances >= alpha:
+        raise ValueError(f"the sign test cannot reject at alpha={alpha} with {instances} instances, "
+                         f"use at least {math.floor(math.log2(1 / alpha)) + 1}")
+
+    _, maximize, default_space = PROBLEMS[problem]
+    space = space or default_space
+    if min(space["MCN"]) < 1:
+        raise ValueError(f"MCN values must be at least 1, got {space['MCN']}")
+    configs = [{"SN": SN, "limit": limit} for SN, limit in itertools.product(space["SN"], space["limit"])]
+    mcn_values = sorted(set(space["MCN"]))
+    max_cycles = mcn_values[-1]
+    seeds = np.random.SeedSequence(seed).spawn(instances)
+
+    n_rungs = max(1, math.floor(math.log(1 / min_fraction, eta) + 1e-9) + 1)
+    fractions = [eta ** (r - n_rungs + 1) for r in range(n_rungs)]
+    alive = np.arange(len(configs))
+    # Per configuration: evaluations and time of one max_cycles run (extrapolated until measured)
+    full_evaluations = np.zeros(len(configs))
+    full_time = np.zeros(len(configs))
+    rungs = []
+    used_evaluations, used_time = 0, 0.0
+
+    start = time.perf_counter()
+    with mp.get_context().Pool(workers) as pool, open(output, "w") as out:
+        for rung, fraction in enumerate(fractions):
+            cycles = max(1, math.ceil(max_cycles * fraction))
+            tasks = [(problem, int(index), dict(configs[index], cycles=cycles), instance, seeds[instance])
+                     for index in alive for instance in range(instances)]
+            values = np.full((len(configs), instances), np.nan)
+            curves = np.full((len(configs), instances, cycles), np.nan)
+            evaluations = np.zeros((len(configs), instances))
+            times = np.zeros((len(configs), instances))
+            chunksize = max(1, len(tasks) // (4 * (workers or mp.cpu_count())))
+            for index, instance, history, evals, elapsed in pool.imap_unordered(_run_one, tasks, chunksize):
+                out.write(json.dumps({"rung": rung, "fraction": fraction, "config": configs[index],
+                                      "cycles": cycles, "instance": instance, "value": float(history[-1]),
+                                      "evaluations": evals, "time": elapsed}) + "\n")
+                values[index, instance] = history[-1]
+                curves[index, instance, :len(history)] = history
+                evaluations[index, instance] = evals
+                times[index, instance] = elapsed
+            out.flush()
+            used_evaluations += int(evaluations.sum())
+            used_time += float(times.sum())
+
+            full_evaluations[alive] = evaluations[alive].mean(axis=1) * max_cycles / cycles
+            full_time[alive] = times[alive].mean(axis=1) * max_cycles / cycles
+
+            ranks = mean_ranks(values[alive], maximize)
+            order = alive[np.argsort(ranks, kind="stable")]
+            leader = order[0]
+            if rung < n_rungs - 1:
+                keep = order[:max(1, math.ceil(len(alive) / eta))]
+                survivors = [i for i in keep
+                             if i == leader or sign_test(values[i], values[leader], maximize) >= alpha]
+            else:
+                survivors = alive
+            rungs.append({
+                "fraction": fraction, "cycles": cycles, "configs": len(alive), "kept": len(survivors),
+                "leader": configs[leader], "leader_mean": float(values[leader].mean()),
+                "evaluations": int(evaluations.sum()),
+            })
+            alive = np.array(survivors)
+
+    # Last rung: one candidate per (survivor, MCN), valued on the convergence curve at MCN
+    candidates = [(i, MCN) for i in alive for MCN in mcn_values]
+    candidate_values = np.array([curves[i, :, MCN - 1] for i, MCN in candidates])
+    order = np.argsort(mean_ranks(candidate_values, maximize), kind="stable")
+    leader = order[0]
+    # Cheapest candidate that is not significantly worse than the leader
+    tied = [c for c in order if sign_test(candidate_values[c], candidate_values[leader], maximize) >= alpha]
+    chosen = min(tied, key=lambda c: configs[candidates[c][0]]["SN"] * candidates[c][1])
+    # The full grid runs every (SN, limit, MCN) separately
+    grid_scale = sum(mcn_values) / max_cycles
+    grid_evaluations = float(full_evaluations.sum() * instances * grid_scale)
+    grid_time = float(full_time.sum() * instances * grid_scale)
+    return {
+        "problem": problem,
+        "maximize": maximize,
+        "chosen": dict(configs[candidates[chosen][0]], MCN=candidates[chosen][1]),
+        "mean": float(candidate_values[chosen].mean()),
+        "std": float(candidate_values[chosen].std()),
+        "rungs": rungs,
+        "configs": len(configs) * len(mcn_values),
+        "instances": instances,
+        "evaluations": used_evaluations,
+        "grid_evaluations": grid_evaluations,
+        "saved": 1.0 - used_evaluations / grid_evaluations,
+        "cpu_time": used_time,
+        "grid_cpu_time": grid_time,
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+def print_summary(summary):
+    print(f"{'Rung':>4} {'Cycles':>7} {'Configs':>8} {'Kept':>5} {'Evals':>10}  Leader")
+    for r, rung in enumerate(summary["rungs"]):
+        print(f"{r:>4} {rung['cycles']:>7} {rung['configs']:>8} {rung['kept']:>5} "
+              f"{rung['evaluations']:>10}  {rung['leader']} ({rung['leader_mean']:.6g})")
+    print(f"Chosen: {summary['chosen']}, mean {summary['mean']:.6g} ± {summary['std']:.3g} "
+          f"over {summary['instances']} instances")
+    print(f"Evaluations: {summary['evaluations']} vs ~{summary['grid_evaluations']:.0f} for the full grid "
+          f"({100 * summary['saved']:.1f}% saved), wall time: {summary['wall_time']:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chọn SN, limit, MCN bằng successive halving")
+    parser.add_argument("--problem", choices=tuple(PROBLEMS), default="abc")
+    parser.add_argument("--instances", type=int, default=5, help="Số seed cho mỗi cấu hình")
+    parser.add_argument("--eta", type=int, default=3, help="Giữ lại 1/eta cấu hình sau mỗi vòng")
+    parser.add_argument("--min-fraction", type=float, default=1 / 9, help="Tỷ lệ số vòng lặp (so với MCN lớn nhất) ở vòng đầu")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Mức ý nghĩa của sign test")
+    parser.add_argument("--SN", type=int, nargs="+")
+    parser.add_argument("--limit", type=int, nargs="+")
+    parser.add_argument("--MCN", type=int, nargs="+")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="tuning_runs.jsonl")
+    parser.add_argument("--summary", default="tuning_summary.json")
+    args = parser.parse_args()
+
+    space = dict(PROBLEMS[args.problem][2])
+    for name in ("SN", "limit", "MCN"):
+        if getattr(args, name):
+            space[name] = tuple(getattr(args, name))
+    summary = successive_halving(problem=args.problem, space=space, instances=args.instances, eta=args.eta,
+                                 min_fraction=args.min_fraction, alpha=args.alpha, seed=args.seed,
+                                 workers=args.workers, output=args.output)
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+    print_summary(summary)
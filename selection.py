@@ -0,0 +1,56 @@
+import numpy as np
+
+# ==========================================
+# Shared selection helpers: roulette wheel and partner sampling
+# ==========================================
+# Every helper takes a numpy.random.Generator so runs are reproducible and the
+# caller decides which stream is consumed.
+
+
+def roulette_wheel(probabilities, size, rng):
+    """
+    Draw `size` indices with P(i) = probabilities[i] in one call.
+
+    The cumulative sum is built once per call (once per onlooker phase), each draw
+    is then a binary search: O(SN + size log SN) instead of re-validating the
+    distribution for every onlooker as rng.choice(p=...) in a loop does. An
+    (R, SN) array draws `size` indices within every row (one row per colony).
+    """
+    if np.ndim(probabilities) == 2:
+        return _roulette_wheel_rows(probabilities, size, rng)
+    cumulative = np.cumsum(probabilities)
+    draws = rng.random(size) * cumulative[-1]
+    # Guard the last bin against rounding in the cumulative sum
+    return np.minimum(np.searchsorted(cumulative, draws, side="right"), len(cumulative) - 1)
+
+
+def _roulette_wheel_rows(probabilities, size, rng):
+    """roulette_wheel for every row of an (R, SN) array: (R, size) indices within each row."""
+    R, SN = probabilities.shape
+    rows = np.arange(R)[:, None]
+    cumulative = np.cumsum(probabilities, axis=1)
+    cumulative /= cumulative[:, -1:]
+    # Shift row r into [r, r + 1] so one binary search serves every row
+    cumulative += rows
+    picks = np.searchsorted(cumulative.ravel(), (rng.random((R, size)) + rows).ravel(), side="right")
+    return np.minimum(picks.reshape(R, size) - rows * SN, SN - 1)
+
+
+def distinct_partners(indices, SN, rng):
+    """
+    Draw one partner k != i for every i in indices, O(1) per bee.
+
+    k is drawn from the SN - 1 other sources by sampling 0..SN-2 and shifting
+    every value >= i up by one, so no candidate list is built and no rejection
+    loop is needed.
+    """
+    indices = np.asarray(indices)
+    k = rng.integers(0, SN - 1, indices.shape)
+    k += k >= indices
+    return k
+
+
+def distinct_partner(i, SN, rng):
+    """Scalar version of distinct_partners for the serial loops."""
+    k = int(rng.integers(SN - 1))
+    return k + (k >= i)
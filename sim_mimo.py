@@ -0,0 +1,13 @@
+"""
+Importable alias of SIM-1-MIMO.py.
+
+The hyphenated file name cannot be used in an import statement, so its source is
+executed in this module's namespace. SIM_MIMO_System, ArtificialBeeColony and the
+helpers are then available through `from sim_mimo import ...` and pickle by
+reference (needed by the process-pool drivers). The __main__ demo is not run.
+"""
+import os
+
+_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SIM-1-MIMO.py")
+with open(_path, encoding="utf-8") as _source:
+    exec(compile(_source.read(), _path, "exec"))
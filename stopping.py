@@ -0,0 +1,118 @@
+from time import perf_counter
+
+import numpy as np
+
+# ==========================================
+# Stopping criteria for the ABC / AEABC engines
+# ==========================================
+# Reasons reported in engine.stop_reason
+MAX_CYCLES = "max_cycles"
+MAX_EVALUATIONS = "max_evaluations"
+TARGET_FITNESS = "target_fitness"
+DEADLINE = "deadline"
+STAGNATION = "stagnation"
+DIVERSITY = "diversity"
+
+
+def population_diversity(foods, lb, ub):
+    """Mean per-dimension standard deviation of the food sources, relative to the range."""
+    span = np.asarray(ub, dtype=float) - np.asarray(lb, dtype=float)
+    # A fixed dimension (lb == ub) has no spread and counts as 0
+    return float(np.mean(np.std(foods, axis=0) / np.where(span > 0, span, 1.0)))
+
+
+class StoppingCriteria:
+    def __init__(self, max_evaluations=None, target_fitness=None, deadline=None,
+                 stagnation_cycles=None, stagnation_tolerance=0.0,
+                 diversity_threshold=None, diversity_cycles=1):
+        """
+        Conditions checked by an engine after every cycle; the first one met stops it.
+
+        The engine provides telemetry.evaluations, best_fitness, foods, lb/ub and a
+        `maximize` flag, so the same object works for the maximizing
+        ArtificialBeeColony and the minimizing AEABCEngine. Evaluations are
+        counted, not cycles, so a budget is fair to AEABC, which skips the
+        objective when r <= Pd. The budget is checked at cycle boundaries and can
+        be exceeded by at most one cycle's evaluations.
+
+        Args:
+            max_evaluations (int): Objective evaluation budget
+            target_fitness (float): Stop once the best value reaches this; with an
+                acceptance strategy (e.g. FeasibilityRules) the best source must
+                also be feasible
+            deadline (float): Wall-clock seconds allowed from the start of optimize()
+            stagnation_cycles (int): Stop when the best value has not improved by more
+                than stagnation_tolerance for this many cycles
+            stagnation_tolerance (float): Minimum improvement that resets the window
+            diversity_threshold (float): Stop when population_diversity() stays below
+                this value for diversity_cycles consecutive cycles
+            diversity_cycles (int): Window for the diversity criterion
+        """
+        self.max_evaluations = max_evaluations
+        self.target_fitness = target_fitness
+        self.deadline = deadline
+        self.stagnation_cycles = stagnation_cycles
+        self.stagnation_tolerance = stagnation_tolerance
+        self.diversity_threshold = diversity_threshold
+        self.diversity_cycles = diversity_cycles
+        self.start()
+
+    def start(self):
+        """Reset the clock and the stagnation/diversity windows."""
+        self.start_time = perf_counter()
+        self.reference_best = None
+        self.cycles_without_improvement = 0
+        self.low_diversity_cycles = 0
+
+    def state(self):
+        """Elapsed time and window counters, JSON-serializable (for checkpoints)."""
+        return {
+            "elapsed": perf_counter() - self.start_time,
+            "reference_best": None if self.reference_best is None else float(self.reference_best),
+            "cycles_without_improvement": self.cycles_without_improvement,
+            "low_diversity_cycles": self.low_diversity_cycles,
+        }
+
+    def restore(self, state):
+        """Continue from state(): the deadline clock resumes at the saved elapsed time."""
+        self.start_time = perf_counter() - state["elapsed"]
+        self.reference_best = state["reference_best"]
+        self.cycles_without_improvement = state["cycles_without_improvement"]
+        self.low_diversity_cycles = state["low_diversity_cycles"]
+
+    def check(self, engine):
+        """
+        Returns:
+            str: The reason to stop (one of the module constants) or None
+        """
+        best = engine.best_fitness
+        # Work with "larger is better" internally
+        score = best if engine.maximize else -best
+
+        if self.max_evaluations is not None and engine.telemetry.evaluations >= self.max_evaluations:
+            return MAX_EVALUATIONS
+        if self.target_fitness is not None:
+            target = self.target_fitness if engine.maximize else -self.target_fitness
+            acceptance = getattr(engine, "acceptance", None)
+            if score >= target and (acceptance is None or acceptance.feasible(engine.best_violation)):
+                return TARGET_FITNESS
+        if self.deadline is not None and perf_counter() - self.start_time >= self.deadline:
+            return DEADLINE
+
+        if self.stagnation_cycles is not None:
+            if self.reference_best is None or score > self.reference_best + self.stagnation_tolerance:
+                self.reference_best = score
+                self.cycles_without_improvement = 0
+            else:
+                self.cycles_without_improvement += 1
+                if self.cycles_without_improvement >= self.stagnation_cycles:
+                    return STAGNATION
+
+        if self.diversity_threshold is not None:
+            if population_diversity(engine.foods, engine.lb, engine.ub) < self.diversity_threshold:
+                self.low_diversity_cycles += 1
+                if self.low_diversity_cycles >= self.diversity_cycles:
+                    return DIVERSITY
+            else:
+                self.low_diversity_cycles = 0
+        return None
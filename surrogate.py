@@ -0,0 +1,280 @@
+import json
+
+import numpy as np
+
+# ==========================================
+# Surrogate pre-screening of candidate solutions (larger is better)
+# ==========================================
+MODELS = ("knn", "rbf")
+COUNTERS = ("screened", "saved", "audits", "false_rejections", "false_promotions", "promoted", "refits")
+
+
+class SurrogateScreen:
+    def __init__(self, D, model="knn", capacity=512, k=5, refit_interval=50, min_true_rate=0.1,
+                 min_archive=20, margin=0.0, ridge=1e-8, seed=None):
+        """
+        Predicts candidate fitness from an archive of true evaluations and lets
+        only promising candidates reach the real objective.
+
+        A candidate is promising when its prediction beats the prediction of the
+        food source it would replace, less margin. Comparing two predictions
+        instead of a prediction with a true value cancels the smoothing bias of
+        the model. An unpromising candidate is still evaluated with probability
+        min_true_rate, and these audits measure how often the model wrongly
+        rejects a winner. The archive is a ring buffer of the last `capacity`
+        true evaluations. The model is rebuilt every refit_interval new points:
+        distance-weighted k nearest neighbours, or a Gaussian RBF interpolant.
+        Until the archive holds min_archive points every candidate is evaluated.
+
+        Screening pays off when the objective is smooth at the scale of the
+        moves: on an 8-dimensional sphere it cuts the error about tenfold for
+        the same number of true evaluations. On the SIM capacity with 32 phases
+        the difference stays within the seed-to-seed spread whatever margin, k,
+        refit_interval or model, so compare at an equal evaluation budget
+        before relying on it.
+
+        Args:
+            D (int): Dimension of the problem
+            model (str): "knn" or "rbf"
+            capacity (int): Archive size (bounds memory and prediction cost)
+            k (int): Neighbours used by the kNN model
+            refit_interval (int): New archive points between model refits
+            min_true_rate (float): Probability of evaluating an unpromising candidate.
+                A screened-out move costs no trial, so only these audits let
+                the trial counters of sources the model dislikes grow to limit;
+                it must be positive
+            min_archive (int): Archive size below which nothing is screened
+            margin (float): Tolerance on predicted improvement, larger = fewer rejections
+            ridge (float): Regularization of the RBF system
+            seed (int): Seed of the audit draws (the colony's stream is not touched)
+        """
+        if model not in MODELS:
+            raise ValueError(f"model must be one of {MODELS}, got {model!r}")
+        if not 0.0 < min_true_rate <= 1.0:
+            raise ValueError(f"min_true_rate must be in (0, 1], got {min_true_rate}")
+
+        self.model = model
+        self.k = k
+        self.refit_interval = refit_interval
+        self.min_true_rate = min_true_rate
+        self.min_archive = max(min_archive, k)
+        self.margin = margin
+        self.ridge = ridge
+        self.rng = np.random.default_rng(seed)
+
+        self.X = np.empty((capacity, D))
+        self.y = np.empty(capacity)
+        # The fitted model lives in buffers of the same size (checkpoint slots)
+        self._centers = np.empty((capacity, D))
+        self._values = np.empty(capacity)
+        self.count = 0
+        self._since_refit = 0
+        self._fitted = None
+        self._promising = None
+
+        # Instrumentation
+        self.screened = 0
+        self.saved = 0
+        self.audits = 0
+        self.false_rejections = 0
+        self.false_promotions = 0
+        self.promoted = 0
+        self.refits = 0
+
+    @property
+    def size(self):
+        return min(self.count, len(self.y))
+
+    def add(self, X, y):
+        """Store true evaluations (rows of X with values y) in the archive."""
+        X = np.atleast_2d(X)
+        y = np.atleast_1d(y)
+        capacity = len(self.y)
+        self._since_refit += len(y)
+        if len(y) > capacity:
+            # Only the newest points fit, the older ones would be overwritten anyway
+            self.count += len(y) - capacity
+            X, y = X[-capacity:], y[-capacity:]
+        slots = (self.count + np.arange(len(y))) % capacity
+        self.X[slots] = X
+        self.y[slots] = y
+        self.count += len(y)
+
+    def refit(self):
+        """Rebuild the model from the current archive."""
+        n = self.size
+        X, y = self._centers[:n], self._values[:n]
+        X[:] = self.X[:n]
+        if self.model == "knn":
+            y[:] = self.y[:n]
+            self._fitted = (X, y, np.einsum("ij,ij->i", X, X))
+        else:
+            d2 = self._squared_distances(X, X, np.einsum("ij,ij->i", X, X))
+            # Width from the median nearest-neighbour distance of the centers
+            np.fill_diagonal(d2, np.inf)
+            width2 = max(np.median(np.min(d2, axis=1)), 1e-12)
+            np.fill_diagonal(d2, 0.0)
+            mean = self.y[:n].mean()
+            y[:] = np.linalg.solve(np.exp(-d2 / width2) + self.ridge * np.eye(n), self.y[:n] - mean)
+            self._fitted = (X, y, np.einsum("ij,ij->i", X, X), width2, mean)
+        self._since_refit = 0
+        self.refits += 1
+
+    @staticmethod
+    def _squared_distances(A, B, B_sq):
+        d2 = np.einsum("ij,ij->i", A, A)[:, None] + B_sq[None, :] - 2.0 * (A @ B.T)
+        return np.maximum(d2, 0.0)
+
+    def predict(self, X):
+        """Predicted fitness of the rows of X (refits first when due)."""
+        if self._fitted is None or self._since_refit >= self.refit_interval:
+            self.refit()
+        if self.model == "knn":
+            centers, y, centers_sq = self._fitted
+            d2 = self._squared_distances(X, centers, centers_sq)
+            k = min(self.k, len(y))
+            nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            weights = 1.0 / (np.sqrt(np.take_along_axis(d2, nearest, axis=1)) + 1e-12)
+            return np.sum(weights * y[nearest], axis=1) / np.sum(weights, axis=1)
+        centers, weights, centers_sq, width2, mean = self._fitted
+        return np.exp(-self._squared_distances(X, centers, centers_sq) / width2) @ weights + mean
+
+    def screen(self, candidates, incumbents):
+        """
+        Decide which candidates get a true evaluation.
+
+        Args:
+            candidates (np.array): (m, D) candidate solutions
+            incumbents (np.array): (m, D) food sources they compete with
+
+        Returns:
+            np.array: Boolean mask of the candidates to evaluate
+        """
+        m = len(candidates)
+        self.screened += m
+        if self.size < self.min_archive:
+            self._promising = np.ones(m, dtype=bool)
+            return self._promising
+
+        predicted = self.predict(np.concatenate((candidates, incumbents)))
+        promising = predicted[:m] > predicted[m:] - self.margin
+        audit = ~promising & (self.rng.random(m) < self.min_true_rate)
+        evaluate = promising | audit
+        self.saved += m - int(np.count_nonzero(evaluate))
+        self._promising = promising[evaluate]
+        return evaluate
+
+    def report(self, values, incumbent_values):
+        """
+        Outcome of the true evaluations selected by the last screen() call.
+
+        Args:
+            values (np.array): True fitness of the evaluated candidates
+            incumbent_values (np.array): Fitness of the food sources they competed with
+        """
+        improved = np.asarray(values) > np.asarray(incumbent_values)
+        promising = self._promising
+        self.promoted += int(np.count_nonzero(promising))
+        self.false_promotions += int(np.count_nonzero(promising & ~improved))
+        self.audits += int(np.count_nonzero(~promising))
+        self.false_rejections += int(np.count_nonzero(~promising & improved))
+        self._promising = None
+
+    def state(self):
+        """
+        Counters, audit RNG and model size as small arrays (for checkpoints).
+
+        The archive and the fitted model are row arrays, see checkpoint_arrays().
+        The fitted model is saved as is, since it was built from an older archive.
+        """
+        fitted = self._fitted
+        return {
+            "count": self.count,
+            "since_refit": self._since_refit,
+            "fitted_size": len(fitted[0]) if fitted is not None else 0,
+            "fitted_shape": np.array(fitted[3:] if fitted is not None and self.model == "rbf" else ()),
+            "rng_state": np.array(json.dumps(self.rng.bit_generator.state)),
+            "counters": np.array(json.dumps({name: getattr(self, name) for name in COUNTERS})),
+        }
+
+    def checkpoint_arrays(self):
+        """Archive and fitted model buffers, written to checkpoint slots row by row."""
+        return {"X": self.X, "y": self.y, "centers": self._centers, "values": self._values}
+
+    def changed_rows(self, count, refits):
+        """
+        Rows of checkpoint_arrays() changed since the archive held `count` points
+        and the model had been refit `refits` times.
+        """
+        capacity = len(self.y)
+        archive = np.arange(count, self.count)[-capacity:] % capacity
+        fitted = np.arange(capacity) if self.refits != refits else np.empty(0, dtype=int)
+        return {"X": archive, "y": archive, "centers": fitted, "values": fitted}
+
+    def restore(self, state):
+        """Continue from state() together with the checkpoint_arrays() it was saved with."""
+        if state["X"].shape != self.X.shape:
+            raise ValueError("surrogate state does not fit this archive (capacity or dimension differs)")
+        self.X[:] = state["X"]
+        self.y[:] = state["y"]
+        self.count = int(state["count"])
+        self._since_refit = int(state["since_refit"])
+        n = int(state["fitted_size"])
+        if n:
+            centers, values = self._centers[:n], self._values[:n]
+            centers[:] = state["centers"][:n]
+            values[:] = state["values"][:n]
+            self._fitted = (centers, values, np.einsum("ij,ij->i", centers, centers),
+                            *(float(v) for v in state["fitted_shape"]))
+        else:
+            self._fitted = None
+        self._promising = None
+        self.rng.bit_generator.state = json.loads(str(state["rng_state"]))
+        for name, value in json.loads(str(state["counters"])).items():
+            setattr(self, name, value)
+
+    def snapshot(self):
+        """Counters as a plain dict; rates are over the candidates they can be measured on."""
+        return {
+            "screened": self.screened,
+            "saved": self.saved,
+            "audits": self.audits,
+            "false_rejection_rate": self.false_rejections / self.audits if self.audits else 0.0,
+            "false_promotion_rate": self.false_promotions / self.promoted if self.promoted else 0.0,
+            "refits": self.refits,
+            "archive": self.size,
+        }
+
+
+if __name__ == "__main__":
+    import math
+
+    from sim_mimo import ArtificialBeeColony, SIM_MIMO_System
+    from stopping import StoppingCriteria
+
+    # Same budget of true evaluations with and without screening, median over seeds
+    budget, seeds = 1500, range(5)
+
+    def compare(name, objective, D, bounds):
+        for screened in (False, True):
+            results, stats = [], None
+            for seed in seeds:
+                surrogate = SurrogateScreen(D, model="knn", capacity=256, seed=seed) if screened else None
+                abc = ArtificialBeeColony(objective, D, bounds, SN=20, MCN=10**5, seed=seed, surrogate=surrogate,
+                                          stopping=StoppingCriteria(max_evaluations=budget))
+                results.append(abc.optimize()[1])
+                stats = surrogate.snapshot() if screened else None
+            label = "sàng lọc kNN" if screened else "không sàng lọc"
+            print(f"{name}, {label}: trung vị {np.median(results):.6g} sau {budget} đánh giá")
+            if stats is not None:
+                print(f"    tỷ lệ loại nhầm {stats['false_rejection_rate']:.2f}, "
+                      f"tỷ lệ chọn nhầm {stats['false_promotion_rate']:.2f} (seed cuối)")
+
+    # 1. Smooth objective: the model ranks moves well and screening pays off
+    compare("Sphere D=8 (giá trị -|x|^2)", lambda x: -float(np.sum(x**2)), 8, (-5, 5))
+
+    # 2. SIM capacity, 32 phases: the difference is within the spread between
+    #    seeds (tuning margin, k, refit_interval or the RBF model does not
+    #    change that), so the SIM scripts run without screening
+    sim_env = SIM_MIMO_System(4, 4, 32, seed=0)
+    compare("SIM N=32 (bits/s/Hz)", sim_env.calculate_spectral_efficiency, 32, (0, 2 * math.pi))
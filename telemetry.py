@@ -0,0 +1,115 @@
+from time import perf_counter
+
+import numpy as np
+
+# ==========================================
+# Low-overhead telemetry for the ABC / AEABC engines
+# ==========================================
+
+
+class RingBuffer:
+    def __init__(self, capacity):
+        """Fixed-size float history; the oldest values are overwritten once full."""
+        self.data = np.empty(max(int(capacity), 1))
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.count % len(self.data)] = value
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, len(self.data))
+
+    def to_array(self):
+        """Stored values in chronological order (a copy)."""
+        n = len(self.data)
+        if self.count <= n:
+            return self.data[:self.count].copy()
+        start = self.count % n
+        return np.concatenate((self.data[start:], self.data[:start]))
+
+
+class Telemetry:
+    PHASES = ("employed", "onlooker", "scout", "evaluation")
+
+    def __init__(self, history_capacity=10000):
+        """
+        Counters, phase timers, best-value history and an event API.
+
+        Engines update plain integer/float attributes (evaluations, accepted,
+        skipped, scout_resets, phase_time) and append the best value of every cycle
+        to a preallocated ring buffer. Events are only dispatched when a listener
+        is attached, so an unobserved run pays a few additions per cycle.
+
+        Listeners are called as listener(event, telemetry, **data). Events:
+        "start" (best), "cycle" (cycle, best) and "end" (best, reason).
+
+        Args:
+            history_capacity (int): Cycles kept in the history ring buffer
+        """
+        self.evaluations = 0
+        self.accepted = 0
+        self.skipped = 0
+        self.scout_resets = 0
+        self.cycles = 0
+        self.phase_time = dict.fromkeys(self.PHASES, 0.0)
+        self.history = RingBuffer(history_capacity)
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+        return listener
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def emit(self, event, **data):
+        for listener in self.listeners:
+            listener(event, self, **data)
+
+    def record_evaluations(self, n, seconds):
+        self.evaluations += n
+        self.phase_time["evaluation"] += seconds
+
+    def end_cycle(self, best):
+        self.history.append(best)
+        self.cycles += 1
+        if self.listeners:
+            self.emit("cycle", cycle=self.cycles - 1, best=best)
+
+    def snapshot(self):
+        """Counters and timers as a plain dict (e.g. for JSON logs)."""
+        return {
+            "cycles": self.cycles,
+            "evaluations": self.evaluations,
+            "accepted": self.accepted,
+            "skipped": self.skipped,
+            "scout_resets": self.scout_resets,
+            "phase_time": dict(self.phase_time),
+        }
+
+
+def timed_phases(telemetry, phases):
+    """
+    Run (name, callable) pairs in order and add their wall time to telemetry.
+
+    Used by the engines' run_cycle(); one perf_counter() call per phase boundary.
+    """
+    start = perf_counter()
+    for name, phase in phases:
+        phase()
+        now = perf_counter()
+        telemetry.phase_time[name] += now - start
+        start = now
+
+
+def print_every(every, message):
+    """
+    Listener printing message.format(cycle=..., best=...) every `every` cycles.
+
+    Reproduces the per-iteration progress lines of the original scripts.
+    """
+    def listener(event, telemetry, cycle=None, best=None, **data):
+        if event == "cycle" and cycle % every == 0:
+            print(message.format(cycle=cycle, best=best))
+    return listener
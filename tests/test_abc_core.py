@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from aeabc_engine import AEABCEngine
+
+
+def sphere(x):
+    return np.sum(x**2)
+
+
+def sphere_batch(X):
+    return np.sum(X**2, axis=1)
+
+
+def full_distances(foods):
+    diff = foods[:, None, :].astype(np.float64) - foods[None, :, :]
+    return np.sum(diff**2, axis=2)
+
+
+@pytest.mark.parametrize("batch_function", [None, sphere_batch])
+def test_distance_gate_matrix_follows_moves_and_scouts(batch_function):
+    engine = AEABCEngine(sphere, 4, (-5, 5), SN=12, MCN=40, limit=3, seed=0,
+                         batch_function=batch_function, refresh_interval=10**9)
+    engine.optimize()
+    assert engine.telemetry.accepted > 0 and engine.telemetry.scout_resets > 0
+    np.testing.assert_allclose(engine.dist2, full_distances(engine.foods), atol=1e-9)
+
+
+def test_aeabc_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    _, best, history = AEABCEngine(sphere, 4, (-5, 5), SN=12, MCN=30, limit=3, seed=0).optimize()
+
+    partial = AEABCEngine(sphere, 4, (-5, 5), SN=12, MCN=12, limit=3, seed=0)
+    partial.optimize()
+    partial.save_checkpoint(path)
+    resumed = AEABCEngine(sphere, 4, (-5, 5), SN=12, MCN=30, limit=3, seed=0)
+    _, resumed_best, resumed_history = resumed.resume(path)
+
+    assert resumed_best == best
+    np.testing.assert_array_equal(resumed_history, history)
+
+
+def test_serial_and_synchronous_phases_draw_the_same_moves():
+    # Nothing is ever accepted, so both paths see the same food sources all along
+    def run(**kwargs):
+        engine = AEABCEngine(lambda x: 1.0, 4, (-5, 5), SN=12, MCN=10, limit=4, seed=0, **kwargs)
+        engine.optimize()
+        return engine
+
+    serial, synchronous = run(), run(batch_function=lambda X: np.ones(len(X)))
+    assert serial.telemetry.skipped == synchronous.telemetry.skipped > 0
+    assert serial.telemetry.scout_resets == synchronous.telemetry.scout_resets > 0
+    np.testing.assert_array_equal(serial.foods, synchronous.foods)
+    assert serial.rng.bit_generator.state == synchronous.rng.bit_generator.state
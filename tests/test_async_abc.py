@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import numpy as np
+
+from async_abc import AsyncArtificialBeeColony
+from sim_mimo import ArtificialBeeColony
+from stopping import MAX_CYCLES
+
+LATENCY = 0.002
+D = 5
+BOUNDS = (-5.0, 5.0)
+
+
+def sphere(x):
+    return -float(np.sum(np.square(x)))
+
+
+async def remote_sphere(x):
+    await asyncio.sleep(LATENCY)
+    return sphere(x)
+
+
+def test_throughput_beats_serial_optimize():
+    def blocking_sphere(x):
+        time.sleep(LATENCY)
+        return sphere(x)
+
+    start = time.perf_counter()
+    serial = ArtificialBeeColony(blocking_sphere, D, BOUNDS, SN=8, MCN=5, seed=1)
+    serial.optimize()
+    serial_rate = serial.telemetry.evaluations / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    colony = AsyncArtificialBeeColony(remote_sphere, D, BOUNDS, SN=8, MCN=5, max_in_flight=8, seed=1)
+    asyncio.run(colony.optimize())
+    async_rate = colony.telemetry.evaluations / (time.perf_counter() - start)
+
+    assert colony.stop_reason == MAX_CYCLES
+    assert async_rate > 2 * serial_rate
+
+
+def test_in_flight_evaluations_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def objective(x):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(LATENCY * np.random.default_rng(int(abs(x[0]) * 1e6)).uniform(0.5, 1.5))
+            return sphere(x)
+        finally:
+            in_flight -= 1
+
+    colony = AsyncArtificialBeeColony(objective, D, BOUNDS, SN=10, MCN=5, limit=3, max_in_flight=4, seed=2)
+    asyncio.run(colony.optimize())
+
+    assert peak == 4
+    assert in_flight == 0
+
+
+def _failing_after(n_ok, failure):
+    calls = 0
+
+    async def objective(x):
+        nonlocal calls
+        calls += 1
+        if calls > n_ok:
+            await failure()
+        return sphere(x)
+
+    return objective
+
+
+def test_raising_objective_counts_failures_and_trials():
+    async def raise_error():
+        raise RuntimeError("simulator crashed")
+
+    SN, MCN = 6, 4
+    colony = AsyncArtificialBeeColony(_failing_after(SN, raise_error), D, BOUNDS, SN=SN, MCN=MCN,
+                                      limit=10**6, max_in_flight=3, seed=3)
+    asyncio.run(colony.optimize())
+
+    moves = 2 * SN * MCN
+    assert colony.failures == moves
+    assert colony.timeouts == 0
+    assert colony.trial_counters.sum() == moves
+    assert colony.telemetry.accepted == 0
+    assert np.all(np.isfinite(colony.fitness))
+
+
+def test_timed_out_objective_counts_timeouts_and_trials():
+    async def hang():
+        await asyncio.sleep(10.0)
+
+    SN, MCN = 4, 2
+    colony = AsyncArtificialBeeColony(_failing_after(SN, hang), D, BOUNDS, SN=SN, MCN=MCN,
+                                      limit=10**6, max_in_flight=8, timeout=0.01, seed=4)
+    start = time.perf_counter()
+    asyncio.run(colony.optimize())
+
+    moves = 2 * SN * MCN
+    assert time.perf_counter() - start < 1.0
+    assert colony.timeouts == moves
+    assert colony.failures == 0
+    assert colony.trial_counters.sum() == moves
+
+
+def test_stopping_checked_once_per_cycle():
+    class CountingStop:
+        def __init__(self):
+            self.calls = []
+
+        def start(self):
+            pass
+
+        def check(self, engine):
+            self.calls.append((engine.cycle, engine._completed_moves))
+            return None
+
+    SN, MCN = 5, 6
+    stopping = CountingStop()
+    # A small limit makes scouts interleave with the neighbour moves
+    colony = AsyncArtificialBeeColony(remote_sphere, D, BOUNDS, SN=SN, MCN=MCN, limit=1,
+                                      max_in_flight=4, seed=5, stopping=stopping)
+    asyncio.run(colony.optimize())
+
+    assert colony.telemetry.scout_resets > 0
+    assert stopping.calls == [(c, 2 * SN * c) for c in range(1, MCN)]
+    assert colony.stop_reason == MAX_CYCLES
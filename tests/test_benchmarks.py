@@ -0,0 +1,13 @@
+import os
+import subprocess
+
+from benchmarks.harness import _git_commit
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_git_commit_is_read_from_the_repository_not_the_working_directory(tmp_path, monkeypatch):
+    expected = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=REPO).stdout.strip() or None
+    monkeypatch.chdir(tmp_path)
+    assert _git_commit() == expected
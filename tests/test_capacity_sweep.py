@@ -0,0 +1,39 @@
+import json
+
+import numpy as np
+
+from capacity_sweep import _run_realization, run_sweep
+
+PARAMS = {"Nt": 2, "Nr": 2, "N": 8, "Layers": 1, "SN": 6, "MCN": 20, "limit": 5,
+          "stagnation_cycles": 5, "stagnation_tolerance": 1e-4}
+
+
+def test_sweep_summary_matches_its_points_and_single_realizations(tmp_path):
+    output = tmp_path / "sweep.jsonl"
+    snr_grid = (0.0, 10.0, 20.0)
+    summary = run_sweep(snr_grid=snr_grid, realizations=3, Nt=2, Nr=2, N=8, SN=6, MCN=20, limit=5,
+                        stagnation_cycles=5, seed=4, workers=2, output=str(output))
+
+    points = [json.loads(line) for line in output.read_text().splitlines()]
+    capacities = np.full((3, 3), np.nan)
+    for point in points:
+        capacities[point["realization"], snr_grid.index(point["snr_db"])] = point["capacity"]
+    np.testing.assert_allclose(summary["ergodic_capacity"], capacities.mean(axis=0))
+    assert summary["total_evaluations"] == sum(point["evaluations"] for point in points)
+    # Capacity grows with the SNR
+    assert np.all(np.diff(summary["ergodic_capacity"]) > 0)
+
+    # Any realization can be reproduced alone from its child seed
+    children = np.random.SeedSequence(4).spawn(3)
+    alone = _run_realization((2, children[2], np.array(snr_grid), {**PARAMS, "warm_start": True}))
+    np.testing.assert_array_equal([point["capacity"] for point in alone], capacities[2])
+
+
+def test_warm_start_changes_only_the_later_points():
+    children = np.random.SeedSequence(5).spawn(1)
+    snr_grid = np.array([0.0, 10.0, 20.0])
+    # The same SeedSequence for both runs: a realization must not consume it
+    warm = _run_realization((0, children[0], snr_grid, {**PARAMS, "warm_start": True}))
+    cold = _run_realization((0, children[0], snr_grid, {**PARAMS, "warm_start": False}))
+    assert warm[0]["capacity"] == cold[0]["capacity"]
+    assert [point["capacity"] for point in warm[1:]] != [point["capacity"] for point in cold[1:]]
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+from sim_mimo import ArtificialBeeColony, SIM_MIMO_System
+from stopping import StoppingCriteria
+from surrogate import SurrogateScreen
+
+SYSTEM = SIM_MIMO_System(4, 4, 16, seed=0)
+
+
+def make_colony(MCN, model, **kwargs):
+    return ArtificialBeeColony(
+        SYSTEM.calculate_spectral_efficiency, SYSTEM.D, (0, 2 * math.pi), SN=10, MCN=MCN, limit=5, seed=1,
+        stopping=StoppingCriteria(stagnation_cycles=25, diversity_threshold=1e-9, deadline=1e6),
+        surrogate=SurrogateScreen(SYSTEM.D, model=model, capacity=60, refit_interval=13,
+                                  min_true_rate=0.2, seed=2),
+        **kwargs)
+
+
+@pytest.mark.parametrize("model", ["knn", "rbf"])
+def test_resume_with_stopping_and_surrogate_matches_uninterrupted_run(tmp_path, model):
+    path = str(tmp_path / "run.ckpt")
+    full = make_colony(80, model)
+    _, best, history = full.optimize()
+
+    make_colony(30, model, checkpoint_path=path, checkpoint_every=30).optimize()
+    resumed = make_colony(80, model)
+    _, resumed_best, resumed_history = resumed.resume(path)
+
+    assert resumed_best == best
+    assert np.array_equal(resumed_history, history)
+    assert np.array_equal(resumed.foods, full.foods)
+    assert resumed.stop_reason == full.stop_reason
+    assert resumed.stopping.cycles_without_improvement == full.stopping.cycles_without_improvement
+    assert resumed.surrogate.snapshot() == full.surrogate.snapshot()
+
+
+def test_checkpoints_write_only_what_changed(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    colony = make_colony(40, "knn", checkpoint_path=path)
+    colony.optimize()
+    colony.save_checkpoint()
+    with np.load(path) as manifest:
+        assert not {"history", "gate_dist2", "surrogate_X", "surrogate_y"} & set(manifest.files)
+
+    # Once both slots are up to date nothing is copied and the log does not grow
+    log = tmp_path / "run.ckpt.history.log"
+    size = log.stat().st_size
+    colony.save_checkpoint()
+    assert colony.save_checkpoint() == 0
+    assert log.stat().st_size == size == 8 * colony.telemetry.history.count
+
+    # One more cycle appends one value, the log keeps what the full ring buffer dropped
+    logged = np.fromfile(log)
+    colony.run_cycle()
+    colony.save_checkpoint()
+    assert log.stat().st_size == size + 8
+    np.testing.assert_array_equal(np.fromfile(log), np.append(logged, colony.fitness_history[-1]))
@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import pytest
+
+from coevolution import CooperativeCoevolution, correlation_groups, random_groups
+from sim_mimo import SIM_MIMO_System
+
+SYSTEM = SIM_MIMO_System(4, 4, 48, seed=0)
+
+
+def run(**kwargs):
+    cc = CooperativeCoevolution(SYSTEM.calculate_spectral_efficiency, SYSTEM.D, (0, 2 * math.pi), group_size=16,
+                                rounds=3, SN=6, group_cycles=5, limit=5, system=SYSTEM, seed=1, **kwargs)
+    best, value, history = cc.optimize()
+    return cc, best, value, history
+
+
+@pytest.mark.parametrize("groups", [random_groups(50, 16, np.random.default_rng(0)), correlation_groups(SYSTEM, 16)])
+def test_groupings_partition_the_variables(groups):
+    assert all(len(group) <= 16 for group in groups)
+    D = sum(len(group) for group in groups)
+    np.testing.assert_array_equal(np.sort(np.concatenate(groups)), np.arange(D))
+
+
+@pytest.mark.parametrize("options", [{}, {"grouping": "correlation"}, {"workers": 2}])
+def test_rounds_never_lose_the_context(options):
+    cc, best, value, history = run(**options)
+    assert value == pytest.approx(SYSTEM.calculate_spectral_efficiency(best), rel=1e-12)
+    assert len(history) == 3 and np.all(np.diff(history) >= 0)
+    assert cc.telemetry.accepted > 0
+
+
+def test_incremental_evaluation_matches_the_objective():
+    _, best, value, history = run()
+    _, incremental_best, incremental_value, incremental_history = run(incremental=True)
+    np.testing.assert_allclose(incremental_best, best, rtol=1e-9)
+    np.testing.assert_allclose(incremental_history, history, rtol=1e-9)
+    assert incremental_value == pytest.approx(value, rel=1e-9)
@@ -0,0 +1,125 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import demo_aeabc_welded_beam as wb
+from abc_core import ABCOptimizer, DistanceGate, PartnerStep, ResetMostExhausted
+from constraints import Constraint, FeasibilityRoulette, FeasibilityRules
+
+
+def objective(x):
+    return x[0] + 2.0 * x[1]
+
+
+def objective_batch(X):
+    return X[:, 0] + 2.0 * X[:, 1]
+
+
+CONSTRAINTS = [
+    Constraint("disk", lambda x: x[0]**2 + x[1]**2 - 1.0, lambda X: X[:, 0]**2 + X[:, 1]**2 - 1.0, cost=3),
+    Constraint("order", lambda x: x[0] - x[1], lambda X: X[:, 0] - X[:, 1], cost=1),
+]
+
+
+def make_rules(**kwargs):
+    return FeasibilityRules(CONSTRAINTS, objective_cost=2, **kwargs)
+
+
+def sample(n=400, seed=0):
+    """Candidates and incumbents covering feasible and infeasible pairs."""
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-1.5, 1.5, (n, 2))
+    incumbents = make_rules().evaluate_batch(objective_batch, rng.uniform(-1.5, 1.5, (n, 2)))
+    return X, incumbents
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 0.3])
+def test_evaluate_matches_evaluate_batch(epsilon):
+    X, (incumbent_f, incumbent_phi) = sample()
+    scalar, batch = make_rules(epsilon=epsilon), make_rules(epsilon=epsilon)
+
+    scores = [scalar.evaluate(objective, x, (f, phi)) for x, f, phi in zip(X, incumbent_f, incumbent_phi)]
+    f, phi = batch.evaluate_batch(objective_batch, X, (incumbent_f, incumbent_phi))
+
+    np.testing.assert_array_equal(f, [score[0] for score in scores])
+    np.testing.assert_array_equal(phi, [score[1] for score in scores])
+    assert np.isinf(f).any() and np.isfinite(f).any()
+    assert scalar.snapshot() == batch.snapshot()
+    assert scalar.short_circuits > 0
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 0.3])
+def test_short_circuit_accepts_exactly_what_full_evaluation_accepts(epsilon):
+    X, incumbents = sample(seed=1)
+    rules = make_rules(epsilon=epsilon)
+    full_f, full_phi = rules.evaluate_batch(objective_batch, X)
+    short_f, short_phi = rules.evaluate_batch(objective_batch, X, incumbents)
+
+    np.testing.assert_array_equal(rules.improves(short_f, short_phi, *incumbents),
+                                  rules.improves(full_f, full_phi, *incumbents))
+    # Winners keep their exact score
+    winners = rules.improves(full_f, full_phi, *incumbents)
+    np.testing.assert_array_equal(short_f[winners], full_f[winners])
+    np.testing.assert_array_equal(short_phi[winners], full_phi[winners])
+
+
+def test_epsilon_schedule():
+    rules = make_rules(epsilon=1.0, epsilon_cycles=10, cp=2.0)
+    optimizer = SimpleNamespace(cycle=0, violation=np.array([0.0, 1.0]))
+    for cycle, expected in ((0, 1.0), (5, 0.25), (9, 0.01), (10, 0.0), (50, 0.0)):
+        optimizer.cycle = cycle
+        rules.update(optimizer)
+        assert rules.epsilon == pytest.approx(expected)
+
+    # epsilon=None: epsilon0 is the theta-quantile of the finite initial violations
+    rules = make_rules(epsilon=None, epsilon_cycles=4, cp=1.0, theta=0.5)
+    optimizer = SimpleNamespace(cycle=0, violation=np.array([0.0, 2.0, 4.0, np.inf]))
+    rules.update(optimizer)
+    assert rules.epsilon0 == pytest.approx(2.0)
+    optimizer.cycle = 2
+    rules.update(optimizer)
+    assert rules.epsilon == pytest.approx(1.0)
+
+    constant = make_rules(epsilon=0.5)
+    constant.update(SimpleNamespace(cycle=100, violation=np.zeros(2)))
+    assert constant.epsilon == 0.5
+
+
+def test_feasibility_roulette():
+    roulette = FeasibilityRoulette(make_rules())
+    fitness = np.array([1.0, 3.0, -2.0, 0.5, 7.0])
+    violation = np.array([0.0, 0.0, 0.0, 2.0, 6.0])
+    p = roulette.probabilities(fitness, violation)
+
+    assert p.sum() == pytest.approx(1.0)
+    # Any feasible source outweighs every infeasible one, smaller values weigh more
+    assert p[:3].min() > p[3:].max()
+    assert p[2] > p[0] > p[1]
+    assert p[3] > p[4]
+
+    # Failed evaluations get nothing; no usable source at all gives a uniform draw
+    p = roulette.probabilities(np.array([1.0, np.inf]), np.array([0.0, np.inf]))
+    np.testing.assert_array_equal(p, [1.0, 0.0])
+    p = roulette.probabilities(np.full(4, np.inf), np.full(4, np.inf))
+    np.testing.assert_array_equal(p, np.full(4, 0.25))
+
+
+def run_welded_beam(**kwargs):
+    rules = FeasibilityRules(wb.WELDED_BEAM_CONSTRAINTS, objective_cost=2)
+    optimizer = ABCOptimizer(wb.welded_beam_cost, wb.PROBLEM_SIZE, (wb.LB, wb.UB), SN=20, MCN=30, limit=100,
+                             neighbour=PartnerStep(), gate=DistanceGate(), selection=FeasibilityRoulette(rules),
+                             acceptance=rules, scout=ResetMostExhausted(), seed=3, **kwargs)
+    best, value, history = optimizer.optimize()
+    return best, value, optimizer.best_violation, history
+
+
+def test_feasibility_rules_on_the_pool_match_synchronous():
+    best, value, violation, history = run_welded_beam(workers=2)
+    expected_best, expected_value, expected_violation, expected_history = run_welded_beam(synchronous=True)
+
+    np.testing.assert_array_equal(best, expected_best)
+    assert value == expected_value
+    assert violation == expected_violation
+    np.testing.assert_array_equal(history, expected_history)
+    assert wb.check_constraints(best) == violation == 0
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from sim_mimo import ArtificialBeeColony, DiscretePhaseEvaluator, IncrementalCapacityEvaluator, SIM_MIMO_System
+
+SN = 4
+MOVES = 400
+NO_REFRESH = 10**9
+
+
+@pytest.mark.parametrize("layers", [1, 3])
+def test_rank2_updates_track_direct_capacity(layers):
+    system = SIM_MIMO_System(4, 4, 9, Layers=layers, seed=0)
+    evaluator = IncrementalCapacityEvaluator(system, refresh_interval=NO_REFRESH)
+    rng = np.random.default_rng(1)
+    foods = rng.uniform(0, 2 * np.pi, (SN, system.D))
+    capacities = evaluator.reset(foods)
+    assert np.allclose(capacities, [system.calculate_spectral_efficiency(x) for x in foods], rtol=1e-12)
+
+    accepted = 0
+    for _ in range(MOVES):
+        i, j = rng.integers(SN), rng.integers(system.D)
+        new_phase = rng.uniform(0, 2 * np.pi)
+        candidate = foods[i].copy()
+        candidate[j] = new_phase
+        assert evaluator.evaluate_move(i, j, new_phase) == pytest.approx(
+            system.calculate_spectral_efficiency(candidate), rel=1e-9)
+        if rng.random() < 0.7:
+            evaluator.accept_move(i, j, new_phase)
+            foods[i] = candidate
+            accepted += 1
+
+    # Only the initial full computations, every accepted move went through the rank-2 update
+    assert evaluator.n_full == SN
+    assert accepted > MOVES // 2
+    for i in range(SN):
+        assert evaluator.logdet[i] / np.log(2) == pytest.approx(
+            system.calculate_spectral_efficiency(foods[i]), rel=1e-9)
+        # Cached partial products and H_eff of every layer match a fresh computation
+        reference = IncrementalCapacityEvaluator(system)._full_state(foods[i])
+        assert np.allclose(evaluator.H_eff[i], reference[3], atol=1e-9)
+        assert np.allclose(evaluator.A_inv[i], reference[4], atol=1e-9)
+        if layers > 1:
+            assert np.allclose(evaluator.left[i], reference[1], atol=1e-9)
+            assert np.allclose(evaluator.right[i], reference[2], atol=1e-9)
+
+
+def test_accept_without_evaluate_matches_direct_capacity():
+    system = SIM_MIMO_System(4, 4, 9, Layers=2, seed=2)
+    evaluator = IncrementalCapacityEvaluator(system, refresh_interval=NO_REFRESH)
+    rng = np.random.default_rng(3)
+    foods = rng.uniform(0, 2 * np.pi, (SN, system.D))
+    evaluator.reset(foods)
+    for _ in range(100):
+        i, j = rng.integers(SN), rng.integers(system.D)
+        new_phase = rng.uniform(0, 2 * np.pi)
+        # Score a different move first so the pending terms are stale
+        evaluator.evaluate_move((i + 1) % SN, j, new_phase + 1.0)
+        evaluator.accept_move(i, j, new_phase)
+        foods[i, j] = new_phase
+    for i in range(SN):
+        assert evaluator.logdet[i] / np.log(2) == pytest.approx(
+            system.calculate_spectral_efficiency(foods[i]), rel=1e-9)
+
+
+@pytest.mark.parametrize("bits", [1, 3])
+def test_discrete_phase_evaluator_matches_direct_capacity(bits):
+    system = SIM_MIMO_System(4, 4, 16, seed=4)
+    evaluator = DiscretePhaseEvaluator(system, bits, refresh_interval=NO_REFRESH)
+    levels = evaluator.levels
+    rng = np.random.default_rng(5)
+    foods = rng.integers(0, levels, (SN, system.D)).astype(float)
+    evaluator.reset(foods)
+
+    for _ in range(MOVES):
+        i, j = rng.integers(SN), rng.integers(system.D)
+        new_level = float(rng.integers(levels))
+        candidate = foods[i].copy()
+        candidate[j] = new_level
+        direct = system.calculate_spectral_efficiency(evaluator.phase_angles(candidate))
+        assert evaluator.capacity(candidate) == pytest.approx(direct, rel=1e-9)
+        assert evaluator.evaluate_move(i, j, new_level) == pytest.approx(direct, rel=1e-9)
+        if rng.random() < 0.5:
+            evaluator.accept_move(i, j, new_level)
+            foods[i] = candidate
+
+    assert evaluator.n_full == SN
+    assert evaluator.memo_hits > 0
+    for i in range(SN):
+        assert evaluator.logdet[i] / np.log(2) == pytest.approx(
+            system.calculate_spectral_efficiency(evaluator.phase_angles(foods[i])), rel=1e-9)
+
+
+@pytest.mark.parametrize("make_evaluator", [
+    lambda system: IncrementalCapacityEvaluator(system, refresh_interval=NO_REFRESH),
+    lambda system: DiscretePhaseEvaluator(system, 2, refresh_interval=NO_REFRESH),
+])
+def test_caches_follow_set_snr(make_evaluator):
+    system = SIM_MIMO_System(4, 4, 16, seed=6)
+    evaluator = make_evaluator(system)
+    discrete = isinstance(evaluator, DiscretePhaseEvaluator)
+    rng = np.random.default_rng(7)
+    if discrete:
+        foods = rng.integers(0, evaluator.levels, (SN, system.D)).astype(float)
+        angles = evaluator.phase_angles
+    else:
+        foods = rng.uniform(0, 2 * np.pi, (SN, system.D))
+        angles = np.asarray
+    evaluator.reset(foods)
+
+    for snr_dB in (5, 30, 20):
+        # Score a move before the change so stale memo entries and pending terms exist
+        evaluator.evaluate_move(0, 3, foods[0, 3] + 1)
+        system.set_snr(snr_dB)
+        for i in range(SN):
+            candidate = foods[i].copy()
+            candidate[3] += 1
+            direct = system.calculate_spectral_efficiency(angles(candidate))
+            assert evaluator.evaluate_move(i, 3, candidate[3]) == pytest.approx(direct, rel=1e-9)
+        evaluator.accept_move(0, 3, foods[0, 3] + 1)
+        foods[0, 3] += 1
+        assert evaluator.logdet[0] / np.log(2) == pytest.approx(
+            system.calculate_spectral_efficiency(angles(foods[0])), rel=1e-9)
+
+
+def test_discrete_colony_with_memo_matches_plain_objective():
+    system = SIM_MIMO_System(4, 4, 16, seed=8)
+    evaluator = DiscretePhaseEvaluator(system, 3)
+
+    def run(**kwargs):
+        colony = ArtificialBeeColony(**kwargs, D=system.D, bounds=None, SN=8, MCN=40, limit=10, seed=9, levels=8)
+        best, value, history = colony.optimize()
+        return colony, best, value, history
+
+    colony, best, value, history = run(objective_function=None, move_evaluator=evaluator)
+    _, expected_best, expected_value, expected_history = run(
+        objective_function=lambda levels: system.calculate_spectral_efficiency(evaluator.phase_angles(levels)))
+
+    assert evaluator.memo_hits > 0
+    np.testing.assert_array_equal(best, expected_best)
+    np.testing.assert_allclose(history, expected_history, rtol=1e-9)
+    assert value == pytest.approx(expected_value, rel=1e-9)
+    # Food sources stay on the levels
+    assert np.all((colony.foods == np.rint(colony.foods)) & (colony.foods >= 0) & (colony.foods < 8))
@@ -0,0 +1,42 @@
+import math
+import time
+
+import pytest
+
+from island_model import run_island_model
+from sim_mimo import make_sim_objective
+from stopping import STAGNATION, StoppingCriteria
+
+
+def failing_objective_factory():
+    raise RuntimeError("objective unavailable")
+
+
+def slow_objective_factory():
+    def objective(x):
+        time.sleep(0.01)
+        return 0.0
+    return objective
+
+
+def test_islands_stop_on_their_criteria():
+    # Migrants passed back and forth keep improving the best value in tiny steps
+    stopping = StoppingCriteria(stagnation_cycles=10, stagnation_tolerance=1e-6)
+    _, best, islands = run_island_model(make_sim_objective, (4, 4, 16, 0), D=16, bounds=(0, 2 * math.pi),
+                                        islands=2, MCN=10**4, migration_interval=5, SN=10, limit=10, seed=1,
+                                        stopping=stopping, timeout=60)
+    assert best == max(value for value, _, _, _ in islands)
+    for _, history, _, reason in islands:
+        assert reason == STAGNATION and len(history) < 10**4
+
+
+def test_crashed_island_is_reported():
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match=r"island \d exited"):
+        run_island_model(failing_objective_factory, (), D=2, bounds=(0, 1), islands=2, MCN=10)
+    assert time.perf_counter() - start < 30
+
+
+def test_timeout_terminates_islands():
+    with pytest.raises(TimeoutError):
+        run_island_model(slow_objective_factory, (), D=2, bounds=(0, 1), islands=2, MCN=10**4, timeout=0.5)
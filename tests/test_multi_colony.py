@@ -0,0 +1,69 @@
+import numpy as np
+
+import demo_aeabc_welded_beam as wb
+from abc_core import DistanceGate, InverseFitnessRoulette, ResetMostExhausted
+from constraints import FeasibilityRoulette, FeasibilityRules
+from multi_colony import MultiColonyEngine
+
+
+def sphere_batch(X):
+    return np.sum(X**2, axis=1)
+
+
+def full_distances(foods):
+    diff = foods[:, None, :] - foods[None, :, :]
+    return np.sum(diff**2, axis=2)
+
+
+def test_colonies_do_not_depend_on_the_other_colonies():
+    small = MultiColonyEngine(sphere_batch, 4, (-5, 5), R=3, SN=8, MCN=30, limit=[5, 10, 20], seed=1)
+    large = MultiColonyEngine(sphere_batch, 4, (-5, 5), R=7, SN=8, MCN=30, limit=[5, 10, 20, 1, 2, 3, 4], seed=1)
+    best, value, history = small.optimize()
+    large_best, large_value, large_history = large.optimize()
+
+    np.testing.assert_array_equal(best, large_best[:3])
+    np.testing.assert_array_equal(value, large_value[:3])
+    np.testing.assert_array_equal(history, large_history[:, :3])
+    assert small.telemetry.scout_resets > 0
+
+
+def test_distance_gate_keeps_one_matrix_per_colony():
+    engine = MultiColonyEngine(sphere_batch, 4, (-5, 5), R=5, SN=10, MCN=40, limit=3, seed=2,
+                               gate=DistanceGate(refresh_interval=10**9), selection=InverseFitnessRoulette())
+    engine.optimize()
+    assert engine.telemetry.skipped > 0 and engine.telemetry.scout_resets > 0
+    assert engine.gate.dist2.shape == (5, 10, 10)
+    for r in range(5):
+        np.testing.assert_allclose(engine.gate.dist2[r], full_distances(engine.colony_foods[r]), atol=1e-9)
+
+
+def test_constrained_colonies():
+    rules = FeasibilityRules(wb.WELDED_BEAM_CONSTRAINTS, objective_cost=2)
+    engine = MultiColonyEngine(wb.welded_beam_cost_batch, wb.PROBLEM_SIZE, (wb.LB, wb.UB), R=4, SN=20, MCN=100,
+                               limit=50, gate=DistanceGate(), selection=FeasibilityRoulette(rules),
+                               acceptance=rules, scout=ResetMostExhausted(), seed=3)
+    best, value, history = engine.optimize()
+    assert np.all(engine.best_violation == 0)
+    np.testing.assert_array_equal([wb.check_constraints(x) for x in best], 0)
+    np.testing.assert_allclose(value, [wb.welded_beam_cost(x) for x in best])
+    # The best so far never gets worse
+    assert np.all(np.diff(history, axis=0) <= 0)
+
+
+
+def test_limit_is_per_colony():
+    reference = MultiColonyEngine(sphere_batch, 3, (-5, 5), R=4, SN=6, MCN=25, limit=4, seed=5)
+    best, value, history = reference.optimize()
+    assert reference.telemetry.scout_resets > 0
+    same = MultiColonyEngine(sphere_batch, 3, (-5, 5), R=4, SN=6, MCN=25, limit=[4, 4, 4, 4], seed=5)
+    np.testing.assert_array_equal(same.optimize()[1], value)
+
+    # A different limit for colony 1 changes that colony only
+    swept = MultiColonyEngine(sphere_batch, 3, (-5, 5), R=4, SN=6, MCN=25, limit=[4, 100, 4, 4], seed=5)
+    _, swept_value, swept_history = swept.optimize()
+    others = [0, 2, 3]
+    np.testing.assert_array_equal(swept_history[:, others], history[:, others])
+    assert swept_value[1] != value[1]
+    # Every colony reports its best source ever seen
+    np.testing.assert_array_equal(history[-1], value)
+    np.testing.assert_allclose(sphere_batch(best), value)
@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import pytest
+
+from parallel_evaluation import SharedMemoryPoolEvaluator
+from sim_mimo import ArtificialBeeColony, SIM_MIMO_System, make_sim_objective
+
+SYSTEM = SIM_MIMO_System(4, 4, 16, seed=0)
+
+
+def sphere(x):
+    return -float(np.sum(x**2))
+
+
+def test_pool_evaluates_shared_rows_and_copies():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, (37, 5))
+    with SharedMemoryPoolEvaluator(sphere, {"rows": (40, 5)}, workers=2) as pool:
+        np.testing.assert_array_equal(pool.evaluate(X, name="rows"), [sphere(x) for x in X])
+        pool.arrays["rows"][:3] = 0.0
+        np.testing.assert_array_equal(pool.evaluate_rows("rows", 3), np.zeros(3))
+
+
+@pytest.mark.parametrize("options", [{}, {"objective_factory": make_sim_objective, "factory_args": (4, 4, 16, 0)},
+                                     {"dtype": np.float32}])
+def test_workers_match_synchronous_run(options):
+    def run(**kwargs):
+        colony = ArtificialBeeColony(SYSTEM.calculate_spectral_efficiency, SYSTEM.D, (0, 2 * math.pi),
+                                     SN=10, MCN=15, limit=5, seed=3, **options, **kwargs)
+        best, value, history = colony.optimize()
+        return best, value, history, colony.telemetry.evaluations
+
+    best, value, history, evaluations = run(workers=2)
+    expected_best, expected_value, expected_history, expected_evaluations = run(synchronous=True)
+    np.testing.assert_array_equal(best, expected_best)
+    assert value == expected_value
+    np.testing.assert_array_equal(history, expected_history)
+    assert evaluations == expected_evaluations
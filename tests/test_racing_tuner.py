@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from racing_tuner import sign_test, successive_halving
+
+
+def test_sign_test_p_values():
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    # Worse on every instance (minimization): only the all-worse outcome is as extreme
+    assert sign_test(values + 1, values) == 0.5**5
+    assert sign_test(values - 1, values) == 1.0
+    # Ties are dropped: 2 worse out of 3 untied
+    assert sign_test(np.array([2.0, 3.0, 2.0, 4.0, 5.0]), values) == pytest.approx(4 / 8)
+    assert sign_test(values, values) == 1.0
+    # maximize flips the direction
+    assert sign_test(values - 1, values, maximize=True) == 0.5**5
+
+
+@pytest.mark.parametrize("instances, alpha", [(3, 0.05), (4, 0.05), (6, 0.01)])
+def test_rejects_instances_the_sign_test_cannot_decide_on(instances, alpha, tmp_path):
+    with pytest.raises(ValueError, match="cannot reject"):
+        successive_halving(instances=instances, alpha=alpha, output=str(tmp_path / "runs.jsonl"))
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from selection import distinct_partner, distinct_partners, roulette_wheel
+
+DRAWS = 200_000
+
+
+def test_roulette_wheel_frequencies():
+    p = np.array([0.1, 0.0, 0.4, 0.2, 0.3])
+    picks = roulette_wheel(p, DRAWS, np.random.default_rng(0))
+    frequencies = np.bincount(picks, minlength=len(p)) / DRAWS
+    np.testing.assert_allclose(frequencies, p, atol=0.005)
+    assert frequencies[1] == 0
+
+
+def test_roulette_wheel_rows_draw_within_each_row():
+    p = np.array([[0.1, 0.0, 0.4, 0.2, 0.3],
+                  [0.0, 0.0, 0.0, 0.0, 1.0],
+                  [2.0, 2.0, 0.0, 4.0, 2.0]])  # Rows need not be normalized
+    picks = roulette_wheel(p, DRAWS, np.random.default_rng(1))
+    assert picks.shape == (3, DRAWS) and picks.min() >= 0 and picks.max() < 5
+    for row, probabilities in zip(picks, p):
+        frequencies = np.bincount(row, minlength=5) / DRAWS
+        np.testing.assert_allclose(frequencies, probabilities / probabilities.sum(), atol=0.005)
+        assert (frequencies[probabilities == 0] == 0).all()
+
+
+@pytest.mark.parametrize("SN", [2, 7])
+def test_partners_are_distinct_and_uniform(SN):
+    rng = np.random.default_rng(2)
+    indices = np.repeat(np.arange(SN), DRAWS // SN)
+    k = distinct_partners(indices, SN, rng)
+    assert (k != indices).all() and k.min() >= 0 and k.max() < SN
+    for i in range(SN):
+        counts = np.bincount(k[indices == i], minlength=SN)
+        assert counts[i] == 0
+        np.testing.assert_allclose(np.delete(counts, i) / counts.sum(), 1 / (SN - 1), atol=0.01)
+
+    scalar = [distinct_partner(i, SN, rng) for i in range(SN) for _ in range(200)]
+    assert all(k != i for k, i in zip(scalar, np.repeat(np.arange(SN), 200)))
+    assert set(scalar) == set(range(SN))
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from sim_mimo import SIM_MIMO_System
+
+
+@pytest.mark.parametrize("layers, dtype, rtol", [(1, np.complex128, 1e-12), (3, np.complex128, 1e-12),
+                                                 (1, np.complex64, 1e-5)])
+def test_batch_capacity_matches_scalar(layers, dtype, rtol):
+    system = SIM_MIMO_System(4, 3, 16, Layers=layers, seed=0, dtype=dtype)
+    phases = np.random.default_rng(1).uniform(0, 2 * np.pi, (23, system.D))
+    expected = [system.calculate_spectral_efficiency(x) for x in phases]
+    # A chunk size that does not divide the batch covers the last partial chunk
+    np.testing.assert_allclose(system.calculate_spectral_efficiency_batch(phases, chunk_size=5), expected, rtol=rtol)
+    assert system.calculate_spectral_efficiency_batch(phases[0]).shape == (1,)
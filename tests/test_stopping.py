@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from abc_core import ABCOptimizer
+from constraints import Constraint, FeasibilityRules
+from stopping import TARGET_FITNESS, StoppingCriteria, population_diversity
+
+
+def test_population_diversity_ignores_fixed_dimensions():
+    rng = np.random.default_rng(0)
+    foods = rng.uniform(0, 1, (20, 3))
+    foods[:, 1] = 2.0
+    diversity = population_diversity(foods, [0, 2, 0], [1, 2, 1])
+    assert np.isfinite(diversity)
+    expected = np.mean([np.std(foods[:, 0]), 0.0, np.std(foods[:, 2])])
+    assert np.isclose(diversity, expected)
+
+
+def test_target_fitness_requires_a_feasible_best():
+    rules = FeasibilityRules([Constraint("x <= 0", lambda x: x[0])])
+    engine = SimpleNamespace(maximize=False, best_fitness=0.5, best_violation=3.0, acceptance=rules,
+                             telemetry=SimpleNamespace(evaluations=0))
+    stopping = StoppingCriteria(target_fitness=1.0)
+    assert stopping.check(engine) is None
+    engine.best_violation = 0.0
+    assert stopping.check(engine) == TARGET_FITNESS
+
+
+def test_target_fitness_of_an_unconstrained_run():
+    colony = ABCOptimizer(lambda x: np.sum(x**2), 3, (-5, 5), SN=10, MCN=500, seed=0,
+                          stopping=StoppingCriteria(target_fitness=1e-2))
+    _, best, _ = colony.optimize()
+    assert colony.stop_reason == TARGET_FITNESS and best <= 1e-2
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from surrogate import SurrogateScreen
+
+
+def sphere(X):
+    return -np.sum(X**2, axis=1)
+
+
+def filled_screen(model, points=90, **kwargs):
+    rng = np.random.default_rng(0)
+    screen = SurrogateScreen(3, model=model, capacity=64, refit_interval=25, min_archive=10,
+                             min_true_rate=0.3, seed=1, **kwargs)
+    X = rng.uniform(-2, 2, (points, 3))
+    screen.add(X, sphere(X))
+    return screen
+
+
+def test_screen_and_report_accounting():
+    screen = filled_screen("knn")
+    rng = np.random.default_rng(2)
+    candidates, incumbents = rng.uniform(-2, 2, (2, 200, 3))
+
+    evaluate = screen.screen(candidates, incumbents)
+    promising = screen.predict(candidates) > screen.predict(incumbents)
+    # Every promising candidate is evaluated, the others only when audited
+    assert evaluate[promising].all() and 0 < np.count_nonzero(evaluate[~promising]) < np.count_nonzero(~promising)
+    assert screen.saved == 200 - np.count_nonzero(evaluate)
+
+    values, incumbent_values = sphere(candidates[evaluate]), sphere(incumbents[evaluate])
+    improved = values > incumbent_values
+    screen.report(values, incumbent_values)
+    audited = ~promising[evaluate]
+    assert screen.screened == 200
+    assert screen.promoted == np.count_nonzero(promising)
+    assert screen.audits == np.count_nonzero(audited)
+    assert screen.false_promotions == np.count_nonzero(~audited & ~improved)
+    assert screen.false_rejections == np.count_nonzero(audited & improved)
+
+
+def test_small_archive_evaluates_everything():
+    screen = filled_screen("knn", points=5)
+    assert screen.screen(np.zeros((4, 3)), np.ones((4, 3))).all()
+    screen.report(np.zeros(4), -np.ones(4))
+    assert screen.saved == screen.audits == screen.false_promotions == 0 and screen.promoted == 4
+
+
+@pytest.mark.parametrize("model", ["knn", "rbf"])
+def test_state_and_arrays_restore_the_screen(model):
+    screen = filled_screen(model)
+    screen.predict(np.zeros((1, 3)))
+    # New points after the refit: the restored model must stay the fitted one
+    extra = np.random.default_rng(3).uniform(-2, 2, (7, 3))
+    screen.add(extra, sphere(extra))
+
+    copy = SurrogateScreen(3, model=model, capacity=64, refit_interval=25, min_archive=10,
+                           min_true_rate=0.3, seed=9)
+    copy.restore({**screen.state(), **{name: values.copy() for name, values in screen.checkpoint_arrays().items()}})
+
+    probe = np.random.default_rng(4).uniform(-2, 2, (50, 3))
+    np.testing.assert_array_equal(copy.predict(probe), screen.predict(probe))
+    np.testing.assert_array_equal(copy.screen(probe, -probe), screen.screen(probe, -probe))
+    assert copy.snapshot() == screen.snapshot()
+    assert copy.count == screen.count and copy.refits == screen.refits
+
+
+def test_changed_rows():
+    screen = filled_screen("knn")
+    count, refits = screen.count, screen.refits
+    assert all(len(rows) == 0 for rows in screen.changed_rows(count, refits).values())
+
+    screen.add(np.zeros((3, 3)), np.zeros(3))
+    rows = screen.changed_rows(count, refits)
+    np.testing.assert_array_equal(rows["X"], np.arange(count, count + 3) % 64)
+    assert len(rows["centers"]) == 0
+    screen.refit()
+    assert len(screen.changed_rows(count, refits)["centers"]) == 64
+    # More new points than the archive holds: every row changed once
+    screen.add(np.zeros((100, 3)), np.zeros(100))
+    assert sorted(screen.changed_rows(count, refits)["y"]) == list(range(64))
@@ -0,0 +1,44 @@
+import numpy as np
+
+from aeabc_engine import AEABCEngine
+from telemetry import RingBuffer, Telemetry, print_every
+
+
+def test_ring_buffer_keeps_the_newest_values_in_order():
+    buffer = RingBuffer(4)
+    for value in range(3):
+        buffer.append(value)
+    np.testing.assert_array_equal(buffer.to_array(), [0, 1, 2])
+    for value in range(3, 10):
+        buffer.append(value)
+    assert len(buffer) == 4 and buffer.count == 10
+    np.testing.assert_array_equal(buffer.to_array(), [6, 7, 8, 9])
+    # to_array() is a copy
+    buffer.to_array()[:] = -1
+    np.testing.assert_array_equal(buffer.to_array(), [6, 7, 8, 9])
+
+
+def test_engine_emits_start_cycle_and_end_events():
+    events = []
+    telemetry = Telemetry(history_capacity=5)
+    telemetry.add_listener(lambda event, t, **data: events.append((event, data)))
+    engine = AEABCEngine(lambda x: float(np.sum(x**2)), 3, (-5, 5), SN=6, MCN=8, limit=3, seed=0,
+                         telemetry=telemetry)
+    _, best, history = engine.optimize()
+
+    assert [event for event, _ in events] == ["start"] + ["cycle"] * 8 + ["end"]
+    assert [data["cycle"] for event, data in events if event == "cycle"] == list(range(8))
+    assert events[-1][1] == {"best": best, "reason": engine.stop_reason}
+    # The ring buffer holds the last history_capacity cycle bests
+    np.testing.assert_array_equal(history, [data["best"] for event, data in events if event == "cycle"][-5:])
+    snapshot = telemetry.snapshot()
+    assert snapshot["cycles"] == 8 and snapshot["evaluations"] == engine.telemetry.evaluations > 0
+    assert all(seconds >= 0 for seconds in snapshot["phase_time"].values())
+
+
+def test_print_every(capsys):
+    listener = print_every(3, "cycle {cycle}: {best:.1f}")
+    for cycle in range(7):
+        listener("cycle", None, cycle=cycle, best=float(cycle))
+    listener("end", None, best=6.0, reason="max_cycles")
+    assert capsys.readouterr().out.splitlines() == ["cycle 0: 0.0", "cycle 3: 3.0", "cycle 6: 6.0"]
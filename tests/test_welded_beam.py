@@ -0,0 +1,24 @@
+import numpy as np
+
+import demo_aeabc_welded_beam as wb
+
+
+def test_batch_evaluation_matches_scalar():
+    rng = np.random.default_rng(0)
+    X = np.vstack((rng.uniform(wb.LB, wb.UB, (300, 4)), [wb.LB, wb.UB]))
+    costs, violations, fitness = wb.evaluate_population(X)
+
+    np.testing.assert_allclose(costs, [wb.welded_beam_cost(x) for x in X], rtol=1e-12)
+    for column, g in enumerate(wb.CONSTRAINT_FUNCTIONS):
+        np.testing.assert_allclose(violations[:, column], [max(0.0, g(x)) for x in X], rtol=1e-12)
+    np.testing.assert_allclose(violations.sum(axis=1), [wb.check_constraints(x) for x in X], rtol=1e-12)
+    np.testing.assert_allclose(fitness, [wb.fitness_function(x) for x in X], rtol=1e-12)
+    np.testing.assert_array_equal(wb.fitness_function_batch(X), fitness)
+    # Both feasible and infeasible designs are covered
+    assert (violations.sum(axis=1) == 0).any() and (violations.sum(axis=1) > 0).any()
+
+
+def test_zero_dimensions_count_as_infinite_violation():
+    violations = wb.constraint_violations_batch(np.array([[0.0, 0.0, 0.0, 0.0], [0.2, 3.5, 9.0, 0.2]]))
+    assert np.isinf(violations[0]).any()
+    assert np.isfinite(violations[1]).all()